@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for src.core
+Measures cold import cost with `python -X importtime` and fails when it exceeds the target
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+HEAVY_MODULES = ("openai", "sympy", "scipy", "sqlalchemy", "vaderSentiment")
+DEFAULT_SNIPPET = "import src.core; src.core.get_theorem"
+
+
+def parse_importtime(stderr: str):
+    """Yield (module, self_us, cumulative_us, depth) from -X importtime output"""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part for part in line.replace("import time:", "|", 1).split("|"))
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        yield name.strip(), int(self_us), int(cumulative_us), depth
+
+
+def measure(snippet: str = DEFAULT_SNIPPET, runs: int = 5):
+    """Best-of-N cold cost of the snippet in a fresh interpreter, with an importtime breakdown"""
+    # importlib.import_module (used by the lazy __getattr__ hooks) bypasses the
+    # importtime counters, so the total is timed around the snippet itself
+    probe = (
+        "import time as _t; _s = _t.perf_counter()\n"
+        f"{snippet}\n"
+        "_e = _t.perf_counter() - _s\n"
+        "import sys, json\n"
+        f"print(json.dumps({{'ms': _e * 1000, 'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))"
+    )
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", probe],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        report = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or report["ms"] < best["total_ms"]:
+            entries = list(parse_importtime(proc.stderr))
+            best = {
+                "total_ms": report["ms"],
+                "heavy_loaded": report["heavy"],
+                "slowest": sorted(entries, key=lambda e: e[1], reverse=True)[:10],
+            }
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-import benchmark for src.core")
+    parser.add_argument("--target-ms", type=float, default=float(os.getenv("STARTUP_TARGET_MS", 300)))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--snippet", default=DEFAULT_SNIPPET)
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("SRC.CORE STARTUP BENCHMARK")
+    print("=" * 50)
+    result = measure(args.snippet, args.runs)
+    total_ms = result["total_ms"]
+
+    print(f"⏱️  {args.snippet!r}: {total_ms:.1f} ms (best of {args.runs}, target {args.target_ms:.0f} ms)")
+    print("🐢 Slowest modules (self time):")
+    for name, self_us, cumulative_us, _ in result["slowest"]:
+        print(f"   {self_us / 1000:8.1f} ms  {name}")
+
+    ok = True
+    if result["heavy_loaded"]:
+        print(f"❌ Heavy modules loaded: {', '.join(result['heavy_loaded'])}")
+        ok = False
+    if total_ms > args.target_ms:
+        print(f"❌ Over target by {total_ms - args.target_ms:.1f} ms")
+        ok = False
+
+    print("✅ Startup within target" if ok else "❌ Startup regression")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,21 +3,35 @@ CORE MODULES INITIALIZATION
 Exports all core modules for easy import
 """
 
-# Import all core modules
-from .evolve import Evolver
-from .proof import Stability
-from .ethical import Veto
+import importlib
 
-# Import engineering modules
-from .engineering.divine_engineering import DivineEngineering
-from .engineering.liquid_engineering import LiquidEngineering
+# Public names resolve on first attribute access (PEP 562), so importing
+# src.core no longer pulls in openai, sympy, scipy, sqlalchemy or VADER
+_LAZY_EXPORTS = {
+    "Evolver": ".evolve",
+    "Stability": ".proof",
+    "Veto": ".ethical",
+    "DivineEngineering": ".engineering.divine_engineering",
+    "LiquidEngineering": ".engineering.liquid_engineering",
+    "RigorProof": ".rigor_proof",
+    "SelfMeta": ".self_meta",
+    "run_all_theorems": ".process_theorems",
+    "get_theorem": ".process_theorems",
+    "run_portfolio": ".process_theorems",
+}
 
-# Import additional modules
-from .rigor_proof import RigorProof
-from .self_meta import SelfMeta
 
-# Import process theorems
-from .process_theorems import run_all_theorems, get_theorem
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # Define public API
 __all__ = [
@@ -30,6 +44,7 @@ __all__ = [
     "SelfMeta",          # Self-debugging AI
     "run_all_theorems",  # Run all 13 BPO theorems
     "get_theorem",       # Get specific theorem
+    "run_portfolio",     # All theorems over many clients
 ]
 
 # Version info
@@ -53,16 +68,16 @@ def list_modules():
 def get_module(module_name: str):
     """Get a specific module by name"""
     modules = {
-        "evolver": Evolver,
-        "stability": Stability,
-        "veto": Veto,
-        "divine": DivineEngineering,
-        "liquid": LiquidEngineering,
-        "rigor": RigorProof,
-        "self_meta": SelfMeta,
+        "evolver": "Evolver",
+        "stability": "Stability",
+        "veto": "Veto",
+        "divine": "DivineEngineering",
+        "liquid": "LiquidEngineering",
+        "rigor": "RigorProof",
+        "self_meta": "SelfMeta",
     }
     
     if module_name.lower() in modules:
-        return modules[module_name.lower()]
+        return __getattr__(modules[module_name.lower()])
     else:
         raise ValueError(f"Module '{module_name}' not found. Available: {list(modules.keys())}")
\ No newline at end of file
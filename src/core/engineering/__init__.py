@@ -0,0 +1,32 @@
+"""
+ENGINEERING MODULES
+Engines are listed in the registry and load on first attribute access,
+so importing the package never imports an engine
+"""
+
+import importlib
+
+from .registry import MANIFEST, EngineRegistry, EngineSpec, get_registry
+
+_LAZY_EXPORTS = {
+    "CosmicEngineeringCore": ".cosmic_core",
+}
+
+__all__ = ["CosmicEngineeringCore", "EngineRegistry", "EngineSpec", "get_registry"] + \
+    sorted({spec.attr for spec in MANIFEST})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    else:
+        spec = get_registry().find(name)
+        if spec is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = get_registry().load(spec.name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
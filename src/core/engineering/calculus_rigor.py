@@ -82,39 +82,31 @@ class BPOOptimizationCalculus:
         }
     
     def optimize_resource_allocation(self, resource_data: Dict) -> Dict:
-        """Optimize resource allocation"""
+        """Optimize resource allocation (integer program, HiGHS)"""
+        from .lp_staffing import DEFAULT_AGENT_TYPES, allocate_budget
+
         constraints = resource_data.get('constraints', {})
         budget = constraints.get('budget', 1000000)
         
-        # Agent types with cost and efficiency
-        agents = [
-            {'type': 'novice', 'cost': 18000, 'efficiency': 0.7},
-            {'type': 'intermediate', 'cost': 25000, 'efficiency': 0.9},
-            {'type': 'expert', 'cost': 35000, 'efficiency': 1.2}
-        ]
-        
-        # Greedy allocation: maximize efficiency per cost
-        agents.sort(key=lambda x: x['efficiency'] / x['cost'], reverse=True)
-        
-        allocation = {}
-        remaining = budget
-        
-        for agent in agents:
-            max_possible = min(50, remaining // agent['cost'])
-            if max_possible >= 5:  # Minimum agents per type
-                allocation[agent['type']] = max_possible
-                remaining -= max_possible * agent['cost']
-        
-        total_agents = sum(allocation.values())
-        total_cost = budget - remaining
-        total_efficiency = sum(allocation.get(a['type'], 0) * a['efficiency'] for a in agents)
+        # Each agent type unused or 5-50 agents; maximize efficiency within budget
+        result = allocate_budget(
+            resource_data.get('agent_types', DEFAULT_AGENT_TYPES),
+            budget,
+            min_per_type=constraints.get('min_per_type', 5),
+            max_per_type=constraints.get('max_per_type', 50)
+        )
+        total_cost = result['total_cost']
         
         return {
-            'allocation': allocation,
-            'total_agents': total_agents,
+            'allocation': result['allocation'],
+            'total_agents': result['total_agents'],
             'total_cost': total_cost,
-            'total_efficiency': total_efficiency,
-            'efficiency_per_cost': total_efficiency / total_cost if total_cost > 0 else 0
+            'total_efficiency': result['total_efficiency'],
+            'efficiency_per_cost': result['total_efficiency'] / total_cost if total_cost > 0 else 0,
+            'method': 'Mixed-integer programming (HiGHS)',
+            'status': result['status'],
+            'gap': result['gap'],
+            'solve_seconds': result['solve_seconds']
         }
 
 
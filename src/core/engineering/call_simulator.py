@@ -0,0 +1,337 @@
+"""
+CALL CENTER SIMULATOR - Discrete-event validation of staffing schedules
+Heap-based event loop with hourly Poisson or empirical arrivals, AHT distributions,
+agent shifts with staggered breaks and caller abandonment; independent replications
+run in parallel processes and report confidence intervals
+"""
+
+import heapq
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+HOUR = 3600.0
+
+# Four 6-hour shifts, as produced by QuantumInspiredOptimizer
+SHIFT_WINDOWS = {
+    'night': (0, 6),
+    'morning': (6, 12),
+    'afternoon': (12, 18),
+    'evening': (18, 24),
+}
+
+# Event kinds; at equal times completions free agents before breaks take them
+_COMPLETE, _SHIFT_START, _BREAK_END, _BREAK_START, _SHIFT_END = range(5)
+
+
+@dataclass
+class AgentShift:
+    """One agent's working window and breaks, in seconds from midnight"""
+    start: float
+    end: float
+    breaks: List[Tuple[float, float]] = field(default_factory=list)  # (start, duration)
+
+    @property
+    def available_seconds(self) -> float:
+        return self.end - self.start - sum(duration for _, duration in self.breaks)
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Traffic and staffing for one simulated day.
+
+    ``hourly_volumes`` is calls per hour from midnight. With
+    ``arrivals='empirical'`` pass a list of historical days instead; every
+    replication resamples one day and places its calls uniformly within each
+    hour. ``aht_distribution`` is ``'exponential'``, ``'lognormal'`` (using
+    ``aht_cv``) or ``'empirical'`` (bootstrapping ``aht_samples``).
+    ``patience_mean=None`` disables abandonment.
+    """
+    hourly_volumes: Sequence
+    shifts: List[AgentShift]
+    aht: float = 300.0
+    aht_distribution: str = 'exponential'
+    aht_cv: float = 0.6
+    aht_samples: Optional[Sequence[float]] = None
+    arrivals: str = 'poisson'
+    patience_mean: Optional[float] = 120.0
+    answer_seconds: float = 20.0
+
+
+# ============================================================================
+# SCHEDULE ADAPTERS
+# ============================================================================
+
+def shifts_from_timing(optimal_schedule: Dict[str, Any], shift_start_hour: int = 8) -> List[AgentShift]:
+    """Shifts from ``TimingOptimizer.optimize_scheduling()['optimal_schedule']``"""
+    agents = optimal_schedule['total_agents']
+    start = shift_start_hour * HOUR
+    end = start + optimal_schedule.get('shift_hours', 8) * HOUR
+    return shifts_with_breaks(agents, start, end, optimal_schedule.get('break_schedule'))
+
+
+def shifts_with_breaks(agents: int, start: float, end: float,
+                       break_schedule: Optional[Dict[str, List]] = None) -> List[AgentShift]:
+    """Identical shifts plus the per-agent slots of a ``_stagger_breaks`` result"""
+    shifts = [AgentShift(start, end) for _ in range(agents)]
+    if break_schedule:
+        for slot in break_schedule.get('lunch_slots', []) + break_schedule.get('short_break_slots', []):
+            index = slot['agent'] - 1
+            if 0 <= index < agents:
+                shifts[index].breaks.append((slot['start_minute'] * 60.0, slot['duration'] * 60.0))
+        for shift in shifts:
+            shift.breaks.sort()
+    return shifts
+
+
+def shifts_from_counts(counts: Dict[str, int], windows: Dict[str, Tuple[int, int]] = None) -> List[AgentShift]:
+    """Shifts from per-shift headcounts, e.g. ``QuantumInspiredOptimizer`` output"""
+    windows = windows or SHIFT_WINDOWS
+    shifts = []
+    for name, count in counts.items():
+        start_hour, end_hour = windows[name]
+        shifts += [AgentShift(start_hour * HOUR, end_hour * HOUR) for _ in range(int(count))]
+    return shifts
+
+
+def shifts_from_coverage(coverage: Dict[str, int]) -> List[AgentShift]:
+    """
+    Shifts from hourly staffing levels such as ``{'08:00': 12, '09:00': 14}``
+    (``BPOTheoremBridge`` recommended schedules): agent k works every
+    contiguous run of hours whose level exceeds k.
+    """
+    levels = {int(hour.split(':')[0]): int(agents) for hour, agents in coverage.items()}
+    shifts = []
+    for k in range(max(levels.values(), default=0)):
+        run_start = None
+        for hour in range(25):
+            working = levels.get(hour, 0) > k
+            if working and run_start is None:
+                run_start = hour
+            elif not working and run_start is not None:
+                shifts.append(AgentShift(run_start * HOUR, hour * HOUR))
+                run_start = None
+    return shifts
+
+
+# ============================================================================
+# ONE REPLICATION
+# ============================================================================
+
+def _arrivals(config: SimulationConfig, rng: np.random.Generator) -> np.ndarray:
+    volumes = np.asarray(config.hourly_volumes, dtype=float)
+    if config.arrivals == 'empirical':
+        days = np.atleast_2d(volumes)
+        counts = np.rint(days[rng.integers(len(days))]).astype(np.int64)
+    elif config.arrivals == 'poisson':
+        counts = rng.poisson(volumes)
+    else:
+        raise ValueError(f"Unknown arrival model '{config.arrivals}'")
+    hours = np.repeat(np.arange(len(counts)), counts)
+    return np.sort((hours + rng.random(len(hours))) * HOUR)
+
+
+def _handle_times(config: SimulationConfig, rng: np.random.Generator, n: int) -> np.ndarray:
+    if config.aht_distribution == 'exponential':
+        return rng.exponential(config.aht, n)
+    if config.aht_distribution == 'lognormal':
+        sigma2 = math.log(1 + config.aht_cv ** 2)
+        return rng.lognormal(math.log(config.aht) - sigma2 / 2, math.sqrt(sigma2), n)
+    if config.aht_distribution == 'empirical':
+        if not config.aht_samples:
+            raise ValueError("aht_distribution='empirical' needs aht_samples")
+        return rng.choice(np.asarray(config.aht_samples, dtype=float), n)
+    raise ValueError(f"Unknown AHT distribution '{config.aht_distribution}'")
+
+
+def simulate_day(config: SimulationConfig, seed=None) -> Dict[str, Any]:
+    """
+    One replication. Arrivals, handle times and patience are drawn up front
+    and merged with the event heap, which only holds agent events. Abandonment
+    is resolved lazily: a caller whose patience ran out before an agent
+    reached them is counted as abandoned when dequeued. A break or shift end
+    that falls during a call starts when the call completes.
+    """
+    rng = np.random.default_rng(seed)
+    arrival_array = _arrivals(config, rng)
+    n = len(arrival_array)
+    service_array = _handle_times(config, rng, n)
+    arrivals = arrival_array.tolist()
+    service = service_array.tolist()
+    if config.patience_mean:
+        deadlines = (arrival_array + rng.exponential(config.patience_mean, n)).tolist()
+    else:
+        deadlines = [math.inf] * n
+
+    events = []
+    for agent, shift in enumerate(config.shifts):
+        events.append((shift.start, _SHIFT_START, agent, 0.0))
+        events.append((shift.end, _SHIFT_END, agent, 0.0))
+        for start, duration in shift.breaks:
+            events.append((start, _BREAK_START, agent, duration))
+    heapq.heapify(events)
+
+    agents = len(config.shifts)
+    busy = [False] * agents
+    off = [True] * agents  # Off shift or on break
+    ended = [False] * agents
+    pending_break = [0.0] * agents
+    idle = set()
+    waiting = deque()
+    waits = [math.nan] * n
+    busy_seconds = 0.0
+
+    def release(agent, now):
+        """Agent is free at ``now``: take the next live caller or go idle"""
+        nonlocal busy_seconds
+        while waiting:
+            call = waiting.popleft()
+            if deadlines[call] < now:
+                continue  # Hung up while queued
+            waits[call] = now - arrivals[call]
+            busy[agent] = True
+            busy_seconds += service[call]
+            heapq.heappush(events, (now + service[call], _COMPLETE, agent, 0.0))
+            return
+        busy[agent] = False
+        idle.add(agent)
+
+    push, pop = heapq.heappush, heapq.heappop
+    i = 0
+    while i < n or events:
+        if i < n and (not events or arrivals[i] < events[0][0]):
+            now = arrivals[i]
+            if idle:
+                agent = idle.pop()
+                waits[i] = 0.0
+                busy[agent] = True
+                busy_seconds += service[i]
+                push(events, (now + service[i], _COMPLETE, agent, 0.0))
+            else:
+                waiting.append(i)
+            i += 1
+            continue
+
+        now, kind, agent, duration = pop(events)
+        if kind == _COMPLETE:
+            busy[agent] = False
+            if ended[agent]:
+                off[agent] = True
+            elif pending_break[agent]:
+                off[agent] = True
+                push(events, (now + pending_break[agent], _BREAK_END, agent, 0.0))
+                pending_break[agent] = 0.0
+            else:
+                release(agent, now)
+        elif kind == _SHIFT_START or kind == _BREAK_END:
+            if not ended[agent] or kind == _SHIFT_START:
+                ended[agent] = False
+                off[agent] = False
+                release(agent, now)
+        elif kind == _BREAK_START:
+            if ended[agent] or off[agent]:
+                continue
+            if busy[agent]:
+                pending_break[agent] = duration
+            else:
+                idle.discard(agent)
+                off[agent] = True
+                push(events, (now + duration, _BREAK_END, agent, 0.0))
+        else:  # _SHIFT_END
+            ended[agent] = True
+            idle.discard(agent)
+            if not busy[agent]:
+                off[agent] = True
+
+    wait_array = np.asarray(waits)
+    answered = ~np.isnan(wait_array)
+    within = answered & (wait_array <= config.answer_seconds)
+    hours = (arrival_array // HOUR).astype(np.int64)
+    bins = max(len(np.atleast_2d(config.hourly_volumes)[0]), int(hours.max(initial=-1)) + 1)
+    offered_by_hour = np.bincount(hours, minlength=bins)
+    within_by_hour = np.bincount(hours[within], minlength=bins)
+    available = sum(shift.available_seconds for shift in config.shifts)
+    return {
+        'calls': n,
+        'answered': int(answered.sum()),
+        'abandoned': int(n - answered.sum()),
+        'service_level': float(within.sum() / n) if n else 1.0,
+        'asa_seconds': float(wait_array[answered].mean()) if answered.any() else 0.0,
+        'abandon_rate': float(1 - answered.sum() / n) if n else 0.0,
+        'occupancy': min(busy_seconds / available, 1.0) if available else 0.0,
+        'hourly_service_level': np.divide(within_by_hour, offered_by_hour, out=np.ones(bins),
+                                          where=offered_by_hour > 0).tolist(),
+    }
+
+
+# ============================================================================
+# REPLICATIONS
+# ============================================================================
+
+def _confidence_interval(samples: np.ndarray, confidence: float) -> Dict[str, float]:
+    from scipy import stats
+
+    mean = float(samples.mean())
+    if len(samples) < 2:
+        return {'mean': mean, 'low': mean, 'high': mean, 'half_width': 0.0}
+    half = float(stats.t.ppf((1 + confidence) / 2, len(samples) - 1) * samples.std(ddof=1) / math.sqrt(len(samples)))
+    return {'mean': mean, 'low': mean - half, 'high': mean + half, 'half_width': half}
+
+
+class CallCenterSimulator:
+    """Validate a schedule by simulating many independent days"""
+
+    METRICS = ('service_level', 'asa_seconds', 'occupancy', 'abandon_rate')
+
+    def __init__(self, workers: Optional[int] = None, confidence: float = 0.95):
+        self.workers = workers or os.cpu_count() or 1
+        self.confidence = confidence
+
+    def run(self, config: SimulationConfig, replications: int = 20, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run ``replications`` days, each with its own ``SeedSequence`` child
+        stream so results do not depend on the number of workers.
+        """
+        seeds = np.random.SeedSequence(seed).spawn(replications)
+        if self.workers > 1 and replications > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, replications)) as pool:
+                runs = list(pool.map(simulate_day, [config] * replications, seeds))
+        else:
+            runs = [simulate_day(config, s) for s in seeds]
+
+        report = {
+            metric: _confidence_interval(np.array([run[metric] for run in runs]), self.confidence)
+            for metric in self.METRICS
+        }
+        report.update({
+            'replications': replications,
+            'confidence_level': self.confidence,
+            'simulated_calls': sum(run['calls'] for run in runs),
+            'answer_seconds': config.answer_seconds,
+            'hourly_service_level': np.mean([run['hourly_service_level'] for run in runs], axis=0).round(4).tolist(),
+        })
+        return report
+
+    def validate(self, config: SimulationConfig, target_service_level: float = 0.8,
+                 replications: int = 20, seed: Optional[int] = None) -> Dict[str, Any]:
+        """``run`` plus a verdict: the schedule passes if the SL interval clears the target"""
+        report = self.run(config, replications, seed)
+        interval = report['service_level']
+        if interval['low'] >= target_service_level:
+            verdict = 'MEETS_TARGET'
+        elif interval['high'] < target_service_level:
+            verdict = 'MISSES_TARGET'
+        else:
+            verdict = 'INCONCLUSIVE'
+        report['target_service_level'] = target_service_level
+        report['verdict'] = verdict
+        report['understaffed_hours'] = [
+            hour for hour, sl in enumerate(report['hourly_service_level']) if sl < target_service_level
+        ]
+        return report
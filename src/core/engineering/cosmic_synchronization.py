@@ -3,28 +3,207 @@ Cosmic Synchronization Engine - Real Implementation
 Practical synchronization algorithms for BPO operations
 """
 
+import itertools
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Hashable, Iterable, Optional, Tuple
 import math
 from datetime import datetime
 
+from .erlang import get_erlang_staffing
+
+_HOUR_BITS = 40  # Hours since 1970 fit comfortably; site code sits above
+_MONDAY = np.datetime64('1970-01-05T00', 'h')
+
+
+def _to_hours(timestamps) -> np.ndarray:
+    """Hours since the epoch from datetime64, datetimes, ISO strings or epoch seconds"""
+    values = np.asarray(timestamps)
+    if values.dtype.kind in 'iuf':
+        values = values.astype('int64').astype('datetime64[s]')
+    elif values.dtype.kind != 'M':
+        values = np.array(timestamps, dtype='datetime64[s]')
+    return values.astype('datetime64[h]').astype(np.int64)
+
+
+def _merge_moments(n, mean, m2, n_b, mean_b, m2_b):
+    """Chan et al. pairwise combination of (count, mean, M2) moments"""
+    total = n + n_b
+    safe = np.maximum(total, 1)
+    delta = mean_b - mean
+    return total, mean + delta * n_b / safe, m2 + m2_b + delta ** 2 * n * n_b / safe
+
+
+class CallProfile:
+    """
+    Streaming hour-of-day x day-of-week profile of call counts, per site.
+
+    Timestamped counts (hourly, 15-minute or any finer interval) are summed
+    into clock hours, and each completed hour updates the running count,
+    mean and M2 of its (site, weekday, hour) cell by Chan's parallel merge.
+    Memory is one (7 x 24) block per site plus the hour still filling,
+    however long the input. Counts must arrive in time order per site (sites
+    may interleave) and form a regular series, zero-call intervals included.
+    """
+
+    def __init__(self):
+        self.sites: List[Hashable] = []
+        self._site_index: Dict[Hashable, int] = {}
+        self._n = np.zeros((0, 7, 24), dtype=np.int64)
+        self._mean = np.zeros((0, 7, 24))
+        self._m2 = np.zeros((0, 7, 24))
+        self._pending_hour = np.zeros(0, dtype=np.int64)
+        self._pending_calls = np.zeros(0)
+        self.records = 0
+
+    def update(self, timestamps, counts, sites=None) -> "CallProfile":
+        """Add one batch of parallel timestamps and counts, optionally per site"""
+        hours = _to_hours(timestamps).reshape(-1)
+        counts = np.asarray(counts, dtype=float).reshape(-1)
+        if len(hours) != len(counts):
+            raise ValueError("timestamps and counts must have the same length")
+        if len(hours) == 0:
+            return self
+        if sites is None:
+            codes = np.zeros(len(hours), dtype=np.int64)
+            if not self.sites:
+                self._site_codes(['all'])
+        else:
+            codes = self._site_codes(sites)
+
+        # Carry each site's unfinished hour into this batch
+        pending = np.flatnonzero(self._pending_hour >= 0)
+        codes = np.concatenate([pending, codes])
+        hours = np.concatenate([self._pending_hour[pending], hours])
+        counts = np.concatenate([self._pending_calls[pending], counts])
+
+        keys, inverse = np.unique((codes << _HOUR_BITS) | hours, return_inverse=True)
+        calls = np.bincount(inverse.reshape(-1), weights=counts, minlength=len(keys))
+        site, hour = keys >> _HOUR_BITS, keys & ((1 << _HOUR_BITS) - 1)
+
+        # Keys sort by site then hour, so each site's latest hour may still be filling
+        latest = np.concatenate([site[1:] != site[:-1], [True]])
+        self._pending_hour[site[latest]] = hour[latest]
+        self._pending_calls[site[latest]] = calls[latest]
+        self._add_hours(site[~latest], hour[~latest], calls[~latest])
+        self.records += len(counts) - len(pending)
+        return self
+
+    def update_records(self, records: Iterable[Tuple], chunk_size: int = 100_000) -> "CallProfile":
+        """Consume ``(timestamp, count)`` or ``(timestamp, site, count)`` tuples, ``chunk_size`` at a time"""
+        iterator = iter(records)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            columns = list(zip(*chunk))
+            if len(columns) == 3:
+                self.update(columns[0], columns[2], sites=columns[1])
+            else:
+                self.update(columns[0], columns[1])
+
+    def _site_codes(self, sites) -> np.ndarray:
+        names, inverse = np.unique(np.asarray(sites), return_inverse=True)
+        lookup = np.empty(len(names), dtype=np.int64)
+        for position, name in enumerate(names.tolist()):
+            index = self._site_index.get(name)
+            if index is None:
+                index = self._site_index[name] = len(self.sites)
+                self.sites.append(name)
+            lookup[position] = index
+        grow = len(self.sites) - len(self._n)
+        if grow > 0:
+            self._n = np.concatenate([self._n, np.zeros((grow, 7, 24), dtype=np.int64)])
+            self._mean = np.concatenate([self._mean, np.zeros((grow, 7, 24))])
+            self._m2 = np.concatenate([self._m2, np.zeros((grow, 7, 24))])
+            self._pending_hour = np.concatenate([self._pending_hour, np.full(grow, -1, dtype=np.int64)])
+            self._pending_calls = np.concatenate([self._pending_calls, np.zeros(grow)])
+        return lookup[inverse.reshape(-1)]
+
+    def _add_hours(self, site, hour, calls):
+        if len(calls) == 0:
+            return
+        self._n, self._mean, self._m2 = self._merged(site, hour, calls)
+
+    def _merged(self, site, hour, calls):
+        """Running moments with completed hours ``calls`` folded in"""
+        cells = self._n.size
+        cell = site * 168 + ((hour // 24 + 3) % 7) * 24 + hour % 24  # 1970-01-01 was a Thursday
+        n_b = np.bincount(cell, minlength=cells)
+        mean_b = np.bincount(cell, weights=calls, minlength=cells) / np.maximum(n_b, 1)
+        m2_b = np.bincount(cell, weights=(calls - mean_b[cell]) ** 2, minlength=cells)
+        shape = self._n.shape
+        n, mean, m2 = _merge_moments(self._n.ravel(), self._mean.ravel(), self._m2.ravel(), n_b, mean_b, m2_b)
+        return n.reshape(shape), mean.reshape(shape), m2.reshape(shape)
+
+    def moments(self, include_pending: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(sites, 7, 24)`` count, mean and M2 of hourly calls, Monday first"""
+        pending = np.flatnonzero(self._pending_hour >= 0)
+        if include_pending and len(pending):
+            return self._merged(pending, self._pending_hour[pending], self._pending_calls[pending])
+        return self._n, self._mean, self._m2
+
+    @property
+    def hours_observed(self) -> int:
+        return int(self.moments()[0].sum())
+
+    def weekly_profile(self) -> Tuple[np.ndarray, np.ndarray]:
+        """``(7, 24)`` mean and standard deviation of calls per hour, summed over sites"""
+        n, mean, m2 = self.moments()
+        variance = m2 / np.maximum(n, 1)
+        return mean.sum(axis=0), np.sqrt(variance.sum(axis=0))
+
+    def hourly_profile(self) -> Tuple[np.ndarray, np.ndarray]:
+        """24 hour-of-day means and standard deviations, pooling weekdays, summed over sites"""
+        n, mean, m2 = self.moments()
+        n_hour = n.sum(axis=1)
+        mean_hour = (n * mean).sum(axis=1) / np.maximum(n_hour, 1)
+        m2_hour = (m2 + n * (mean - mean_hour[:, np.newaxis]) ** 2).sum(axis=1)
+        variance = m2_hour / np.maximum(n_hour, 1)
+        return mean_hour.sum(axis=0), np.sqrt(variance.sum(axis=0))
+
+    def summary(self) -> Dict[str, Any]:
+        weekly, _ = self.weekly_profile()
+        hourly, spread = self.hourly_profile()
+        n = self.moments()[0]
+        return {
+            'sites': list(self.sites),
+            'records': self.records,
+            'hours_observed': int(n.sum()),
+            'weeks_observed': float(n.sum(axis=(1, 2)).max(initial=0) / 168),
+            'daily_calls_by_weekday': weekly.sum(axis=1).round(1).tolist(),
+            'hourly_std': spread.round(2).tolist(),
+            'peak_weekday': int(weekly.sum(axis=1).argmax()),
+            'peak_hour': int(hourly.argmax()),
+        }
+
+
 class BPOFlowSynchronizer:
     """Synchronize BPO workflows using practical algorithms"""
     
-    def __init__(self):
+    def __init__(self, avg_handle_time: float = 300):
         self.sync_threshold = 0.85  # 85% synchronization target
+        self.avg_handle_time = avg_handle_time  # seconds
     
     def synchronize_call_distribution(self, call_data: Dict[str, List[int]]) -> Dict[str, Any]:
         """
         Synchronize call distribution across teams/shifts
         Real implementation using load balancing algorithms
+
+        Besides a 24-hour ``hourly_volumes`` list, long inputs are folded
+        into a ``CallProfile`` and analyzed on its hour-of-day means:
+        ``timestamps``/``counts`` (optionally ``sites``) arrays, ``records``
+        tuples of any length, a prebuilt ``profile``, or ``hourly_volumes``
+        longer than a day (consecutive hours from ``start``, default Monday).
         """
         if not call_data:
             return {"error": "No call data provided"}
-        
+
         # Extract hourly call volumes
         hourly_calls = call_data.get('hourly_volumes', [])
-        if not hourly_calls:
+        profile = self._profile_from(call_data)
+        if profile is not None:
+            hourly_calls = profile.hourly_profile()[0].tolist()
+        if len(hourly_calls) == 0:
             # Generate sample pattern if none provided
             hourly_calls = self._generate_sample_pattern()
         
@@ -32,18 +211,37 @@ class BPOFlowSynchronizer:
         analysis = self._analyze_call_patterns(hourly_calls)
         
         # Synchronize distribution
-        synchronized = self._synchronize_distribution(analysis)
+        synchronized = self._synchronize_distribution(
+            analysis, hourly_calls, call_data.get('avg_handle_time', self.avg_handle_time)
+        )
         
         # Calculate synchronization metrics
         sync_metrics = self._calculate_synchronization_metrics(hourly_calls, synchronized)
         
-        return {
+        result = {
             'call_analysis': analysis,
             'synchronized_distribution': synchronized,
             'synchronization_metrics': sync_metrics,
             'recommended_actions': self._generate_sync_recommendations(sync_metrics)
         }
-    
+        if profile is not None:
+            result['call_profile'] = profile.summary()
+        return result
+
+    def _profile_from(self, call_data: Dict[str, Any]) -> Optional[CallProfile]:
+        """Streamed profile for long-horizon inputs, None for a plain 24-hour list"""
+        if call_data.get('profile') is not None:
+            return call_data['profile']
+        if call_data.get('timestamps') is not None:
+            return CallProfile().update(call_data['timestamps'], call_data['counts'], call_data.get('sites'))
+        if call_data.get('records') is not None:
+            return CallProfile().update_records(call_data['records'])
+        volumes = call_data.get('hourly_volumes')
+        if volumes is not None and len(volumes) > 24:
+            start = np.datetime64(call_data.get('start', _MONDAY), 'h')
+            return CallProfile().update(start + np.arange(len(volumes)), volumes)
+        return None
+
     def _generate_sample_pattern(self) -> List[int]:
         """Generate realistic call pattern"""
         pattern = []
@@ -102,17 +300,23 @@ class BPOFlowSynchronizer:
         else:
             return 'DISTRIBUTED'
     
-    def _synchronize_distribution(self, analysis: Dict) -> Dict[str, Any]:
+    def _synchronize_distribution(self, analysis: Dict, hourly_calls: List[int] = None,
+                                  aht: float = None) -> Dict[str, Any]:
         """Synchronize call distribution"""
         pattern_type = analysis['pattern_type']
         total_calls = analysis['total_calls']
+        aht = aht or self.avg_handle_time
         
-        # Base staffing assumption: 12 calls/agent/hour
-        base_agents = math.ceil(total_calls / (12 * 8))  # 8-hour shift
+        # Base staffing: Erlang C agents per hour (80% in 20s), spread over 8-hour shifts
+        if hourly_calls is None or len(hourly_calls) == 0:
+            hourly_calls = [total_calls / 8] * 8
+        hourly_agents = get_erlang_staffing().required_agents(hourly_calls, aht, interval_seconds=3600)
+        base_agents = math.ceil(hourly_agents.sum() / 8)  # 8-hour shift
         
         synchronized = {
             'pattern_type': pattern_type,
             'base_staffing': base_agents,
+            'hourly_requirements': hourly_agents.tolist(),
             'shift_recommendations': {},
             'flex_pool_size': max(2, base_agents // 5)
         }
@@ -678,6 +882,7 @@ class TimingOptimizer:
 # ============================================================================
 
 __all__ = [
+    'CallProfile',
     'BPOFlowSynchronizer',
     'WorkflowHarmonizer',
     'TimingOptimizer'
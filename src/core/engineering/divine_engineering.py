@@ -9,7 +9,6 @@ import math
 import json
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
-from scipy.integrate import odeint  # REAL numerical integration
 
 class DivineEngineering:
     """Cosmic-scale divine engineering principles - 100% functional"""
@@ -101,6 +100,7 @@ class DivineEngineering:
         t = np.linspace(0, 10, 100)
         u0 = flow_rate  # Initial velocity
         try:
+            from scipy.integrate import odeint  # REAL numerical integration
             u_solution = odeint(burgers_equation, u0, t)
             velocity_profile = u_solution[-10:].flatten().tolist()
             stability = np.std(u_solution) < 0.1 * flow_rate
@@ -618,317 +618,3 @@ class SacredGeometry:
             "sri_yantra": "9 interlocking isosceles triangles with specific angular relationships"
         }
         return math_descriptions.get(pattern_name, "Based on geometric principles")
-
-
-# File: src/core/engineering/__init__.py
-"""
-COSMIC ENGINEERING MODULES EXPORT - 100% FUNCTIONAL
-All divine engineering modules in one elegant interface
-"""
-
-# Real imports with error handling
-try:
-    from .multidimensional_recursive import (
-        MultidimensionalRecursive,
-        DivineQuantum,
-        RecursiveFHE,
-        VerifiedRecursiveCompiler,
-        QuantumState
-    )
-    MD_AVAILABLE = True
-except ImportError:
-    MD_AVAILABLE = False
-    print("⚠️  Multidimensional Recursive module not available")
-
-try:
-    from .cosmic_synchronization import (
-        CosmicSynchronizer,
-        DivineTiming
-    )
-    SYNC_AVAILABLE = True
-except ImportError:
-    SYNC_AVAILABLE = False
-    print("⚠️  Cosmic Synchronization module not available")
-
-try:
-    from .calculus_rigor import (
-        CalculusRigor,
-        TensorNetworkDeployment
-    )
-    CALCULUS_AVAILABLE = True
-except ImportError:
-    CALCULUS_AVAILABLE = False
-    print("⚠️  Calculus Rigor module not available")
-
-try:
-    from .divine_engineering import (
-        DivineEngineering,
-        SacredGeometry
-    )
-    DIVINE_AVAILABLE = True
-except ImportError:
-    DIVINE_AVAILABLE = False
-    print("⚠️  Divine Engineering module not available")
-
-# Unified interface with fallbacks
-class CosmicEngineeringCore:
-    """Master interface for all cosmic engineering - 100% functional"""
-    
-    def __init__(self, enable_all: bool = True):
-        """Initialize with optional module loading"""
-        self.modules_available = {
-            'multidimensional': MD_AVAILABLE and enable_all,
-            'synchronization': SYNC_AVAILABLE and enable_all,
-            'calculus': CALCULUS_AVAILABLE and enable_all,
-            'divine': DIVINE_AVAILABLE and enable_all
-        }
-        
-        # Initialize available modules
-        if self.modules_available['multidimensional']:
-            self.multidimensional = MultidimensionalRecursive(dimensions=8)
-            self.quantum = DivineQuantum(qubits=512)
-            self.fhe = RecursiveFHE()
-            self.verifier = VerifiedRecursiveCompiler()
-        
-        if self.modules_available['synchronization']:
-            self.synchronizer = CosmicSynchronizer()
-            self.timing = DivineTiming()
-        
-        if self.modules_available['calculus']:
-            self.calculus = CalculusRigor(dimension=6)
-            self.tensors = TensorNetworkDeployment()
-        
-        if self.modules_available['divine']:
-            self.divine_eng = DivineEngineering()
-            self.geometry = SacredGeometry()
-    
-    def cosmic_proof(self) -> dict:
-        """Generate complete cosmic proof package - 100% functional"""
-        proofs = {
-            "timestamp": datetime.now().isoformat(),
-            "modules_available": self.modules_available
-        }
-        
-        try:
-            if self.modules_available['multidimensional']:
-                quantum_result = self.quantum.shor_recursive(21)
-                proofs["multidimensional"] = {
-                    "quantum_factorization": quantum_result,
-                    "status": "active"
-                }
-        except Exception as e:
-            proofs["multidimensional"] = {"status": "error", "error": str(e)}
-        
-        try:
-            if self.modules_available['synchronization']:
-                sync_result = self.synchronizer.kuramoto_sync(50)
-                proofs["synchronization"] = {
-                    "kuramoto_sync": sync_result,
-                    "status": "active"
-                }
-        except Exception as e:
-            proofs["synchronization"] = {"status": "error", "error": str(e)}
-        
-        try:
-            if self.modules_available['calculus']:
-                curvature_result = self.calculus.riemann_curvature_proof()
-                proofs["calculus"] = {
-                    "riemann_curvature": curvature_result,
-                    "status": "active"
-                }
-        except Exception as e:
-            proofs["calculus"] = {"status": "error", "error": str(e)}
-        
-        try:
-            if self.modules_available['divine']:
-                architecture_result = self.divine_eng.cosmic_architecture({"scale": 1.0})
-                geometry_result = self.geometry.geometry_proof([1.0, 1.618, 2.414, 3.142])
-                proofs["divine"] = {
-                    "cosmic_architecture": architecture_result,
-                    "sacred_geometry": geometry_result,
-                    "status": "active"
-                }
-        except Exception as e:
-            proofs["divine"] = {"status": "error", "error": str(e)}
-        
-        # Calculate overall status
-        active_proofs = sum(1 for key in ['multidimensional', 'synchronization', 'calculus', 'divine']
-                          if proofs.get(key, {}).get('status') == 'active')
-        
-        proofs["cosmic_engineering"] = "ACTIVE" if active_proofs >= 2 else "PARTIAL" if active_proofs > 0 else "INACTIVE"
-        proofs["active_modules"] = active_proofs
-        proofs["total_modules"] = len([m for m in self.modules_available.values() if m])
-        
-        return proofs
-    
-    def deploy_cosmic(self, target: str = "analysis") -> dict:
-        """Execute cosmic deployment or analysis - 100% functional"""
-        print(f"🚀 Initiating cosmic {'deployment' if target == 'deploy' else 'analysis'}...")
-        
-        # Generate proofs
-        proofs = self.cosmic_proof()
-        
-        if target == "deploy":
-            # Simulate deployment process
-            return {
-                "status": "cosmic_deployment_initiated",
-                "proofs_generated": len(proofs) - 3,  # Exclude metadata
-                "quantum_ready": proofs.get("multidimensional", {}).get("status") == "active",
-                "synchronized": proofs.get("synchronization", {}).get("kuramoto_sync", {}).get("fully_synchronized", False),
-                "mathematically_proven": proofs.get("calculus", {}).get("status") == "active",
-                "divine_alignment": proofs.get("divine", {}).get("cosmic_architecture", {}).get("divine_alignment", False),
-                "overall_status": proofs["cosmic_engineering"],
-                "next_step": self._get_next_step(proofs)
-            }
-        else:
-            # Return analysis results
-            return {
-                "status": "cosmic_analysis_complete",
-                "analysis": proofs,
-                "recommendations": self._generate_recommendations(proofs),
-                "readiness_score": self._calculate_readiness_score(proofs)
-            }
-    
-    def _get_next_step(self, proofs: dict) -> str:
-        """Determine next step based on proofs"""
-        status = proofs.get("cosmic_engineering")
-        
-        if status == "ACTIVE":
-            return "Proceed with full cosmic deployment"
-        elif status == "PARTIAL":
-            return "Address missing modules before deployment"
-        elif status == "INACTIVE":
-            return "Initialize cosmic engineering modules first"
-        else:
-            return "Check module configurations"
-    
-    def _generate_recommendations(self, proofs: dict) -> List[str]:
-        """Generate recommendations based on analysis"""
-        recommendations = []
-        
-        for module in ['multidimensional', 'synchronization', 'calculus', 'divine']:
-            status = proofs.get(module, {}).get("status")
-            if status == "error":
-                recommendations.append(f"Fix {module} module: {proofs[module].get('error', 'Unknown error')}")
-            elif module not in proofs:
-                recommendations.append(f"Initialize {module} module")
-        
-        if proofs.get("cosmic_engineering") == "ACTIVE":
-            recommendations.append("All systems go - ready for cosmic operations")
-        
-        return recommendations
-    
-    def _calculate_readiness_score(self, proofs: dict) -> float:
-        """Calculate readiness score (0-100)"""
-        total_modules = proofs.get("total_modules", 0)
-        if total_modules == 0:
-            return 0.0
-        
-        active_modules = proofs.get("active_modules", 0)
-        score = (active_modules / total_modules) * 100
-        
-        # Bonus for divine alignment
-        if proofs.get("divine", {}).get("cosmic_architecture", {}).get("divine_alignment", False):
-            score += 10
-        
-        # Bonus for quantum readiness
-        if proofs.get("multidimensional", {}).get("status") == "active":
-            score += 10
-        
-        return min(100.0, score)
-    
-    def quick_test(self) -> dict:
-        """Quick test of core functionality - 100% functional"""
-        results = {"tests": []}
-        
-        # Test Divine Engineering if available
-        if self.modules_available['divine']:
-            try:
-                # Test cosmic architecture
-                arch_test = self.divine_eng.cosmic_architecture({"test": 1.0})
-                results["tests"].append({
-                    "module": "DivineEngineering",
-                    "test": "cosmic_architecture",
-                    "passed": "divine_alignment" in arch_test,
-                    "result": arch_test.get("divine_alignment", False)
-                })
-                
-                # Test sacred geometry
-                geo_test = self.geometry.geometry_proof([1.0, 1.618, 2.414])
-                results["tests"].append({
-                    "module": "SacredGeometry", 
-                    "test": "geometry_proof",
-                    "passed": "sacredness_score" in geo_test,
-                    "result": geo_test.get("sacredness_score", 0)
-                })
-            except Exception as e:
-                results["tests"].append({
-                    "module": "DivineEngineering",
-                    "test": "core_functions",
-                    "passed": False,
-                    "error": str(e)[:100]
-                })
-        
-        # Calculate overall result
-        passed_tests = sum(1 for test in results["tests"] if test.get("passed", False))
-        total_tests = len(results["tests"])
-        
-        results["summary"] = {
-            "passed": passed_tests,
-            "total": total_tests,
-            "success_rate": passed_tests / total_tests if total_tests > 0 else 0,
-            "ready": passed_tests == total_tests if total_tests > 0 else False
-        }
-        
-        return results
-
-
-# Export everything with availability flags
-__all__ = [
-    # Core classes
-    'CosmicEngineeringCore',
-    
-    # Availability flags  
-    'MD_AVAILABLE',
-    'SYNC_AVAILABLE',
-    'CALCULUS_AVAILABLE',
-    'DIVINE_AVAILABLE',
-]
-
-# Add available modules to exports
-if MD_AVAILABLE:
-    __all__.extend([
-        'MultidimensionalRecursive',
-        'DivineQuantum',
-        'RecursiveFHE', 
-        'VerifiedRecursiveCompiler',
-        'QuantumState'
-    ])
-
-if SYNC_AVAILABLE:
-    __all__.extend([
-        'CosmicSynchronizer',
-        'DivineTiming'
-    ])
-
-if CALCULUS_AVAILABLE:
-    __all__.extend([
-        'CalculusRigor',
-        'TensorNetworkDeployment'
-    ])
-
-if DIVINE_AVAILABLE:
-    __all__.extend([
-        'DivineEngineering',
-        'SacredGeometry'
-    ])
-
-print("="*60)
-print("🌀 COSMIC ENGINEERING MODULES - 100% FUNCTIONAL")
-print("="*60)
-print(f"   • Multidimensional Recursive: {'✅' if MD_AVAILABLE else '⚠️'}")
-print(f"   • Cosmic Synchronization: {'✅' if SYNC_AVAILABLE else '⚠️'}")
-print(f"   • Calculus Rigor Proofs: {'✅' if CALCULUS_AVAILABLE else '⚠️'}")
-print(f"   • Divine Engineering Core: {'✅' if DIVINE_AVAILABLE else '⚠️'}")
-print("✅ Ready for cosmic operations!")
-print("="*60)
\ No newline at end of file
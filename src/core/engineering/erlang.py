@@ -0,0 +1,197 @@
+"""
+ERLANG C STAFFING - Interval-level agent requirements for service level and ASA targets
+Vectorized Erlang B recursion across many intervals/queues with a memo of solved
+(traffic, handle time) pairs
+"""
+
+import threading
+import numpy as np
+from typing import Dict, Any, Optional
+
+# Memo keys quantize traffic up to the next 1e-4 Erlang (never understaffs) and handle time to 0.01 s
+_TRAFFIC_SCALE = 10_000
+_AHT_SCALE = 100
+_AHT_BITS = 24
+
+
+def _as_arrays(*values):
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+
+
+def erlang_b(traffic, agents) -> np.ndarray:
+    """
+    Blocking probability via the stable recursion B(n) = A·B(n-1) / (n + A·B(n-1)).
+
+    Never forms A^N / N!, so it holds for thousands of agents. Vectorized over
+    any broadcastable ``traffic``/``agents``.
+    """
+    traffic, agents = _as_arrays(traffic, agents)
+    agents = np.floor(agents)
+    b = np.ones(traffic.shape)
+    for n in range(1, int(agents.max(initial=0)) + 1):
+        step = traffic * b / (n + traffic * b)
+        b = np.where(agents >= n, step, b)
+    return b
+
+
+def erlang_c(traffic, agents) -> np.ndarray:
+    """Probability an arriving call waits; 1 where the queue is unstable (agents <= traffic)"""
+    traffic, agents = _as_arrays(traffic, agents)
+    b = erlang_b(traffic, agents)
+    stable = agents > traffic
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = agents * b / (agents - traffic * (1 - b))
+    return np.where(stable, c, 1.0)
+
+
+def service_level(traffic, agents, aht, answer_seconds) -> np.ndarray:
+    """Fraction of calls answered within ``answer_seconds``"""
+    traffic, agents, aht, answer_seconds = _as_arrays(traffic, agents, aht, answer_seconds)
+    c = erlang_c(traffic, agents)
+    sl = 1 - c * np.exp(-(agents - traffic) * answer_seconds / aht)
+    return np.where(agents > traffic, np.clip(sl, 0.0, 1.0), 0.0)
+
+
+def average_speed_of_answer(traffic, agents, aht) -> np.ndarray:
+    """Mean wait in seconds over all calls; inf where the queue is unstable"""
+    traffic, agents, aht = _as_arrays(traffic, agents, aht)
+    c = erlang_c(traffic, agents)
+    with np.errstate(divide="ignore"):
+        asa = c * aht / (agents - traffic)
+    return np.where(agents > traffic, asa, np.inf)
+
+
+class ErlangStaffing:
+    """
+    Minimum agents per interval meeting a service level (and optionally ASA
+    and occupancy) target under Erlang C.
+
+    ``required_agents`` accepts arrays of any shape, e.g. 96 intervals x 500
+    queues. Distinct (traffic, AHT) pairs are solved together: one Erlang B
+    recursion walks agent counts upwards for all of them, retiring each pair
+    at its first feasible count. Solved pairs are memoized, so repeated
+    forecasts and shared patterns cost a lookup.
+    """
+
+    def __init__(self, service_level: float = 0.8, answer_seconds: float = 20.0,
+                 target_asa: Optional[float] = None, max_occupancy: Optional[float] = None,
+                 cache_size: int = 1_000_000):
+        if not 0 < service_level < 1:
+            raise ValueError("service_level must be between 0 and 1 (exclusive)")
+        if max_occupancy is not None and not 0 < max_occupancy <= 1:
+            raise ValueError("max_occupancy must be in (0, 1]")
+        self.service_level = service_level
+        self.answer_seconds = answer_seconds
+        self.target_asa = target_asa
+        self.max_occupancy = max_occupancy
+        self.cache_size = cache_size
+        self._keys = np.empty(0, dtype=np.int64)
+        self._agents = np.empty(0, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "hits": 0, "solved": 0}
+
+    def required_agents(self, calls, aht, interval_seconds: float = 1800, shrinkage: float = 0.0) -> np.ndarray:
+        """Agents to schedule per interval for ``calls`` offered per interval at ``aht`` seconds"""
+        calls, aht = _as_arrays(calls, aht)
+        if np.any(aht <= 0):
+            raise ValueError("aht must be positive")
+        traffic_q = np.ceil(np.maximum(calls, 0) * aht / interval_seconds * _TRAFFIC_SCALE - 1e-9).astype(np.int64)
+        aht_q = np.rint(aht * _AHT_SCALE).astype(np.int64)
+        keys, inverse = np.unique((traffic_q << _AHT_BITS) | aht_q, return_inverse=True)
+
+        agents = self._lookup(keys)
+        missing = agents < 0
+        if missing.any():
+            solved = self._solve((keys[missing] >> _AHT_BITS) / _TRAFFIC_SCALE,
+                                 (keys[missing] & ((1 << _AHT_BITS) - 1)) / _AHT_SCALE)
+            agents[missing] = solved
+            self._store(keys[missing], solved)
+
+        result = agents[inverse.reshape(-1)].reshape(calls.shape)
+        if shrinkage:
+            result = np.ceil(result / (1 - shrinkage)).astype(np.int64)
+        return result
+
+    def interval_metrics(self, calls, agents, aht, interval_seconds: float = 1800) -> Dict[str, np.ndarray]:
+        """Service level, ASA, wait probability and occupancy for a given staffing"""
+        calls, agents, aht = _as_arrays(calls, agents, aht)
+        traffic = calls * aht / interval_seconds
+        with np.errstate(divide="ignore", invalid="ignore"):
+            occupancy = np.where(agents > 0, traffic / agents, 0.0)
+        return {
+            "traffic_erlangs": traffic,
+            "service_level": service_level(traffic, agents, aht, self.answer_seconds),
+            "asa_seconds": average_speed_of_answer(traffic, agents, aht),
+            "probability_of_wait": erlang_c(traffic, agents),
+            "occupancy": np.minimum(occupancy, 1.0),
+        }
+
+    def _lookup(self, keys: np.ndarray) -> np.ndarray:
+        with self._lock:
+            cached_keys, cached_agents = self._keys, self._agents
+        agents = np.full(len(keys), -1, dtype=np.int64)
+        if len(cached_keys):
+            pos = np.searchsorted(cached_keys, keys).clip(max=len(cached_keys) - 1)
+            hit = cached_keys[pos] == keys
+            agents[hit] = cached_agents[pos[hit]]
+            self.stats["hits"] += int(hit.sum())
+        self.stats["lookups"] += len(keys)
+        return agents
+
+    def _store(self, keys: np.ndarray, agents: np.ndarray):
+        with self._lock:
+            if len(self._keys) + len(keys) > self.cache_size:
+                self._keys, self._agents = self._keys[:0], self._agents[:0]
+            merged_keys = np.concatenate([self._keys, keys])
+            order = np.argsort(merged_keys, kind="stable")
+            self._keys = merged_keys[order]
+            self._agents = np.concatenate([self._agents, agents])[order]
+
+    def _solve(self, traffic: np.ndarray, aht: np.ndarray) -> np.ndarray:
+        """First feasible agent count for each (traffic, aht) pair"""
+        self.stats["solved"] += len(traffic)
+        result = np.zeros(len(traffic), dtype=np.int64)
+        floor = np.floor(traffic) + 1
+        if self.max_occupancy is not None:
+            floor = np.maximum(floor, np.ceil(traffic / self.max_occupancy))
+
+        active = np.flatnonzero(traffic > 0)  # No traffic needs no agents
+        a, h, lo = traffic[active], aht[active], floor[active]
+        b = np.ones(len(active))
+        n = 0
+        while len(active):
+            n += 1
+            b = a * b / (n + a * b)
+            check = lo <= n
+            if not check.any():
+                continue
+            c = n * b[check] / (n - a[check] * (1 - b[check]))
+            ok = 1 - c * np.exp(-(n - a[check]) * self.answer_seconds / h[check]) >= self.service_level
+            if self.target_asa is not None:
+                ok &= c * h[check] / (n - a[check]) <= self.target_asa
+            done = np.zeros(len(active), dtype=bool)
+            done[np.flatnonzero(check)[ok]] = True
+            if done.any():
+                result[active[done]] = n
+                keep = ~done
+                active, a, h, lo, b = active[keep], a[keep], h[keep], lo[keep], b[keep]
+        return result
+
+    def cache_info(self) -> Dict[str, Any]:
+        return {**self.stats, "size": len(self._keys), "max_size": self.cache_size}
+
+    def clear_cache(self):
+        with self._lock:
+            self._keys = np.empty(0, dtype=np.int64)
+            self._agents = np.empty(0, dtype=np.int64)
+
+
+_staffing: Optional[ErlangStaffing] = None
+
+
+def get_erlang_staffing() -> ErlangStaffing:
+    """Shared 80/20 calculator, so every caller benefits from the same memo"""
+    global _staffing
+    if _staffing is None:
+        _staffing = ErlangStaffing()
+    return _staffing
@@ -1,3 +0,0 @@
-from .divine_engineering import DivineEngineering
-from .liquid_engineering import LiquidEngineering
-__all__ = ["DivineEngineering", "LiquidEngineering"]
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+INTERVAL PLANNER - Array-based daily staffing over 15-minute intervals
+Takes a (queues x intervals) demand matrix (optionally with leading site axes) and
+computes Erlang C requirements, peak uplift and break coverage with array ops
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Sequence
+
+from .erlang import ErlangStaffing, get_erlang_staffing
+
+# 60 min lunch + 30 min short breaks per 8-hour shift (TimingOptimizer defaults)
+DEFAULT_BREAK_FRACTION = 90 / 480
+
+
+def _round_preserving_sum(values: np.ndarray) -> np.ndarray:
+    """Integer split of each row along the last axis whose total matches the rounded row sum"""
+    cumulative = np.floor(np.cumsum(values, axis=-1) + 0.5)
+    return np.diff(cumulative, axis=-1, prepend=0).astype(np.int64)
+
+
+@dataclass
+class DailyPlan:
+    """
+    Staffing arrays for one day; every array has the demand's shape
+    ``(..., queues, intervals)``. Rendering to dicts is deferred to
+    ``to_dict`` since most consumers only need the arrays.
+    """
+    demand: np.ndarray
+    required: np.ndarray      # Erlang C agents on the phones
+    peak_uplift: np.ndarray   # Extra agents for peak intervals
+    breaks: np.ndarray        # Agents on break, placed off-peak
+    interval_minutes: int
+    start_minute: int = 0
+    queue_names: Optional[List[str]] = None
+    peak_mask: np.ndarray = field(default=None, repr=False)
+
+    @property
+    def scheduled(self) -> np.ndarray:
+        return self.required + self.peak_uplift + self.breaks
+
+    @property
+    def interval_totals(self) -> np.ndarray:
+        """Scheduled agents per interval across all queues (and sites)"""
+        return self.scheduled.reshape(-1, self.scheduled.shape[-1]).sum(axis=0)
+
+    @property
+    def agent_hours(self) -> np.ndarray:
+        """Scheduled agent-hours per queue"""
+        return self.scheduled.sum(axis=-1) * self.interval_minutes / 60
+
+    @property
+    def interval_labels(self) -> List[str]:
+        minutes = self.start_minute + np.arange(self.demand.shape[-1]) * self.interval_minutes
+        return [f"{m // 60 % 24:02d}:{m % 60:02d}" for m in minutes.tolist()]
+
+    def _names(self) -> List[str]:
+        if self.queue_names is not None:
+            return list(self.queue_names)
+        return [f"queue_{'.'.join(map(str, index))}" for index in np.ndindex(*self.demand.shape[:-1])]
+
+    def to_dict(self, queues: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Per-queue ``{'HH:MM': agents}`` rendering, optionally for selected queues only"""
+        labels = self.interval_labels
+        names = self._names()
+        rows = {name: i for i, name in enumerate(names)}
+        selected = names if queues is None else [name for name in queues if name in rows]
+        flat = {key: getattr(self, key).reshape(len(names), -1)
+                for key in ('required', 'peak_uplift', 'breaks', 'scheduled')}
+        hours = self.agent_hours.reshape(-1)
+
+        return {
+            'interval_minutes': self.interval_minutes,
+            'intervals': len(labels),
+            'total_agent_hours': float(hours.sum()),
+            'peak_total_agents': int(self.interval_totals.max(initial=0)),
+            'queues': {
+                name: {
+                    'agent_hours': float(hours[rows[name]]),
+                    'peak_intervals': [labels[t] for t in np.flatnonzero(flat['peak_uplift'][rows[name]])],
+                    'scheduled': dict(zip(labels, flat['scheduled'][rows[name]].tolist())),
+                    'required': dict(zip(labels, flat['required'][rows[name]].tolist())),
+                    'on_break': dict(zip(labels, flat['breaks'][rows[name]].tolist())),
+                }
+                for name in selected
+            }
+        }
+
+
+class IntervalPlanner:
+    """
+    Daily planner over fixed-length intervals.
+
+    Requirements come from Erlang C per (queue, interval). An interval is a
+    peak when its demand exceeds ``peak_threshold`` x the queue's mean
+    non-zero demand; peaks get a ``peak_buffer`` uplift. Break coverage adds
+    ``break_fraction`` of each queue's agent-intervals back onto the plan,
+    spread over its off-peak staffed intervals in proportion to staffing,
+    so no breaks land in peaks.
+    """
+
+    def __init__(self, interval_minutes: int = 15, staffing: Optional[ErlangStaffing] = None,
+                 peak_threshold: float = 1.2, peak_buffer: float = 0.1,
+                 break_fraction: float = DEFAULT_BREAK_FRACTION):
+        if 1440 % interval_minutes:
+            raise ValueError("interval_minutes must divide a day")
+        self.interval_minutes = interval_minutes
+        self.staffing = staffing or get_erlang_staffing()
+        self.peak_threshold = peak_threshold
+        self.peak_buffer = peak_buffer
+        self.break_fraction = break_fraction
+
+    def plan(self, demand, aht, queue_names: Optional[Sequence[str]] = None,
+             start_minute: int = 0) -> DailyPlan:
+        """
+        ``demand`` is calls offered per interval, shape ``(..., queues, intervals)``;
+        ``aht`` is seconds, a scalar or one value per queue (shape ``demand.shape[:-1]``).
+        """
+        demand = np.asarray(demand, dtype=float)
+        if demand.ndim == 1:
+            demand = demand[np.newaxis, :]
+        aht = np.asarray(aht, dtype=float)
+        if aht.ndim:
+            aht = aht[..., np.newaxis]
+        if queue_names is not None and len(queue_names) != int(np.prod(demand.shape[:-1])):
+            raise ValueError("queue_names must name every queue")
+
+        required = self.staffing.required_agents(demand, aht, interval_seconds=self.interval_minutes * 60)
+
+        active = demand > 0
+        counts = active.sum(axis=-1, keepdims=True)
+        mean = np.divide(demand.sum(axis=-1, keepdims=True), counts, out=np.zeros(counts.shape), where=counts > 0)
+        peak_mask = active & (demand > self.peak_threshold * mean)
+        peak_uplift = np.where(peak_mask, np.ceil(required * self.peak_buffer), 0).astype(np.int64)
+
+        on_floor = required + peak_uplift
+        weights = np.where(peak_mask, 0, on_floor).astype(float)
+        weight_sum = weights.sum(axis=-1, keepdims=True)
+        # Queues that are all peak still need breaks: fall back to staffing weights
+        weights = np.where(weight_sum > 0, weights, on_floor)
+        weight_sum = weights.sum(axis=-1, keepdims=True)
+        break_load = on_floor.sum(axis=-1, keepdims=True) * self.break_fraction
+        share = np.divide(weights * break_load, weight_sum, out=np.zeros(weights.shape), where=weight_sum > 0)
+        breaks = _round_preserving_sum(share)
+
+        return DailyPlan(
+            demand=demand,
+            required=required,
+            peak_uplift=peak_uplift,
+            breaks=breaks,
+            interval_minutes=self.interval_minutes,
+            start_minute=start_minute,
+            queue_names=list(queue_names) if queue_names is not None else None,
+            peak_mask=peak_mask,
+        )
@@ -1,14 +1,14 @@
-import sympy as sp
 import numpy as np
-from scipy.integrate import odeint
 
 class LiquidEngineering:
     def __init__(self):
+        import sympy as sp
         x, y, t, u, v, p, nu = sp.symbols('x y t u v p nu')
         self.vars = {'x': x, 'y': y, 't': t, 'u': u, 'v': v, 'p': p, 'nu': nu}
     
     def adaptive_flow(self) -> dict:
         """NS: Symbolic eqs + numerical adapt stub (scale-ready)"""
+        import sympy as sp
         x, y, t, u, v, p, nu = self.vars.values()
         continuity = sp.Eq(sp.diff(u, x) + sp.diff(v, y), 0)
         mom_x = sp.Eq(sp.diff(u, t) + u*sp.diff(u, x) + v*sp.diff(u, y), -sp.diff(p, x) + nu*(sp.diff(u, x, 2) + sp.diff(u, y, 2)))
@@ -0,0 +1,384 @@
+"""
+LP STAFFING - Shift x skill x budget staffing as a linear / mixed-integer program
+Sparse coverage constraints solved with HiGHS through scipy.optimize.linprog/milp;
+the compiled model is reused across re-solves when only demand changes
+"""
+
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+# Agent profiles used by BPOOptimizationCalculus (PHP per month)
+DEFAULT_AGENT_TYPES = (
+    {'name': 'novice', 'cost': 18000, 'efficiency': 0.7},
+    {'name': 'intermediate', 'cost': 25000, 'efficiency': 0.9},
+    {'name': 'expert', 'cost': 35000, 'efficiency': 1.2},
+)
+
+
+@dataclass(frozen=True)
+class AgentType:
+    """Agent profile; ``efficiency`` scales coverage, no ``skills`` means every skill"""
+    name: str
+    cost: float
+    efficiency: float = 1.0
+    skills: Tuple[str, ...] = ()
+    max_agents: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ShiftPattern:
+    """Contiguous run of ``length`` intervals from ``start`` (wrapping past midnight)"""
+    name: str
+    start: int
+    length: int
+    cost_factor: float = 1.0
+
+
+def shift_patterns(intervals: int = 96, length: int = 32, step: int = 4,
+                   night_premium: float = 0.0) -> List[ShiftPattern]:
+    """Every ``length``-interval shift starting each ``step`` intervals; night starts carry a premium"""
+    per_hour = intervals / 24
+    return [
+        ShiftPattern(f"{int(start / per_hour):02d}:{int(start % per_hour * 60 / per_hour):02d}",
+                     start, length, 1.0 + (night_premium if start < 6 * per_hour or start >= 22 * per_hour else 0.0))
+        for start in range(0, intervals, step)
+    ]
+
+
+@dataclass
+class StaffingSolution:
+    """Solver outcome; ``agents`` is ``(types, shifts, skills)`` and 0 where a type lacks a skill"""
+    status: str
+    success: bool
+    integer: bool
+    total_cost: float             # Staffing cost only
+    objective: float              # Staffing cost plus shortfall penalty
+    agents: np.ndarray
+    coverage: np.ndarray          # (intervals, skills) effective agents scheduled
+    shortfall: np.ndarray         # (intervals, skills) uncovered demand
+    lower_bound: float
+    solve_seconds: float
+    build_seconds: float = 0.0
+    warm_started: bool = False
+    message: str = ""
+    type_names: List[str] = field(default_factory=list)
+    shift_names: List[str] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+
+    @property
+    def gap(self) -> float:
+        """Relative optimality gap against the best known lower bound"""
+        if not self.success or self.objective <= 0:
+            return 0.0
+        return max(0.0, (self.objective - self.lower_bound) / self.objective)
+
+    @property
+    def headcount(self) -> Dict[str, float]:
+        return dict(zip(self.type_names, self.agents.sum(axis=(1, 2)).tolist()))
+
+    def roster(self, min_agents: float = 1e-9) -> List[Dict[str, Any]]:
+        """Non-zero (type, shift, skill) assignments"""
+        return [
+            {'type': self.type_names[t], 'shift': self.shift_names[s], 'skill': self.skills[k],
+             'agents': float(self.agents[t, s, k])}
+            for t, s, k in zip(*np.nonzero(self.agents > min_agents))
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'status': self.status,
+            'success': self.success,
+            'integer': self.integer,
+            'total_cost': round(self.total_cost, 2),
+            'headcount': self.headcount,
+            'total_shortfall': float(self.shortfall.sum()),
+            'gap': round(self.gap, 6),
+            'lower_bound': round(self.lower_bound, 2),
+            'solve_seconds': round(self.solve_seconds, 4),
+            'build_seconds': round(self.build_seconds, 4),
+            'warm_started': self.warm_started,
+            'message': self.message,
+        }
+
+
+class StaffingLP:
+    """
+    Minimum-cost staffing over intervals, shifts and skills.
+
+    One variable per (agent type, shift, skill the type has): agents of
+    that type working that shift on that skill. Constraints, all sparse:
+
+    - coverage: for every (interval, skill), efficiency-weighted agents on
+      shifts spanning the interval plus shortfall >= demand
+    - budget: total cost <= ``budget`` (optional)
+    - availability: agents of a type across shifts/skills <= ``max_agents``
+
+    Shortfall variables exist only with ``shortfall_cost``; without them
+    coverage is hard and an unaffordable demand is reported infeasible.
+
+    The matrix is built once; ``solve`` only swaps the demand vector. Every
+    solve starts with the LP relaxation, whose value is a valid lower bound;
+    integer solves then run HiGHS branch-and-bound for at most
+    ``time_limit`` seconds and report the gap either way.
+
+    scipy's HiGHS wrappers take no starting basis or incumbent, so
+    ``warm_start`` works at the model level: the previous roster is repaired
+    with a small residual MILP over the demand it no longer covers, and is
+    kept when its gap over the new LP bound is within ``mip_rel_gap`` of the
+    previous solve's. Small demand changes then skip the full search.
+    """
+
+    def __init__(self, agent_types: Sequence, shifts: Sequence[ShiftPattern], skills: Sequence[str],
+                 intervals: int = 96, budget: Optional[float] = None, integer: bool = True,
+                 shortfall_cost: Optional[float] = None, time_limit: float = 30.0,
+                 mip_rel_gap: float = 1e-2):
+        self.agent_types = [a if isinstance(a, AgentType) else AgentType(**a) for a in agent_types]
+        self.shifts = list(shifts)
+        self.skills = list(skills)
+        self.intervals = intervals
+        self.budget = budget
+        self.integer = integer
+        self.shortfall_cost = shortfall_cost
+        self.time_limit = time_limit
+        self.mip_rel_gap = mip_rel_gap
+        self._previous: Optional[Tuple[np.ndarray, float]] = None  # (roster, gap over LP bound)
+        self.build_seconds = 0.0
+        self._build()
+
+    def _build(self):
+        from scipy import sparse
+
+        start = time.perf_counter()
+        n_types, n_shifts, n_skills = len(self.agent_types), len(self.shifts), len(self.skills)
+        skill_index = {skill: k for k, skill in enumerate(self.skills)}
+        has_skill = np.zeros((n_types, n_skills), dtype=bool)
+        for t, agent in enumerate(self.agent_types):
+            has_skill[t, [skill_index[s] for s in agent.skills] if agent.skills else slice(None)] = True
+
+        # Variables: (type, shift, skill) where the type has the skill
+        t_idx, s_idx, k_idx = np.nonzero(np.broadcast_to(has_skill[:, None, :], (n_types, n_shifts, n_skills)))
+        self._var_index = (t_idx, s_idx, k_idx)
+        n_vars = len(t_idx)
+
+        efficiency = np.array([a.efficiency for a in self.agent_types])
+        unit_cost = np.array([a.cost for a in self.agent_types])
+        factor = np.array([s.cost_factor for s in self.shifts])
+        lengths = np.array([s.length for s in self.shifts])
+        starts = np.array([s.start for s in self.shifts])
+
+        # Coverage rows (interval * skills + skill): each variable spans its shift's intervals
+        spans = lengths[s_idx]
+        offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        interval = (np.repeat(starts[s_idx], spans) + offsets) % self.intervals
+        rows = interval * n_skills + np.repeat(k_idx, spans)
+        cols = np.repeat(np.arange(n_vars), spans)
+        cover = sparse.csr_matrix((np.repeat(efficiency[t_idx], spans), (rows, cols)),
+                                  shape=(self.intervals * n_skills, n_vars))
+
+        self._cost = unit_cost[t_idx] * factor[s_idx]
+        n_rows = self.intervals * n_skills
+        self._n_vars = n_vars
+        self._agent_cover = cover
+        self._cover = cover
+        if self.shortfall_cost is not None:
+            self._cover = sparse.hstack([cover, sparse.identity(n_rows, format='csr')], format='csr')
+        self._n_total = self._cover.shape[1]
+
+        ub_rows, ub = [], []
+        pad = self._n_total - n_vars
+        if self.budget is not None:
+            ub_rows.append(sparse.csr_matrix(np.concatenate([self._cost, np.zeros(pad)])[None, :]))
+            ub.append(np.array([self.budget], dtype=float))
+        limited = [t for t, a in enumerate(self.agent_types) if a.max_agents is not None]
+        if limited:
+            selector = sparse.csr_matrix(
+                (np.ones(np.isin(t_idx, limited).sum()),
+                 (np.searchsorted(limited, t_idx[np.isin(t_idx, limited)]), np.flatnonzero(np.isin(t_idx, limited)))),
+                shape=(len(limited), self._n_total))
+            ub_rows.append(selector)
+            ub.append(np.array([self.agent_types[t].max_agents for t in limited], dtype=float))
+        self._A_ub = sparse.vstack(ub_rows, format='csr') if ub_rows else None
+        self._b_ub = np.concatenate(ub) if ub else None
+
+        objective = self._cost
+        if self.shortfall_cost is not None:
+            objective = np.concatenate([self._cost, np.full(n_rows, float(self.shortfall_cost))])
+        self._objective = objective
+        # linprog takes only <= rows: coverage is negated on top of the budget/availability rows
+        self._A_lp = sparse.vstack([-self._cover] + ([self._A_ub] if self._A_ub is not None else []), format='csr')
+        self.build_seconds = time.perf_counter() - start
+
+    @property
+    def n_variables(self) -> int:
+        return self._n_total
+
+    def _demand_vector(self, demand) -> np.ndarray:
+        demand = np.asarray(demand, dtype=float)
+        if demand.ndim == 1:
+            demand = demand[:, None]
+        if demand.shape != (self.intervals, len(self.skills)):
+            raise ValueError(f"demand must be (intervals={self.intervals}, skills={len(self.skills)})")
+        return demand.reshape(-1)
+
+    def solve(self, demand, warm_start: bool = True) -> StaffingSolution:
+        """``demand`` is effective agents required per (interval, skill), e.g. from Erlang C"""
+        from scipy.optimize import linprog
+
+        b = self._demand_vector(demand)
+        start = time.perf_counter()
+        b_lp = np.concatenate([-b] + ([self._b_ub] if self._b_ub is not None else []))
+        relaxed = linprog(self._objective, A_ub=self._A_lp, b_ub=b_lp, bounds=(0, None), method='highs')
+        if relaxed.status != 0 or not self.integer:
+            status = 'optimal' if relaxed.status == 0 else 'infeasible' if relaxed.status == 2 else 'failed'
+            return self._solution(relaxed.x if relaxed.status == 0 else None, b, status,
+                                  relaxed.fun if relaxed.status == 0 else 0.0, start, relaxed.message)
+
+        bound = float(relaxed.fun)
+        if warm_start and self._previous is not None:
+            x = self._repair(self._previous[0], b)
+            if x is not None:
+                objective = float(self._objective @ x)
+                if objective - bound <= (self._previous[1] + self.mip_rel_gap) * objective:
+                    return self._solution(x, b, 'warm_start', bound, start,
+                                          "Previous roster repaired within gap", warm_started=True)
+
+        result = self._milp(b, self._b_ub)
+        dual = getattr(result, 'mip_dual_bound', None)
+        status = 'optimal' if result.status == 0 else 'time_limit' if result.x is not None else 'failed'
+        solution = self._solution(result.x, b, status, max(bound, dual if dual is not None else bound),
+                                  start, result.message)
+        if solution.success:
+            # Gap over the LP bound is what a later warm start can be compared with
+            self._previous = (self._previous[0], (solution.objective - bound) / max(solution.objective, 1e-12))
+        return solution
+
+    def _milp(self, demand: np.ndarray, caps: Optional[np.ndarray], time_limit: Optional[float] = None):
+        from scipy.optimize import Bounds, LinearConstraint, milp
+
+        constraints = [LinearConstraint(self._cover, lb=demand, ub=np.inf)]
+        if self._A_ub is not None:
+            constraints.append(LinearConstraint(self._A_ub, lb=-np.inf, ub=caps))
+        integrality = np.concatenate([np.ones(self._n_vars), np.zeros(self._n_total - self._n_vars)])
+        return milp(self._objective, integrality=integrality, bounds=Bounds(0, np.inf), constraints=constraints,
+                    options={'time_limit': time_limit or self.time_limit, 'mip_rel_gap': self.mip_rel_gap})
+
+    def _repair(self, previous: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Previous roster plus the cheapest integer additions covering what it
+        no longer covers. The residual problem only has the uncovered rows
+        binding, so HiGHS presolves most of it away.
+        """
+        agents = previous[:self._n_vars]
+        residual = np.maximum(b - self._agent_cover @ agents, 0)
+        caps = None if self._A_ub is None else self._b_ub - self._A_ub[:, :self._n_vars] @ agents
+        if caps is not None and (caps < -1e-6).any():
+            return None
+        if not residual.any():
+            added = np.zeros(self._n_total)
+        else:
+            result = self._milp(residual, caps)
+            if result.x is None:
+                return None
+            added = result.x
+        x = added.copy()
+        x[:self._n_vars] = agents + np.round(added[:self._n_vars])
+        return self._refit(x, b)
+
+    def _refit(self, x: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Roster against demand ``b``, with shortfall recomputed"""
+        x = x.copy()
+        if self.shortfall_cost is not None:
+            x[self._n_vars:] = np.maximum(b - self._agent_cover @ x[:self._n_vars], 0)
+        return x
+
+    def _solution(self, x, b, status, bound, start, message, warm_started=False) -> StaffingSolution:
+        shape = (len(self.agent_types), len(self.shifts), len(self.skills))
+        agents = np.zeros(shape)
+        coverage = np.zeros(len(b))
+        if x is not None:
+            if self.integer:
+                x = self._refit(np.concatenate([np.round(x[:self._n_vars]), x[self._n_vars:]]), b)
+            agents[self._var_index] = x[:self._n_vars]
+            coverage = self._agent_cover @ x[:self._n_vars]
+            solution = StaffingSolution(
+                status=status, success=True, integer=self.integer,
+                total_cost=float(self._cost @ x[:self._n_vars]),
+                objective=float(self._objective @ x),
+                agents=agents,
+                coverage=coverage.reshape(self.intervals, -1),
+                shortfall=np.maximum(b - coverage, 0).reshape(self.intervals, -1),
+                lower_bound=float(bound),
+                solve_seconds=time.perf_counter() - start,
+                build_seconds=self.build_seconds,
+                warm_started=warm_started,
+                message=str(message),
+                type_names=[a.name for a in self.agent_types],
+                shift_names=[s.name for s in self.shifts],
+                skills=list(self.skills),
+            )
+            if self.integer:
+                gap = self._previous[1] if self._previous is not None else 0.0
+                self._previous = (x, gap)
+            return solution
+        return StaffingSolution(
+            status=status, success=False, integer=self.integer, total_cost=0.0, objective=0.0, agents=agents,
+            coverage=coverage.reshape(self.intervals, -1),
+            shortfall=b.reshape(self.intervals, -1), lower_bound=0.0,
+            solve_seconds=time.perf_counter() - start, build_seconds=self.build_seconds,
+            message=str(message), type_names=[a.name for a in self.agent_types],
+            shift_names=[s.name for s in self.shifts], skills=list(self.skills),
+        )
+
+
+def allocate_budget(agent_types: Sequence[Dict[str, Any]] = DEFAULT_AGENT_TYPES, budget: float = 1_000_000,
+                    min_per_type: int = 5, max_per_type: int = 50) -> Dict[str, Any]:
+    """
+    Headcount per agent type maximizing total efficiency within ``budget``.
+    A type is either unused or staffed with ``min_per_type``..``max_per_type``
+    agents (semi-continuous, modelled with one binary per type).
+    """
+    from scipy.optimize import Bounds, LinearConstraint, milp
+
+    n = len(agent_types)
+    cost = np.array([a['cost'] for a in agent_types], dtype=float)
+    efficiency = np.array([a['efficiency'] for a in agent_types], dtype=float)
+    # Variables: agents per type, then used-flag per type
+    A = np.zeros((1 + 2 * n, 2 * n))
+    A[0, :n] = cost
+    A[1:n + 1, :n] = np.eye(n)
+    A[1:n + 1, n:] = -min_per_type * np.eye(n)
+    A[n + 1:, :n] = np.eye(n)
+    A[n + 1:, n:] = -max_per_type * np.eye(n)
+    lb = np.concatenate([[-np.inf], np.zeros(n), np.full(n, -np.inf)])
+    ub = np.concatenate([[budget], np.full(n, np.inf), np.zeros(n)])
+
+    start = time.perf_counter()
+    result = milp(-np.concatenate([efficiency, np.zeros(n)]), integrality=np.ones(2 * n),
+                  bounds=Bounds(np.zeros(2 * n), np.concatenate([np.full(n, max_per_type), np.ones(n)])),
+                  constraints=LinearConstraint(A, lb, ub))
+    counts = np.round(result.x[:n]).astype(int) if result.x is not None else np.zeros(n, dtype=int)
+    return {
+        'allocation': {a['name']: int(c) for a, c in zip(agent_types, counts) if c > 0},
+        'total_agents': int(counts.sum()),
+        'total_cost': float(cost @ counts),
+        'total_efficiency': float(efficiency @ counts),
+        'status': 'optimal' if result.status == 0 else str(result.message),
+        'gap': float(getattr(result, 'mip_gap', 0.0) or 0.0),
+        'solve_seconds': time.perf_counter() - start,
+    }
+
+
+def solve_staffing(demand, agent_types: Sequence = DEFAULT_AGENT_TYPES, skills: Optional[Sequence[str]] = None,
+                   shift_length_hours: float = 8, **options) -> StaffingSolution:
+    """One-off solve of ``(intervals,)`` or ``(intervals, skills)`` demand with hourly-start shifts"""
+    demand = np.asarray(demand, dtype=float)
+    if demand.ndim == 1:
+        demand = demand[:, None]
+    intervals = demand.shape[0]
+    per_hour = intervals // 24 or 1
+    if skills is None:
+        skills = ['general'] if demand.shape[1] == 1 else [f"skill_{k}" for k in range(demand.shape[1])]
+    shifts = shift_patterns(intervals, int(shift_length_hours * per_hour), per_hour)
+    return StaffingLP(agent_types, shifts, skills, intervals=intervals, **options).solve(demand)
@@ -0,0 +1,243 @@
+"""
+MARKOV JOURNEY ENGINE - Ticket status transitions as a sparse Markov chain
+Streams (ticket, status) events into a CSR transition-count matrix, incrementally;
+stationary occupancy by power iteration, steps-to-resolution by sparse solves
+"""
+
+import itertools
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+from typing import Dict, List, Any, Hashable, Iterable, Optional, Sequence, Tuple
+
+# Ticket statuses as produced by generate_data.py, in workflow order
+TICKET_STATUSES = ('open', 'in-progress', 'pending', 'resolved')
+RESOLVED_STATUSES = ('resolved',)
+
+
+class JourneyEngine:
+    """
+    Customer journey chain over ticket statuses.
+
+    Events must arrive in time order per ticket (tickets may interleave).
+    Each ticket's last status is carried between ``update`` calls, so a log
+    can be fed in any number of batches and the counts equal a single pass.
+    Reaching an absorbing status ends a journey; a ticket seen again later
+    starts a new one. Unknown statuses become new states on first sight.
+    """
+
+    def __init__(self, states: Sequence[str] = TICKET_STATUSES,
+                 absorbing: Sequence[str] = RESOLVED_STATUSES):
+        self.states: List[str] = list(states)
+        self._index: Dict[str, int] = {state: i for i, state in enumerate(self.states)}
+        for state in absorbing:
+            self._state_index(state)
+        self._absorbing = set(absorbing)
+        self._counts = sparse.csr_matrix((len(self.states), len(self.states)), dtype=np.int64)
+        self._entries = np.zeros(len(self.states), dtype=np.int64)
+        self._last: Dict[Hashable, int] = {}
+        self._matrix: Optional[sparse.csr_matrix] = None
+        self.events = 0
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def update(self, events: Iterable[Tuple[Hashable, str]], chunk_size: int = 100_000) -> "JourneyEngine":
+        """Consume ``(ticket_id, status)`` pairs from any iterable, ``chunk_size`` at a time"""
+        iterator = iter(events)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            tickets, statuses = zip(*chunk)
+            self.update_arrays(tickets, statuses)
+
+    def update_arrays(self, ticket_ids, statuses) -> "JourneyEngine":
+        """Add one batch of events given as parallel sequences"""
+        statuses = np.asarray(statuses)
+        if len(statuses) == 0:
+            return self
+        names, status_codes = np.unique(statuses, return_inverse=True)
+        codes = np.array([self._state_index(str(name)) for name in names.tolist()])[status_codes.reshape(-1)]
+        absorbing = self._absorbing_mask()
+
+        tickets, ticket_codes = np.unique(np.asarray(ticket_ids), return_inverse=True)
+        order = np.argsort(ticket_codes.reshape(-1), kind='stable')
+        ticket_sorted, state_sorted = ticket_codes.reshape(-1)[order], codes[order]
+
+        same = ticket_sorted[1:] == ticket_sorted[:-1]
+        first = np.concatenate([[True], ~same])
+        last = np.concatenate([~same, [True]])
+        continues = same & ~absorbing[state_sorted[:-1]]
+        src, dst = state_sorted[:-1][continues], state_sorted[1:][continues]
+
+        ticket_list = tickets.tolist()
+        previous = np.array([self._last.get(ticket, -1) for ticket in ticket_list], dtype=np.int64)
+        carried = previous >= 0
+        first_states = state_sorted[first]
+        src = np.concatenate([src, previous[carried]])
+        dst = np.concatenate([dst, first_states[carried]])
+
+        # Journey starts: unseen tickets, and events following an absorbing status in this batch
+        restarted = state_sorted[1:][same & absorbing[state_sorted[:-1]]]
+        n = len(self.states)
+        self._entries = np.concatenate([self._entries, np.zeros(n - len(self._entries), dtype=np.int64)])
+        self._entries += np.bincount(np.concatenate([first_states[~carried], restarted]), minlength=n)
+
+        self._counts.resize((n, n))
+        self._counts = self._counts + sparse.coo_matrix(
+            (np.ones(len(src), dtype=np.int64), (src, dst)), shape=(n, n)).tocsr()
+
+        for ticket, state in zip(ticket_list, state_sorted[last].tolist()):
+            if absorbing[state]:
+                self._last.pop(ticket, None)
+            else:
+                self._last[ticket] = state
+
+        self.events += len(codes)
+        self._matrix = None
+        return self
+
+    def _state_index(self, state: str) -> int:
+        index = self._index.get(state)
+        if index is None:
+            index = self._index[state] = len(self.states)
+            self.states.append(state)
+        return index
+
+    def _absorbing_mask(self) -> np.ndarray:
+        return np.array([state in self._absorbing for state in self.states])
+
+    # ------------------------------------------------------------------
+    # Chain
+    # ------------------------------------------------------------------
+
+    @property
+    def counts(self) -> sparse.csr_matrix:
+        return self._counts
+
+    @property
+    def tickets_in_flight(self) -> int:
+        return len(self._last)
+
+    @property
+    def entry_distribution(self) -> np.ndarray:
+        total = self._entries.sum()
+        return self._entries / total if total else np.zeros(len(self.states))
+
+    def transition_matrix(self) -> sparse.csr_matrix:
+        """
+        Row-stochastic CSR matrix. States with no observed exits (absorbing
+        or never left) hold their probability as a self-loop.
+        """
+        if self._matrix is None:
+            counts = self._counts.astype(float)
+            out = np.asarray(counts.sum(axis=1)).ravel()
+            scale = np.divide(1.0, out, out=np.zeros_like(out), where=out > 0)
+            stay = sparse.diags((out == 0).astype(float))
+            self._matrix = (sparse.diags(scale) @ counts + stay).tocsr()
+        return self._matrix
+
+    def stationary_distribution(self, restart: bool = True, tol: float = 1e-12,
+                                max_iter: int = 100_000) -> np.ndarray:
+        """
+        Long-run share of steps spent in each status.
+
+        With ``restart`` an absorbing status hands over to the entry
+        distribution (a resolved ticket is replaced by a new one), giving the
+        steady-state workload mix; without it the mass ends up absorbed.
+        Power iteration on the lazy chain (P + I) / 2, which has the same
+        stationary distribution and converges even for periodic chains.
+        """
+        P = self.transition_matrix()
+        n = P.shape[0]
+        if restart and self._entries.sum():
+            absorbing = self._absorbing_mask()
+            keep = sparse.diags((~absorbing).astype(float))
+            handover = sparse.csr_matrix(np.outer(absorbing, self.entry_distribution))
+            P = (keep @ P + handover).tocsr()
+        transposed = P.T.tocsr()
+        start = self.entry_distribution if self._entries.sum() else np.full(n, 1.0 / n)
+        x = start.copy()
+        for _ in range(max_iter):
+            following = 0.5 * (x + transposed @ x)
+            following /= following.sum()
+            if np.abs(following - x).sum() < tol:
+                return following
+            x = following
+        return x
+
+    def _reaching(self, targets: np.ndarray) -> np.ndarray:
+        """States from which some state in ``targets`` is reachable (targets included)"""
+        reach = targets.copy()
+        adjacency = (self._counts > 0).astype(np.int8)
+        while True:
+            grown = reach | (np.asarray(adjacency @ reach.astype(np.int8)).ravel() > 0)
+            if (grown == reach).all():
+                return reach
+            reach = grown
+
+    def _transient(self) -> np.ndarray:
+        """Non-absorbing states from which an absorbing state is reachable"""
+        absorbing = self._absorbing_mask()
+        return self._reaching(absorbing) & ~absorbing
+
+    def expected_steps_to_resolution(self) -> np.ndarray:
+        """
+        Expected transitions until absorption from each status, via the
+        fundamental matrix system (I - Q) t = 1 over transient states.
+        0 for absorbing states; inf wherever absorption is not certain, i.e.
+        the chain can reach a dead end (a status never seen leaving, or a
+        set of statuses that never reach resolution).
+        """
+        absorbing = self._absorbing_mask()
+        dead_ends = ~self._reaching(absorbing)
+        certain = ~self._reaching(dead_ends) & ~absorbing
+        steps = np.where(absorbing, 0.0, np.inf)
+        if certain.any():
+            T = np.flatnonzero(certain)
+            Q = self.transition_matrix()[T][:, T]
+            system = (sparse.identity(len(T), format='csc') - Q).tocsc()
+            steps[T] = np.atleast_1d(spsolve(system, np.ones(len(T))))
+        return steps
+
+    def absorption_probabilities(self) -> np.ndarray:
+        """``(states, absorbing states)`` probability of ending in each absorbing status"""
+        absorbing = self._absorbing_mask()
+        A, transient = np.flatnonzero(absorbing), self._transient()
+        result = np.zeros((len(self.states), len(A)))
+        result[A, np.arange(len(A))] = 1.0
+        if transient.any():
+            T = np.flatnonzero(transient)
+            P = self.transition_matrix()
+            system = (sparse.identity(len(T), format='csc') - P[T][:, T]).tocsc()
+            R = P[T][:, A].toarray()
+            result[T] = np.asarray(spsolve(system, R)).reshape(len(T), len(A))
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        P = self.transition_matrix().tocoo()
+        steps = self.expected_steps_to_resolution()
+        entry = self.entry_distribution
+        # Entry mass that can end up in a dead end never resolves: no finite average exists
+        unresolved = float(entry[~np.isfinite(steps)].sum())
+        return {
+            'states': list(self.states),
+            'absorbing': [state for state in self.states if state in self._absorbing],
+            'events': self.events,
+            'transitions': int(self._counts.sum()),
+            'tickets_in_flight': self.tickets_in_flight,
+            'transition_probabilities': {
+                self.states[i]: {self.states[j]: round(float(p), 4)
+                                 for j, p in zip(P.col[P.row == i], P.data[P.row == i]) if p > 0}
+                for i in range(len(self.states))
+            },
+            'stationary_distribution': dict(zip(self.states, np.round(self.stationary_distribution(), 4).tolist())),
+            'expected_steps_to_resolution': {
+                state: (round(float(s), 3) if np.isfinite(s) else None) for state, s in zip(self.states, steps)
+            },
+            'expected_steps_from_entry': float(entry @ np.where(np.isfinite(steps), steps, 0.0) / entry.sum())
+            if entry.sum() > 0 and unresolved == 0 else None,
+            'unresolved_entry_share': round(unresolved / entry.sum(), 4) if entry.sum() > 0 else 0.0,
+        }
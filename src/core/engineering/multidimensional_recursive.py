@@ -5,9 +5,11 @@ Quantum-inspired decomposition for BPO optimization
 
 import numpy as np
 from typing import Dict, List, Any, Callable
-from dataclass import dataclass
+from dataclasses import dataclass
 import math
 
+from .erlang import get_erlang_staffing
+
 @dataclass
 class RecursiveResult:
     """Result container for recursive operations"""
@@ -443,8 +445,9 @@ class BPOValidationEngine:
         agents = data['agents']
         aht = data['aht']
         
-        # Theorem 1: Workload distribution
-        optimal_agents = math.ceil(calls * aht / 28800)  # 8-hour day
+        # Theorem 1: Workload distribution, Erlang C staffing for 80% answered in 20s
+        staffing = get_erlang_staffing()
+        optimal_agents = int(staffing.required_agents(calls / 8, aht, interval_seconds=3600))  # 8-hour day
         
         # Theorem 2: Efficiency bound
         max_efficiency = 0.85  # 85% maximum practical utilization
@@ -454,7 +457,8 @@ class BPOValidationEngine:
         optimized_cost = optimal_agents * 25000
         
         return {
-            'theorem_1': f'Optimal agents for {calls} calls: {optimal_agents} (current: {agents})',
+            'theorem_1': f'Optimal agents for {calls} calls: {optimal_agents} '
+                         f'(Erlang C {staffing.service_level:.0%}/{staffing.answer_seconds:.0f}s; current: {agents})',
             'theorem_2': f'Maximum practical agent utilization: {max_efficiency*100:.1f}%',
             'theorem_3': f'Potential cost savings: PHP {baseline_cost - optimized_cost:,.0f}/month',
             'verification': 'All theorems validated with current BPO metrics'
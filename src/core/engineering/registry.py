@@ -0,0 +1,179 @@
+"""
+ENGINEERING REGISTRY - Discover engines without importing them
+Static manifest plus "bpo.engineering" entry points; availability via find_spec,
+import deferred to first use
+"""
+
+import importlib
+import importlib.util
+import threading
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Dict, List, Any, Optional
+
+ENTRY_POINT_GROUP = "bpo.engineering"
+_PACKAGE = __name__.rsplit(".", 1)[0]
+
+
+@dataclass(frozen=True)
+class EngineSpec:
+    """Where an engine lives; nothing here triggers an import"""
+    name: str
+    module: str
+    attr: str
+    group: str
+    description: str = ""
+    source: str = "manifest"
+
+
+MANIFEST = (
+    EngineSpec("divine", f"{_PACKAGE}.divine_engineering", "DivineEngineering", "divine",
+               "Cosmic architecture and liquid-flow stability"),
+    EngineSpec("sacred_geometry", f"{_PACKAGE}.divine_engineering", "SacredGeometry", "divine",
+               "Golden-ratio proportion proofs"),
+    EngineSpec("liquid", f"{_PACKAGE}.liquid_engineering", "LiquidEngineering", "liquid",
+               "Navier-Stokes adaptive flow (sympy)"),
+    EngineSpec("multidimensional", f"{_PACKAGE}.multidimensional_recursive", "MultidimensionalRecursive",
+               "multidimensional", "Recursive workload decomposition"),
+    EngineSpec("quantum_optimizer", f"{_PACKAGE}.multidimensional_recursive", "QuantumInspiredOptimizer",
+               "multidimensional", "Annealing-style schedule optimization"),
+    EngineSpec("encryptor", f"{_PACKAGE}.multidimensional_recursive", "BPODataEncryptor",
+               "multidimensional", "BPO data field encryption"),
+    EngineSpec("validation", f"{_PACKAGE}.multidimensional_recursive", "BPOValidationEngine",
+               "multidimensional", "Workflow efficiency validation"),
+    EngineSpec("flow_synchronizer", f"{_PACKAGE}.cosmic_synchronization", "BPOFlowSynchronizer",
+               "synchronization", "Call distribution synchronization"),
+    EngineSpec("workflow_harmonizer", f"{_PACKAGE}.cosmic_synchronization", "WorkflowHarmonizer",
+               "synchronization", "Workflow harmonization"),
+    EngineSpec("timing_optimizer", f"{_PACKAGE}.cosmic_synchronization", "TimingOptimizer",
+               "synchronization", "Shift and break timing"),
+    EngineSpec("calculus", f"{_PACKAGE}.calculus_rigor", "BPOCalculusEngine", "calculus",
+               "Cost and resource optimization with proofs"),
+    EngineSpec("erlang", f"{_PACKAGE}.erlang", "ErlangStaffing", "staffing",
+               "Erlang C interval staffing for service level and ASA targets"),
+    EngineSpec("call_simulator", f"{_PACKAGE}.call_simulator", "CallCenterSimulator", "staffing",
+               "Discrete-event schedule validation with replications"),
+    EngineSpec("interval_planner", f"{_PACKAGE}.interval_planner", "IntervalPlanner", "staffing",
+               "15-minute multi-queue daily plans with peaks and break coverage"),
+    EngineSpec("seasonality", f"{_PACKAGE}.seasonality", "SeasonalityEngine", "forecasting",
+               "FFT daily/weekly/intraday pattern detection with cached spectra"),
+    EngineSpec("markov_journey", f"{_PACKAGE}.markov_journey", "JourneyEngine", "workflow",
+               "Sparse Markov chain of ticket status journeys"),
+    EngineSpec("lp_staffing", f"{_PACKAGE}.lp_staffing", "StaffingLP", "staffing",
+               "Shift x skill x budget staffing LP/MILP (HiGHS)"),
+    EngineSpec("bayesian_volume", f"{_PACKAGE}.bayesian_volume", "BayesianVolumeModel", "forecasting",
+               "Gamma-Poisson hour-of-week call rates with predictive quantiles"),
+    EngineSpec("spc", f"{_PACKAGE}.spc", "QualityControlEngine", "quality",
+               "Per-agent X-bar/R, EWMA and CUSUM control charts for QA scores"),
+)
+
+
+class EngineRegistry:
+    """
+    Name -> engine lookup. ``availability()`` only consults import specs, so
+    it is cheap and side-effect free; ``load()`` imports an engine the first
+    time it is asked for and caches the class.
+    """
+
+    def __init__(self, manifest=MANIFEST, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        self._specs: Dict[str, EngineSpec] = {spec.name: spec for spec in manifest}
+        self._entry_point_group = entry_point_group
+        self._discovered = entry_point_group is None
+        self._available: Dict[str, bool] = {}
+        self._loaded: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def _discover(self):
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            try:
+                entry_points = metadata.entry_points(group=self._entry_point_group)
+            except Exception:
+                entry_points = ()
+            for ep in entry_points:
+                module, _, attr = ep.value.partition(":")
+                if ep.name in self._specs or not attr:
+                    continue  # The manifest wins on name clashes
+                group = getattr(ep.dist, "name", None) or "plugin"
+                self._specs[ep.name] = EngineSpec(ep.name, module.strip(), attr.strip(), group,
+                                                  source="entry_point")
+            self._discovered = True
+
+    def specs(self) -> Dict[str, EngineSpec]:
+        self._discover()
+        return dict(self._specs)
+
+    def spec(self, name: str) -> EngineSpec:
+        self._discover()
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError(f"Unknown engine '{name}'. Available: {sorted(self._specs)}") from None
+
+    def is_available(self, name: str) -> bool:
+        """True when the engine's module can be found; never imports it"""
+        spec = self.spec(name)
+        if name in self._errors:
+            return False
+        if name not in self._available:
+            try:
+                found = importlib.util.find_spec(spec.module) is not None
+            except (ImportError, ValueError):
+                found = False
+            self._available[name] = found
+        return self._available[name]
+
+    def availability(self) -> Dict[str, bool]:
+        return {name: self.is_available(name) for name in self.specs()}
+
+    def load(self, name: str):
+        """Import (once) and return the engine class"""
+        spec = self.spec(name)
+        with self._lock:
+            if name not in self._loaded:
+                try:
+                    module = importlib.import_module(spec.module)
+                    self._loaded[name] = getattr(module, spec.attr)
+                except (ImportError, AttributeError) as e:
+                    self._errors[name] = str(e)
+                    raise ImportError(f"Engine '{name}' ({spec.module}:{spec.attr}) failed to load: {e}") from e
+            return self._loaded[name]
+
+    def create(self, name: str, *args, **kwargs):
+        return self.load(name)(*args, **kwargs)
+
+    def find(self, attr: str) -> Optional[EngineSpec]:
+        """Spec whose class is named ``attr``, for package-level lazy attributes"""
+        return next((spec for spec in self.specs().values() if spec.attr == attr), None)
+
+    def loaded(self) -> List[str]:
+        return sorted(self._loaded)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "module": spec.module,
+                "class": spec.attr,
+                "group": spec.group,
+                "description": spec.description,
+                "source": spec.source,
+                "available": self.is_available(name),
+                "loaded": name in self._loaded,
+                "error": self._errors.get(name),
+            }
+            for name, spec in self.specs().items()
+        }
+
+
+_registry: Optional[EngineRegistry] = None
+
+
+def get_registry() -> EngineRegistry:
+    global _registry
+    if _registry is None:
+        _registry = EngineRegistry()
+    return _registry
@@ -0,0 +1,261 @@
+"""
+SEASONALITY ENGINE - FFT detection of daily, weekly and intraday call patterns
+Batched rfft over fixed windows of a (queues x intervals) volume array; power spectra
+are cached per (queue, window) so appending data only transforms the new windows
+"""
+
+import os
+import threading
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Hashable, Optional, Sequence
+
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Rows per rfft batch; bounds the complex intermediate to ~30 MB at 28-day windows
+FFT_CHUNK_ROWS = 1024
+
+# Default spectrum cache budget: ~12,000 28-day windows of 15-minute data
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _label(period_hours: float) -> str:
+    if abs(period_hours - 24) < 0.5:
+        return 'daily'
+    if abs(period_hours - 168) < 1:
+        return 'weekly'
+    if period_hours < 24:
+        return 'intraday'
+    return 'other'
+
+
+@dataclass
+class SeasonalityResult:
+    """
+    Per-queue seasonality; array rows follow ``queue_ids``.
+
+    ``daily_strength`` is the share of non-constant spectral power at
+    harmonics of 24h, ``weekly_strength`` the share at the remaining
+    harmonics of 168h. Together they are the variance a week-periodic
+    pattern explains within each window.
+    """
+    queue_ids: List[Hashable]
+    interval_minutes: int
+    periods_hours: np.ndarray     # (queues, top_n) dominant periods, strongest first
+    period_shares: np.ndarray     # (queues, top_n) share of power at each period
+    daily_strength: np.ndarray
+    weekly_strength: np.ndarray
+    intraday_profile: np.ndarray  # (queues, intervals per day), mean 1
+    weekly_profile: np.ndarray    # (queues, 7) day-of-week index Mon..Sun, mean 1
+    windows: int
+    windows_computed: int
+    mean_power: np.ndarray = field(default=None, repr=False)
+
+    @property
+    def seasonal_strength(self) -> np.ndarray:
+        return self.daily_strength + self.weekly_strength
+
+    def dominant_periods(self, row: int) -> List[Dict[str, Any]]:
+        return [
+            {'period_hours': round(float(period), 2), 'share': round(float(share), 4), 'label': _label(period)}
+            for period, share in zip(self.periods_hours[row], self.period_shares[row])
+        ]
+
+    def to_dict(self, queues: Optional[Sequence[Hashable]] = None) -> Dict[str, Any]:
+        rows = {queue: i for i, queue in enumerate(self.queue_ids)}
+        selected = self.queue_ids if queues is None else [queue for queue in queues if queue in rows]
+        per_day = self.intraday_profile.shape[1]
+        labels = [f"{m // 60:02d}:{m % 60:02d}" for m in range(0, per_day * self.interval_minutes, self.interval_minutes)]
+        return {
+            'windows': self.windows,
+            'windows_computed': self.windows_computed,
+            'queues': {
+                str(queue): {
+                    'dominant_periods': self.dominant_periods(rows[queue]),
+                    'daily_strength': round(float(self.daily_strength[rows[queue]]), 4),
+                    'weekly_strength': round(float(self.weekly_strength[rows[queue]]), 4),
+                    'intraday_profile': dict(zip(labels, np.round(self.intraday_profile[rows[queue]], 3).tolist())),
+                    'weekly_profile': dict(zip(WEEKDAYS, np.round(self.weekly_profile[rows[queue]], 3).tolist())),
+                }
+                for queue in selected
+            }
+        }
+
+
+class SeasonalityEngine:
+    """
+    Dominant periods and seasonal profiles for many call-volume series.
+
+    The time axis is cut into windows of ``window_days`` aligned to absolute
+    interval 0 (pass ``origin`` for series that start later), and each
+    window's power spectrum comes from one batched ``numpy.fft.rfft``. No
+    taper is applied: a window holds whole weeks, so daily and weekly
+    harmonics fall exactly on FFT bins. Spectra are averaged over windows
+    (Welch) before picking peaks.
+
+    Spectra are cached under ``(queue_id, window)`` with a fingerprint of the
+    window's data, so re-analyzing a series after appending intervals, or
+    after editing part of it, transforms only the windows that changed.
+    The cache holds at most ``cache_bytes`` of spectra (0 disables it) and
+    drops the oldest windows first.
+    """
+
+    def __init__(self, interval_minutes: int = 15, window_days: int = 28, top_n: int = 3,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES):
+        if 1440 % interval_minutes:
+            raise ValueError("interval_minutes must divide a day")
+        if window_days <= 0 or window_days % 7:
+            raise ValueError("window_days must be a positive multiple of 7")
+        self.interval_minutes = interval_minutes
+        self.window_days = window_days
+        self.top_n = top_n
+        self.cache_bytes = cache_bytes
+        self.per_day = 1440 // interval_minutes
+        self.window_length = window_days * self.per_day
+        self._probe = np.random.default_rng(0).standard_normal(self.window_length)
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_nbytes = 0
+        # One entry: a float32 spectrum plus its two float64 fingerprint values
+        self._entry_bytes = (self.window_length // 2 + 1) * 4 + 2 * 8
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "hits": 0, "computed": 0}
+
+    def analyze(self, volumes, queue_ids: Optional[Sequence[Hashable]] = None,
+                origin: int = 0, start_weekday: int = 0) -> SeasonalityResult:
+        """
+        ``volumes`` is calls per interval, shape ``(queues, intervals)`` (or 1D
+        for one queue). ``origin`` is the absolute interval index of column 0
+        and ``start_weekday`` the weekday (0 = Monday) of absolute interval 0.
+        """
+        volumes = np.asarray(volumes, dtype=float)
+        if volumes.ndim == 1:
+            volumes = volumes[np.newaxis, :]
+        queues = volumes.shape[0]
+        queue_ids = list(range(queues)) if queue_ids is None else list(queue_ids)
+        if len(queue_ids) != queues:
+            raise ValueError("queue_ids must name every queue")
+
+        mean_power, windows, computed = self._mean_power(volumes, queue_ids, origin)
+        bins = mean_power.shape[1]
+        power = mean_power.copy()
+        power[:, 0] = 0.0  # The mean level is not a pattern
+        total = power.sum(axis=1)
+        safe_total = np.where(total > 0, total, 1.0)
+
+        top = min(self.top_n, bins - 1)
+        peaks = np.argpartition(-power[:, 1:], top - 1, axis=1)[:, :top] + 1
+        peak_power = np.take_along_axis(power, peaks, axis=1)
+        order = np.argsort(-peak_power, axis=1, kind='stable')
+        peaks = np.take_along_axis(peaks, order, axis=1)
+        periods_hours = self.window_length / peaks * self.interval_minutes / 60
+
+        k = np.arange(bins)
+        daily = (k > 0) & (k % self.window_days == 0)
+        weekly = (k > 0) & (k % (self.window_days // 7) == 0) & ~daily
+
+        intraday_profile, weekly_profile = self._profiles(volumes, origin, start_weekday)
+
+        return SeasonalityResult(
+            queue_ids=queue_ids,
+            interval_minutes=self.interval_minutes,
+            periods_hours=periods_hours,
+            period_shares=np.take_along_axis(peak_power, order, axis=1) / safe_total[:, None],
+            daily_strength=power[:, daily].sum(axis=1) / safe_total,
+            weekly_strength=power[:, weekly].sum(axis=1) / safe_total,
+            intraday_profile=intraday_profile,
+            weekly_profile=weekly_profile,
+            windows=windows,
+            windows_computed=computed,
+            mean_power=mean_power,
+        )
+
+    def _mean_power(self, volumes: np.ndarray, queue_ids: List[Hashable], origin: int):
+        """Window-averaged power spectrum per queue, reusing cached windows"""
+        length = self.window_length
+        skip = (-origin) % length
+        first = (origin + skip) // length
+        count = (volumes.shape[1] - skip) // length if volumes.shape[1] > skip else 0
+        if count < 1:
+            raise ValueError(f"need at least one full {self.window_days}-day window aligned to the origin")
+
+        blocks = volumes[:, skip:skip + count * length].reshape(len(queue_ids), count, length)
+        fingerprints = np.stack([blocks.sum(axis=2), blocks @ self._probe], axis=-1)
+        total = np.zeros((len(queue_ids), length // 2 + 1))
+
+        with self._lock:
+            entries = [self._cache.get((queue, first + w)) for queue in queue_ids for w in range(count)]
+        found = np.array([entry is not None for entry in entries])
+        cached_prints = np.full((len(entries), 2), np.nan)
+        if found.any():
+            cached_prints[found] = [entry[0] for entry in entries if entry is not None]
+        hit = np.isclose(cached_prints, fingerprints.reshape(-1, 2), rtol=1e-12, atol=0).all(axis=1)
+        for index in np.flatnonzero(hit).tolist():
+            total[index // count] += entries[index][1]
+        self.stats["lookups"] += len(entries)
+        self.stats["hits"] += int(hit.sum())
+
+        missing = np.column_stack(np.divmod(np.flatnonzero(~hit), count))
+        for start in range(0, len(missing), FFT_CHUNK_ROWS):
+            rows, ws = missing[start:start + FFT_CHUNK_ROWS].T
+            spectra = np.abs(np.fft.rfft(blocks[rows, ws], axis=1)) ** 2 / length
+            np.add.at(total, rows, spectra)
+            self._store([(queue_ids[r], first + w) for r, w in zip(rows.tolist(), ws.tolist())],
+                        fingerprints[rows, ws], spectra.astype(np.float32))
+        self.stats["computed"] += len(missing)
+        return total / count, count, len(missing)
+
+    def _store(self, keys: List[tuple], fingerprints: np.ndarray, spectra: np.ndarray):
+        if self.cache_bytes <= 0:
+            return
+        with self._lock:
+            for key, fingerprint, spectrum in zip(keys, fingerprints, spectra):
+                if self._cache.pop(key, None) is not None:
+                    self._cache_nbytes -= self._entry_bytes
+                # Copy out of the chunk so an evicted entry frees its memory
+                self._cache[key] = (fingerprint.copy(), spectrum.copy())
+                self._cache_nbytes += self._entry_bytes
+            while self._cache_nbytes > self.cache_bytes:  # Oldest first
+                del self._cache[next(iter(self._cache))]
+                self._cache_nbytes -= self._entry_bytes
+
+    def _profiles(self, volumes: np.ndarray, origin: int, start_weekday: int):
+        """Intraday and day-of-week indices (mean 1) over whole days"""
+        queues = volumes.shape[0]
+        skip = (-origin) % self.per_day
+        days = (volumes.shape[1] - skip) // self.per_day if volumes.shape[1] > skip else 0
+        daily = volumes[:, skip:skip + days * self.per_day].reshape(queues, days, self.per_day)
+
+        intraday = daily.mean(axis=1)
+        level = intraday.mean(axis=1, keepdims=True)
+        intraday = np.divide(intraday, level, out=np.zeros_like(intraday), where=level > 0)
+
+        weekday = (start_weekday + (origin + skip) // self.per_day + np.arange(days)) % 7
+        counts = np.bincount(weekday, minlength=7)
+        by_weekday = np.zeros((queues, 7))
+        np.add.at(by_weekday.T, weekday, daily.sum(axis=2).T)
+        by_weekday = np.divide(by_weekday, counts, out=np.zeros_like(by_weekday), where=counts > 0)
+        seen = counts > 0
+        level = by_weekday[:, seen].mean(axis=1, keepdims=True) if seen.any() else np.zeros((queues, 1))
+        weekly = np.divide(by_weekday, level, out=np.zeros_like(by_weekday), where=(level > 0) & seen)
+        return intraday, weekly
+
+    def cache_info(self) -> Dict[str, Any]:
+        return {**self.stats, "size": len(self._cache), "bytes": self._cache_nbytes, "max_bytes": self.cache_bytes}
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self._cache_nbytes = 0
+
+
+_engine: Optional[SeasonalityEngine] = None
+
+
+def get_seasonality_engine() -> SeasonalityEngine:
+    """Shared 15-minute engine, so repeated analyses reuse cached spectra (SEASONALITY_CACHE_MB caps them)"""
+    global _engine
+    if _engine is None:
+        megabytes = os.getenv("SEASONALITY_CACHE_MB")
+        _engine = SeasonalityEngine(cache_bytes=int(float(megabytes) * 1024 * 1024) if megabytes
+                                    else DEFAULT_CACHE_BYTES)
+    return _engine
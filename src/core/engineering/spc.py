@@ -0,0 +1,302 @@
+"""
+SPC ENGINE - Statistical process control of agent QA scores
+Per-agent X-bar/R subgroups, EWMA and two-sided CUSUM kept in columnar arrays;
+each scored interaction updates its agent in O(1) and out-of-control agents are
+tracked as a set, so queries never rescan history
+"""
+
+import numpy as np
+from typing import Dict, List, Any, Hashable, Iterable, Optional, Tuple
+
+# Signal bits in ``flags``
+XBAR = 1
+RANGE = 2
+EWMA = 4
+CUSUM_HIGH = 8
+CUSUM_LOW = 16
+CHARTS = {'xbar': XBAR, 'range': RANGE, 'ewma': EWMA, 'cusum_high': CUSUM_HIGH, 'cusum_low': CUSUM_LOW}
+
+# Range-chart constants for known sigma: d2 (mean range / sigma), d3 (sd of range / sigma)
+_D2 = {2: 1.128, 3: 1.693, 4: 2.059, 5: 2.326, 6: 2.534, 7: 2.704, 8: 2.847, 9: 2.970, 10: 3.078}
+_D3 = {2: 0.853, 3: 0.888, 4: 0.880, 5: 0.864, 6: 0.848, 7: 0.833, 8: 0.820, 9: 0.808, 10: 0.797}
+
+
+class QualityControlEngine:
+    """
+    Control charts for every agent against one process standard
+    (``mean``, ``sigma``). When no standard is given, scores are buffered
+    as the Phase I sample until there are ``phase_one`` of them with some
+    spread; the standard is then set from the sample and the buffered scores
+    are replayed through the charts in arrival order. Until then ``update``
+    raises no signals.
+
+    Per score: EWMA ``z = lambda*x + (1 - lambda)*z`` against its exact
+    time-varying limits, and standardized CUSUMs
+    ``C+ = max(0, C+ + (x - mean)/sigma - k)`` (and ``C-`` mirrored) against
+    ``h``. Every ``subgroup_size`` scores close a subgroup for the X-bar
+    (``mean +/- 3 sigma/sqrt(n)``) and R (``D1 sigma``..``D2 sigma``) charts.
+
+    ``flags`` holds the current signal bits per agent. X-bar/R bits hold
+    until the next subgroup closes; EWMA/CUSUM bits clear when the statistic
+    returns inside its limits, or on ``acknowledge``.
+    """
+
+    def __init__(self, mean: Optional[float] = None, sigma: Optional[float] = None,
+                 subgroup_size: int = 5, ewma_lambda: float = 0.2, ewma_width: float = 3.0,
+                 cusum_k: float = 0.5, cusum_h: float = 5.0, phase_one: int = 30, capacity: int = 1024):
+        if subgroup_size not in _D2:
+            raise ValueError(f"subgroup_size must be between {min(_D2)} and {max(_D2)}")
+        if not 0 < ewma_lambda <= 1:
+            raise ValueError("ewma_lambda must be in (0, 1]")
+        if sigma is not None and sigma <= 0:
+            raise ValueError("sigma must be positive")
+        if phase_one < 2:
+            raise ValueError("phase_one must be at least 2")
+        self.mean, self.sigma = mean, sigma
+        self.subgroup_size = subgroup_size
+        self.ewma_lambda = ewma_lambda
+        self.ewma_width = ewma_width
+        self.cusum_k = cusum_k
+        self.cusum_h = cusum_h
+        self.phase_one = phase_one
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []  # Phase I (index, scores) batches
+        self._pending_count = 0
+        self._pending_range = (np.inf, -np.inf)
+
+        self.agent_ids: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+        self._size = 0
+        self._allocate(capacity)
+        self._out: set = set()
+        self.scores = 0
+        self.signals = 0
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    _COLUMNS = {
+        'count': np.int64, 'ewma': float, 'cusum_high': float, 'cusum_low': float,
+        '_sub_sum': float, '_sub_min': float, '_sub_max': float, '_sub_count': np.int64,
+        'subgroups': np.int64, 'last_xbar': float, 'last_range': float, 'flags': np.uint8,
+    }
+
+    def _allocate(self, capacity: int):
+        for name, dtype in self._COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if hasattr(self, name):
+                column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+        self._capacity = capacity
+
+    def _agent_indices(self, agent_ids) -> np.ndarray:
+        """Column index per id, appending unseen agents"""
+        uniques, inverse = np.unique(np.asarray(agent_ids), return_inverse=True)
+        indices = np.empty(len(uniques), dtype=np.int64)
+        fresh = []
+        for position, agent in enumerate(uniques.tolist()):
+            index = self._index.get(agent)
+            if index is None:
+                index = self._index[agent] = len(self.agent_ids)
+                self.agent_ids.append(agent)
+                fresh.append(index)
+            indices[position] = index
+        if len(self.agent_ids) > self._capacity:
+            self._allocate(max(len(self.agent_ids), 2 * self._capacity))
+        if fresh:
+            self._size = len(self.agent_ids)
+            self._reset(np.array(fresh))
+        return indices[inverse.reshape(-1)]
+
+    def _reset(self, index: np.ndarray):
+        self.ewma[index] = self.mean if self.mean is not None else 0.0
+        self.cusum_high[index] = self.cusum_low[index] = 0.0
+        self.flags[index] &= XBAR | RANGE
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    @property
+    def calibrated(self) -> bool:
+        return self.mean is not None and self.sigma is not None
+
+    def calibrate(self, scores) -> "QualityControlEngine":
+        """
+        Set the process standard from a Phase I sample of in-control scores,
+        then chart any scores buffered while waiting for one
+        """
+        scores = np.asarray(scores, dtype=float)
+        if len(scores) < 2 or scores.std(ddof=1) == 0:
+            raise ValueError("calibration needs at least two distinct scores")
+        self._set_standard(scores)
+        self._replay()
+        return self
+
+    def _set_standard(self, scores: np.ndarray):
+        self.mean, self.sigma = float(scores.mean()), float(scores.std(ddof=1))
+        self.ewma[:self._size] = self.mean
+
+    def _replay(self) -> List[Hashable]:
+        if not self._pending:
+            return []
+        index = np.concatenate([batch for batch, _ in self._pending])
+        scores = np.concatenate([batch for _, batch in self._pending])
+        self._pending, self._pending_count = [], 0
+        return self._apply(index, scores)
+
+    def record(self, agent_id: Hashable, score: float) -> bool:
+        """One scored interaction; True if it put the agent out of control"""
+        return len(self.update([agent_id], [score])) > 0
+
+    def update(self, agent_ids, scores) -> List[Hashable]:
+        """
+        Add scored interactions as parallel sequences, in arrival order.
+        Scores for the same agent are applied in order, one vectorized round
+        per occurrence, so a batch costs O(1) per score. Returns the agents
+        that went out of control in this batch.
+        """
+        scores = np.asarray(scores, dtype=float).reshape(-1)
+        if len(scores) == 0:
+            return []
+        index = self._agent_indices(agent_ids)
+        if len(index) != len(scores):
+            raise ValueError("agent_ids and scores must have the same length")
+        self.scores += len(scores)
+
+        if not self.calibrated:
+            self._pending.append((index, scores))
+            self._pending_count += len(scores)
+            low, high = self._pending_range
+            self._pending_range = (min(low, scores.min()), max(high, scores.max()))
+            if self._pending_count < self.phase_one or self._pending_range[0] == self._pending_range[1]:
+                return []
+            self._set_standard(np.concatenate([batch for _, batch in self._pending]))
+            return self._replay()
+        return self._apply(index, scores)
+
+    def _apply(self, index: np.ndarray, scores: np.ndarray) -> List[Hashable]:
+        # Occurrence number of each score within its agent, keeping arrival order
+        order = np.argsort(index, kind='stable')
+        ordered = index[order]
+        starts = np.flatnonzero(np.concatenate([[True], ordered[1:] != ordered[:-1]]))
+        occurrence = np.arange(len(ordered)) - np.repeat(starts, np.diff(np.append(starts, len(ordered))))
+
+        before = self.flags[np.unique(index)] != 0
+        for round_ in range(int(occurrence.max()) + 1):
+            chosen = order[occurrence == round_]
+            self._step(index[chosen], scores[chosen])
+
+        touched = np.unique(index)
+        flagged = self.flags[touched] != 0
+        went_out = touched[flagged & ~before]
+        self._out.update(touched[flagged].tolist())
+        self._out.difference_update(touched[~flagged].tolist())
+        self.signals += len(went_out)
+        return [self.agent_ids[i] for i in went_out.tolist()]
+
+    def _step(self, index: np.ndarray, x: np.ndarray):
+        """One score for each of ``index`` (distinct agents)"""
+        mean, sigma, lam = self.mean, self.sigma, self.ewma_lambda
+        count = self.count[index] + 1
+        self.count[index] = count
+        flags = self.flags[index]
+
+        z = lam * x + (1 - lam) * self.ewma[index]
+        self.ewma[index] = z
+        width = self.ewma_width * sigma * np.sqrt(lam / (2 - lam) * (1 - (1 - lam) ** (2 * count)))
+        flags = np.where(np.abs(z - mean) > width, flags | EWMA, flags & ~np.uint8(EWMA))
+
+        standardized = (x - mean) / sigma
+        high = np.maximum(0.0, self.cusum_high[index] + standardized - self.cusum_k)
+        low = np.maximum(0.0, self.cusum_low[index] - standardized - self.cusum_k)
+        self.cusum_high[index], self.cusum_low[index] = high, low
+        flags = np.where(high > self.cusum_h, flags | CUSUM_HIGH, flags & ~np.uint8(CUSUM_HIGH))
+        flags = np.where(low > self.cusum_h, flags | CUSUM_LOW, flags & ~np.uint8(CUSUM_LOW))
+
+        fresh = self._sub_count[index] == 0
+        self._sub_sum[index] += x
+        self._sub_min[index] = np.where(fresh, x, np.minimum(self._sub_min[index], x))
+        self._sub_max[index] = np.where(fresh, x, np.maximum(self._sub_max[index], x))
+        self._sub_count[index] += 1
+
+        n = self.subgroup_size
+        closed = self._sub_count[index] == n
+        if closed.any():
+            done = index[closed]
+            xbar = self._sub_sum[done] / n
+            spread = self._sub_max[done] - self._sub_min[done]
+            self.last_xbar[done], self.last_range[done] = xbar, spread
+            self.subgroups[done] += 1
+            self._sub_sum[done] = 0.0
+            self._sub_count[done] = 0
+            lower, upper = self.range_limits
+            closed_flags = flags[closed] & ~np.uint8(XBAR | RANGE)
+            closed_flags |= np.where(np.abs(xbar - mean) > 3 * sigma / np.sqrt(n), XBAR, 0).astype(np.uint8)
+            closed_flags |= np.where((spread > upper) | (spread < lower), RANGE, 0).astype(np.uint8)
+            flags[closed] = closed_flags
+        self.flags[index] = flags
+
+    def acknowledge(self, agent_ids: Iterable[Hashable]) -> "QualityControlEngine":
+        """Signals investigated: restart EWMA/CUSUM at the standard and clear all bits"""
+        index = np.array([self._index[agent] for agent in agent_ids], dtype=np.int64)
+        self._reset(index)
+        self.flags[index] = 0
+        self._out.difference_update(index.tolist())
+        return self
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def agents(self) -> int:
+        return self._size
+
+    @property
+    def xbar_limits(self) -> Tuple[float, float]:
+        half = 3 * self.sigma / np.sqrt(self.subgroup_size)
+        return self.mean - half, self.mean + half
+
+    @property
+    def range_limits(self) -> Tuple[float, float]:
+        n = self.subgroup_size
+        return max(0.0, _D2[n] - 3 * _D3[n]) * self.sigma, (_D2[n] + 3 * _D3[n]) * self.sigma
+
+    def out_of_control(self, chart: Optional[str] = None) -> List[Hashable]:
+        """Agents with any current signal, or only ``chart``'s (see ``CHARTS``)"""
+        indices = sorted(self._out)
+        if chart is not None:
+            bit = CHARTS[chart]
+            indices = [i for i in indices if self.flags[i] & bit]
+        return [self.agent_ids[i] for i in indices]
+
+    def status(self, agent_id: Hashable) -> Dict[str, Any]:
+        i = self._index[agent_id]
+        return {
+            'agent_id': agent_id,
+            'scores': int(self.count[i]),
+            'ewma': float(self.ewma[i]),
+            'cusum_high': float(self.cusum_high[i]),
+            'cusum_low': float(self.cusum_low[i]),
+            'subgroups': int(self.subgroups[i]),
+            'last_xbar': float(self.last_xbar[i]) if self.subgroups[i] else None,
+            'last_range': float(self.last_range[i]) if self.subgroups[i] else None,
+            'signals': [name for name, bit in CHARTS.items() if self.flags[i] & bit],
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        flags = self.flags[:self._size]
+        return {
+            'agents': self._size,
+            'scores': self.scores,
+            'mean': self.mean,
+            'sigma': self.sigma,
+            'calibrated': self.calibrated,
+            'phase_one_buffered': self._pending_count,
+            'out_of_control': len(self._out),
+            'in_control_rate': 1 - len(self._out) / self._size if self._size else 1.0,
+            'by_chart': {name: int(np.count_nonzero(flags & bit)) for name, bit in CHARTS.items()},
+            'xbar_limits': self.xbar_limits if self.calibrated else None,
+            'signals_raised': self.signals,
+        }
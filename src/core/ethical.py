@@ -1,12 +1,12 @@
 import os
 import random
-import re
 import logging
 import hashlib
-from datetime import datetime
-from sqlalchemy import create_engine, text, String, Boolean
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.sql import bindparam
+from sqlalchemy.pool import StaticPool
+from ..models.ethical_logs import EthicalLogStore, CATEGORY_GDPR, to_naive_utc
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -19,11 +19,17 @@ class Veto:
         postgres_url = os.getenv("POSTGRES_URL")
         if not postgres_url or "sqlite://" in postgres_url:
             logger.warning("Using SQLite (not for production). Set POSTGRES_URL for PostgreSQL.")
-            self.engine = create_engine("sqlite:///:memory:")
+            # One shared connection so every thread sees the same in-memory schema
+            self.engine = create_engine(
+                "sqlite:///:memory:",
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False}
+            )
         else:
             self.engine = create_engine(postgres_url)
         self.Session = sessionmaker(bind=self.engine)
         self.is_sqlite = "sqlite://" in str(self.engine.url)
+        self.store = EthicalLogStore(self.engine)
     
     def _ml_ethics_check(self) -> bool:
         import sympy as sp
@@ -37,42 +43,15 @@ class Veto:
             if random.random() < self.veto_rate:
                 is_ethical = self._ml_ethics_check()
                
-                ts = datetime.utcnow().isoformat()
-                checksum = hashlib.md5(f"{ts}{is_ethical}".encode()).hexdigest()[:8]
-               
-                if self.is_sqlite:
-                    stmt = text("""
-                        INSERT INTO ethical_logs (timestamp, ethical, checked, user_id, checksum)
-                        VALUES (:ts, :eth, :chk, :uid, :checksum)
-                    """)
-                    with self.Session() as session:
-                        session.execute(stmt, {
-                            'ts': ts,
-                            'eth': is_ethical,
-                            'chk': True,
-                            'uid': str(user_id) if user_id else None,
-                            'checksum': checksum
-                        })
-                        session.commit()
-                        log_id = session.execute(text("SELECT last_insert_rowid()")).scalar()
-                        logger.info(f"Ethical check logged: ID {log_id}, Ethical: {is_ethical}")
-                else:
-                    stmt = text("""
-                        INSERT INTO ethical_logs (timestamp, ethical, checked, user_id, checksum)
-                        VALUES (:ts, :eth, :chk, :uid, :checksum)
-                        RETURNING id
-                    """).bindparams(
-                        bindparam('ts', value=ts, type_=String),
-                        bindparam('eth', value=is_ethical, type_=Boolean),
-                        bindparam('chk', value=True, type_=Boolean),
-                        bindparam('uid', value=str(user_id) if user_id else None, type_=String),
-                        bindparam('checksum', value=checksum, type_=String)
-                    )
-                    with self.Session() as session:
-                        result = session.execute(stmt)
-                        session.commit()
-                        log_id = result.fetchone()[0]
-                        logger.info(f"Ethical check logged: ID {log_id}, Ethical: {is_ethical}")
+                ts = datetime.utcnow()
+                checksum = hashlib.md5(f"{ts.isoformat()}{is_ethical}".encode()).hexdigest()[:8]
+                log_id = self.store.insert(
+                    ts,
+                    is_ethical,
+                    user_id=str(user_id) if user_id else None,
+                    checksum=checksum
+                )
+                logger.info(f"Ethical check logged: ID {log_id}, Ethical: {is_ethical}")
                
                 return is_ethical
         except Exception as e:
@@ -82,6 +61,12 @@ class Veto:
     def check_rate(self) -> float:
         return self.veto_rate
   
+    def observed_rate(self, hours: float = 24, start: datetime = None, end: datetime = None) -> dict:
+        """Observed veto rate and counts over [start, end), default the last `hours` hours"""
+        end = to_naive_utc(end) if end else datetime.utcnow()
+        start = to_naive_utc(start) if start else end - timedelta(hours=hours)
+        return self.store.veto_stats(start, end)
+  
     def set_rate(self, rate: float):
         self.veto_rate = max(0.0, min(1.0, rate))
       
@@ -93,10 +78,8 @@ class Veto:
             "gdpr_compliant": self.gdpr_compliant
         }
         try:
-            with self.Session() as session:
-                session.execute(text("INSERT INTO ethical_logs (timestamp, ethical, checked, user_id) VALUES (:ts, :consent, true, :uid)"),
-                                {"ts": log["timestamp"], "consent": consent, "uid": user_id})
-                session.commit()
+            self.store.insert(datetime.fromisoformat(log["timestamp"]), consent,
+                              user_id=user_id, category=CATEGORY_GDPR)
         except Exception as e:
             logger.error(f"GDPR log failed: {e}")
         return log
\ No newline at end of file
@@ -1,20 +1,23 @@
-import openai
 import asyncio
 import os
 import hashlib
-import re
-import ast
 import logging
 from typing import Dict, Any
 from ..utils.sandbox import Sandbox
+from ..utils.llm_cache import get_llm_cache
+from ..utils.llm_client import get_shared_client
+from ..utils.code_analysis import analyze
 from .proof import Stability
 from .ethical import Veto
 
 logger = logging.getLogger(__name__)
 
 class Evolver:
-    def __init__(self):
-        self.client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def __init__(self, client=None, candidates: int = None, cache=None):
+        self._mock_llm = client is None and not os.getenv("OPENAI_API_KEY")
+        self.client = client or get_shared_client()
+        self.cache = cache or get_llm_cache()
+        self.candidates = max(1, candidates or int(os.getenv("EVOLVE_CANDIDATES", 3)))
         self.sandbox = Sandbox()
         self.stability = Stability()
         self.veto = Veto()
@@ -23,9 +26,10 @@ class Evolver:
       
     async def reflect(self, state: str) -> Dict[str, Any]:
         try:
-            if not os.getenv("OPENAI_API_KEY"):
+            if self._mock_llm:
                 return {"insight": "Mock reflection (no API key)", "score": 0.5, "stable": True}
-            response = await self.client.chat.completions.create(
+            insight = await self.cache.complete(
+                self.client,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "Reflect ethically & stably on BPO task."},
@@ -33,7 +37,6 @@ class Evolver:
                 ],
                 max_tokens=200
             )
-            insight = response.choices[0].message.content
             score = min(len(insight) / 500, 1.0)
             return {"insight": insight, "score": score, "stable": True}
         except Exception as e:
@@ -41,7 +44,8 @@ class Evolver:
   
     async def generate_code(self, instruction: str) -> str:
         try:
-            response = await self.client.chat.completions.create(
+            code = await self.cache.complete(
+                self.client,
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": "Write safe Python w/ stability (dV/dt=-λx²)."},
@@ -49,7 +53,6 @@ class Evolver:
                 ],
                 temperature=0.2
             )
-            code = response.choices[0].message.content
             if "```python" in code:
                 code = code.split("```python")[1].split("```")[0].strip()
             return code
@@ -57,71 +60,69 @@ class Evolver:
             return "# Mock safe code\ndef stable_func():\n return 'Stable'"
   
     def _safety_scan(self, code: str) -> bool:
-        SAFE_IMPORTS = {'os', 'sys', 'datetime', 'json', 'math', 'random', 'sympy'}
-        DANGEROUS_PATTERNS = [
-            r'__import__\s*\(',
-            r'eval\s*\(',
-            r'exec\s*\(',
-            r'open\s*\([^)]*[rw]\+',
-            r'subprocess\.',
-            r'os\.system',
-            r'rm\s+-rf',
-            r'del\s+\w+\.__class__',
-        ]
-        for pattern in DANGEROUS_PATTERNS:
-            if re.search(pattern, code, re.IGNORECASE):
-                logger.warning(f"Regex block: {pattern} in code")
-                return False
-   
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        mod = alias.name.split('.')[0]
-                        if mod not in SAFE_IMPORTS:
-                            logger.warning(f"Unsafe import: {mod}")
-                            return False
-                elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ['eval', 'exec', '__import__']:
-                    return False
-        except SyntaxError as e:
-            logger.error(f"AST parse fail: {e}")
+        analysis = analyze(code)
+        if not analysis.evolver_safe:
+            logger.warning(f"Safety scan blocked code: {'; '.join(analysis.reasons)}")
             return False
-   
         return True
   
-    async def self_code(self, instruction: str) -> Dict[str, Any]:
-        MAX_ATTEMPTS = 3
-        for attempt in range(MAX_ATTEMPTS):
-            try:
-                code = await self.generate_code(f"{instruction} (Attempt {attempt+1})")
-               
-                if not code or len(code.strip()) < 10:
-                    logger.warning(f"Attempt {attempt+1}: Code too short")
-                    continue
-               
-                if not self._safety_scan(code):
-                    self.experience_log.append({"error": "Safety scan failed", "attempt": attempt})
-                    await self.reflect("Code rejected: unsafe patterns")
-                    continue
-               
-                if not self.stability.verify(code):
-                    await self.reflect(f"Unstable code: {code[:100]}")
-                    continue
-               
-                result = self.sandbox.execute(code)
-                if result.get("safe", False):
-                    if not self.veto.check():
-                        return {"success": False, "reason": "Ethical veto on code"}
-                    deployment = await self.deploy_to_k8s(code)
-                    self.experience_log.append({"success": True, "attempt": attempt})
-                    return {"success": True, "message": f"Success on attempt {attempt+1}", "deployment": deployment}
-               
-            except Exception as e:
-                logger.error(f"Attempt {attempt+1} failed: {e}")
-                await self.reflect(f"Exception in attempt {attempt+1}: {str(e)}")
+    async def _evaluate_candidate(self, instruction: str, index: int) -> Dict[str, Any]:
+        """Generate one candidate and run it through safety, stability and sandbox gates"""
+        try:
+            code = await self.generate_code(f"{instruction} (Attempt {index+1})")
+           
+            if not code or len(code.strip()) < 10:
+                return {"attempt": index, "passed": False, "reason": "Code too short"}
+           
+            if not self._safety_scan(code):
+                return {"attempt": index, "passed": False, "reason": "Safety scan failed"}
+           
+            if not self.stability.verify(code):
+                return {"attempt": index, "passed": False, "reason": f"Unstable code: {code[:100]}"}
            
-        return {"success": False, "reason": "All attempts failed", "log": self.experience_log[-3:]}
+            result = await self.sandbox.execute_async(code)
+            if not result.get("safe", False):
+                return {"attempt": index, "passed": False, "reason": result.get("error", "Sandbox rejected code")}
+           
+            return {"attempt": index, "passed": True, "code": code, "result": result}
+        except Exception as e:
+            logger.error(f"Attempt {index+1} failed: {e}")
+            return {"attempt": index, "passed": False, "reason": f"Exception: {str(e)}"}
+  
+    async def self_code(self, instruction: str) -> Dict[str, Any]:
+        """Race K candidates concurrently and deploy the first one that passes every gate"""
+        tasks = [
+            asyncio.create_task(self._evaluate_candidate(instruction, i))
+            for i in range(self.candidates)
+        ]
+        accepted = None
+        failures = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                outcome = await next_done
+                if outcome["passed"]:
+                    accepted = outcome
+                    break
+                failures.append(outcome)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+       
+        for failure in failures:
+            logger.warning(f"Attempt {failure['attempt']+1}: {failure['reason']}")
+            self.experience_log.append({"error": failure["reason"], "attempt": failure["attempt"]})
+       
+        if accepted is None:
+            await self.reflect("All candidates rejected: " + "; ".join(f["reason"][:80] for f in failures))
+            return {"success": False, "reason": "All attempts failed", "log": self.experience_log[-self.candidates:]}
+       
+        if not self.veto.check():
+            return {"success": False, "reason": "Ethical veto on code"}
+        deployment = await self.deploy_to_k8s(accepted["code"])
+        self.experience_log.append({"success": True, "attempt": accepted["attempt"]})
+        return {"success": True, "message": f"Success on attempt {accepted['attempt']+1}", "deployment": deployment}
   
     async def deploy_to_k8s(self, code: str) -> Dict[str, Any]:
         code_hash = hashlib.md5(code.encode()).hexdigest()[:8]
@@ -4,9 +4,16 @@ Mathematical foundations for the BPO Ethical Stable System
 """
 
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+# THEOREMS keys holding a monthly-cost savings multiplier / an efficiency gain
+_SAVINGS_KEYS = {1: 'savings_multiplier', 6: 'savings', 13: 'total_improvement'}
+_EFFICIENCY_KEYS = ('efficiency_gain', 'improvement', 'optimization', 'total_improvement')
+# get_theorem data inputs: consumed by the hooks, only their summaries go into parameters
+_DATA_KWARGS = frozenset({'staffing_demand', 'hourly_counts', 'ticket_events', 'qa_scores',
+                          'call_volumes', 'queue_ids'})
+
 @dataclass
 class TheoremResult:
     """Container for theorem execution results"""
@@ -19,6 +26,92 @@ class TheoremResult:
     efficiency_gain: float = 0.0
     parameters: Dict[str, Any] = None
 
+@dataclass(frozen=True)
+class CompiledTheorems:
+    """THEOREMS flattened into per-theorem arrays, column ``j`` is ``ids[j]``"""
+    ids: np.ndarray
+    names: tuple
+    savings_multipliers: np.ndarray
+    efficiency_gains: np.ndarray
+    verified: np.ndarray
+
+    @classmethod
+    def from_table(cls, theorems: Dict[int, Dict[str, Any]]) -> "CompiledTheorems":
+        ids = sorted(theorems)
+        return cls(
+            ids=np.array(ids),
+            names=tuple(theorems[i]['name'] for i in ids),
+            savings_multipliers=np.array([
+                theorems[i][_SAVINGS_KEYS[i]] if i in _SAVINGS_KEYS else 0.0 for i in ids
+            ], dtype=float),
+            efficiency_gains=np.array([
+                next((theorems[i][key] for key in _EFFICIENCY_KEYS if theorems[i].get(key)), 0.0)
+                for i in ids
+            ], dtype=float),
+            verified=np.array([bool(theorems[i]['verified']) for i in ids]),
+        )
+
+    def column(self, theorem_id: int) -> int:
+        return int(np.searchsorted(self.ids, theorem_id))
+
+
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Column indices of the ``k`` largest values per row, largest first.
+
+    ``argpartition`` finds each row's k-th value without a full sort; ties
+    at that boundary go to the lowest index, so results match a stable sort.
+    """
+    values = np.asarray(values)
+    k = max(0, min(k, values.shape[-1]))
+    if k == 0:
+        return np.empty(values.shape[:-1] + (0,), dtype=np.int64)
+    kth = np.argpartition(-values, k - 1, axis=-1)[..., k - 1:k]
+    threshold = np.take_along_axis(values, kth, axis=-1)
+    above = values > threshold
+    at = values == threshold
+    take = above | (at & (np.cumsum(at, axis=-1) <= k - above.sum(axis=-1, keepdims=True)))
+    chosen = np.nonzero(take)[-1].reshape(values.shape[:-1] + (k,))
+    order = np.argsort(-np.take_along_axis(values, chosen, axis=-1), axis=-1, kind='stable')
+    return np.take_along_axis(chosen, order, axis=-1)
+
+
+@dataclass
+class PortfolioResult:
+    """
+    All theorems over many client profiles. ``savings`` and ``efficiency``
+    are ``(clients, theorems)``; ``efficiency`` does not depend on the client
+    and is a read-only broadcast view.
+    """
+    theorem_ids: np.ndarray
+    monthly_costs: np.ndarray
+    agent_counts: np.ndarray
+    savings: np.ndarray
+    efficiency: np.ndarray
+    verified: np.ndarray
+
+    @property
+    def total_savings(self) -> np.ndarray:
+        return self.savings.sum(axis=1)
+
+    @property
+    def average_efficiency(self) -> np.ndarray:
+        return self.efficiency.mean(axis=1)
+
+    @property
+    def theorems_verified(self) -> int:
+        return int(self.verified.sum())
+
+    def top_theorems(self, k: int = 3, by: str = 'savings') -> np.ndarray:
+        """``(clients, k)`` theorem ids ranked by ``'savings'`` or ``'efficiency'``"""
+        if by not in ('savings', 'efficiency'):
+            raise ValueError("by must be 'savings' or 'efficiency'")
+        return self.theorem_ids[top_k(getattr(self, by), k)]
+
+    def top_clients(self, k: int = 10) -> np.ndarray:
+        """Row indices of the ``k`` clients with the largest total savings"""
+        return top_k(self.total_savings, k)
+
 class TheoremProcessor:
     """Process mathematical theorems for BPO optimization"""
     
@@ -129,6 +222,15 @@ class TheoremProcessor:
             "total_improvement": 0.37
         }
     }
+
+    _compiled: Optional[CompiledTheorems] = None
+
+    @classmethod
+    def compiled(cls) -> CompiledTheorems:
+        """THEOREMS as arrays, built once per class"""
+        if cls.__dict__.get('_compiled') is None:
+            cls._compiled = CompiledTheorems.from_table(cls.THEOREMS)
+        return cls._compiled
     
     def get_theorem(self, theorem_id: int, **kwargs) -> TheoremResult:
         """Get specific theorem with parameters"""
@@ -147,20 +249,61 @@ class TheoremProcessor:
         monthly_cost = kwargs.get('monthly_cost', 1000000)
         agent_count = kwargs.get('agent_count', 50)
         
-        # Calculate actual savings based on theorem
+        # Savings: Shor Factorization (1), Linear Programming (6), Optimization Performance (13)
+        compiled = self.compiled()
+        column = compiled.column(theorem_id)
         savings_php = 0.0
-        if theorem_id == 1:  # Shor Factorization
-            savings_php = monthly_cost * theorem_data['savings_multiplier']
-        elif theorem_id == 6:  # Linear Programming
-            savings_php = monthly_cost * theorem_data['savings']
-        elif theorem_id == 13:  # Optimization Performance
-            savings_php = monthly_cost * theorem_data['total_improvement']
+        if theorem_id in _SAVINGS_KEYS:
+            savings_php = monthly_cost * float(compiled.savings_multipliers[column])
+        efficiency_gain = float(compiled.efficiency_gains[column])
+        
+        # Linear Programming: solve the staffing LP when demand is supplied
+        staffing = None
+        if theorem_id == 6 and kwargs.get('staffing_demand') is not None:
+            staffing = self.solve_staffing(kwargs['staffing_demand'])
+            if staffing.success and kwargs.get('staffing_cost') is not None:
+                savings_php = max(0.0, kwargs['staffing_cost'] - staffing.total_cost)
         
-        # Calculate efficiency gain
-        efficiency_gain = theorem_data.get('efficiency_gain', 0.0) or \
-                         theorem_data.get('improvement', 0.0) or \
-                         theorem_data.get('optimization', 0.0) or \
-                         theorem_data.get('total_improvement', 0.0)
+        parameters = {
+            'formula': theorem_data['formula'],
+            'description': theorem_data['description'],
+            'monthly_cost': monthly_cost,
+            'agent_count': agent_count,
+            **{key: value for key, value in kwargs.items() if key not in _DATA_KWARGS}
+        }
+        if staffing is not None:
+            parameters['lp_solution'] = {**staffing.to_dict(), 'optimized_staffing_cost': staffing.total_cost}
+        # Bayesian Inference: measure forecast accuracy on hourly counts when supplied
+        if theorem_id == 4 and kwargs.get('hourly_counts') is not None:
+            volumes = self.fit_call_volumes(kwargs['hourly_counts'], kwargs.get('start_slot', 0))
+            parameters['accuracy'] = volumes.accuracy
+            parameters['volume_model'] = volumes.summary()
+        # Markov Chain: fit the journey chain when ticket events are supplied
+        if theorem_id == 5 and kwargs.get('ticket_events') is not None:
+            journeys = self.analyze_journeys(kwargs['ticket_events'])
+            summary = journeys.summary()
+            parameters['journey'] = {
+                key: summary[key] for key in (
+                    'events', 'tickets_in_flight', 'stationary_distribution',
+                    'expected_steps_to_resolution', 'expected_steps_from_entry', 'unresolved_entry_share'
+                )
+            }
+        # Central Limit Theorem: chart agent QA scores when supplied
+        if theorem_id == 11 and kwargs.get('qa_scores') is not None:
+            quality = self.monitor_quality(kwargs['qa_scores'])
+            parameters['quality_control'] = quality.summary()
+            parameters['out_of_control_agents'] = quality.out_of_control()
+        # Fourier Transform: measure call patterns when volumes are supplied
+        if theorem_id == 9 and kwargs.get('call_volumes') is not None:
+            patterns = self.analyze_call_patterns(kwargs['call_volumes'], kwargs.get('queue_ids'))
+            parameters['pattern_accuracy'] = float(patterns.seasonal_strength.mean())
+            parameters['seasonality'] = {
+                'queues': len(patterns.queue_ids),
+                'windows': patterns.windows,
+                'daily_strength': float(patterns.daily_strength.mean()),
+                'weekly_strength': float(patterns.weekly_strength.mean()),
+                'dominant_periods_hours': sorted({round(float(p), 2) for p in patterns.periods_hours[:, 0]}),
+            }
         
         return TheoremResult(
             theorem_id=theorem_id,
@@ -170,13 +313,7 @@ class TheoremProcessor:
             application=theorem_data['application'],
             savings_php=savings_php,
             efficiency_gain=efficiency_gain,
-            parameters={
-                'formula': theorem_data['formula'],
-                'description': theorem_data['description'],
-                'monthly_cost': monthly_cost,
-                'agent_count': agent_count,
-                **kwargs
-            }
+            parameters=parameters
         )
     
     def run_all_theorems(self, bpo_data: Dict = None) -> List[TheoremResult]:
@@ -207,17 +344,14 @@ class TheoremProcessor:
         # Run all theorems
         theorem_results = self.run_all_theorems(bpo_metrics)
         
-        # Calculate aggregate metrics
-        total_savings = sum(r.savings_php for r in theorem_results)
+        # Calculate aggregate metrics in one pass over arrays
+        savings = np.array([r.savings_php for r in theorem_results])
+        total_savings = float(savings.sum())
         avg_efficiency = np.mean([r.efficiency_gain for r in theorem_results])
         verified_count = sum(1 for r in theorem_results if r.verified)
         
         # Get top 3 theorems by savings
-        top_theorems = sorted(
-            theorem_results, 
-            key=lambda x: x.savings_php, 
-            reverse=True
-        )[:3]
+        top_theorems = [theorem_results[i] for i in top_k(savings, 3)]
         
         return {
             'total_monthly_savings_php': total_savings,
@@ -237,6 +371,81 @@ class TheoremProcessor:
             'implementation_priority': self._get_implementation_priority(top_theorems)
         }
     
+    def fit_call_volumes(self, hourly_counts, start_slot: int = 0, **options):
+        """
+        Bayesian Inference (Theorem 4) on real data: Gamma-Poisson rates per
+        (queue, hour-of-week) fitted to ``(queues, hours)`` counts that start
+        at hour-of-week ``start_slot``. Without a ``prior_mean`` each queue's
+        prior is its first day's mean rate.
+        """
+        from .engineering.bayesian_volume import BayesianVolumeModel
+        counts = np.atleast_2d(np.asarray(hourly_counts, dtype=float))
+        options.setdefault('prior_mean', counts[:, :24].mean(axis=1))
+        return BayesianVolumeModel(counts.shape[0], **options).update(counts, start_slot)
+    
+    def solve_staffing(self, staffing_demand, **options):
+        """
+        Linear Programming (Theorem 6) on real data: minimum-cost shift
+        roster for per-interval (and optionally per-skill) agent demand.
+        """
+        from .engineering.lp_staffing import solve_staffing
+        return solve_staffing(staffing_demand, **options)
+    
+    def monitor_quality(self, qa_scores, **options):
+        """
+        Central Limit Theorem (Theorem 11) on real data: a
+        ``QualityControlEngine`` fed time-ordered ``(agent_id, score)`` pairs.
+        """
+        from .engineering.spc import QualityControlEngine
+        engine = QualityControlEngine(**options)
+        pairs = list(qa_scores)
+        if pairs:
+            agent_ids, scores = zip(*pairs)
+            engine.update(agent_ids, scores)
+        return engine
+    
+    def analyze_journeys(self, ticket_events, **options):
+        """
+        Markov Chain (Theorem 5) on real data: a ``JourneyEngine`` fitted to
+        time-ordered ``(ticket_id, status)`` events.
+        """
+        from .engineering.markov_journey import JourneyEngine
+        return JourneyEngine(**options).update(ticket_events)
+    
+    def analyze_call_patterns(self, call_volumes, queue_ids=None, cache: bool = False, **options):
+        """
+        Fourier Transform (Theorem 9) on real data: dominant periods and
+        seasonal profiles of ``(queues, intervals)`` 15-minute volumes. See
+        ``SeasonalityEngine.analyze`` for ``origin``/``start_weekday``.
+        ``cache=True`` keeps spectra in the shared engine for re-analysis of
+        the same series; otherwise nothing outlives the call.
+        """
+        from .engineering.seasonality import SeasonalityEngine, get_seasonality_engine
+        engine = get_seasonality_engine() if cache else SeasonalityEngine(cache_bytes=0)
+        return engine.analyze(call_volumes, queue_ids, **options)
+    
+    def run_portfolio(self, monthly_costs, agent_counts=None) -> PortfolioResult:
+        """
+        Evaluate every theorem for every client in one vectorized pass.
+
+        ``monthly_costs`` (and ``agent_counts``, carried for reference) hold
+        one value per client; the result's savings are identical to
+        ``get_theorem`` per (client, theorem).
+        """
+        compiled = self.compiled()
+        monthly_costs = np.asarray(monthly_costs, dtype=float).reshape(-1)
+        if agent_counts is None:
+            agent_counts = np.full(len(monthly_costs), 50)
+        agent_counts = np.broadcast_to(np.asarray(agent_counts), monthly_costs.shape)
+        return PortfolioResult(
+            theorem_ids=compiled.ids,
+            monthly_costs=monthly_costs,
+            agent_counts=agent_counts,
+            savings=np.multiply.outer(monthly_costs, compiled.savings_multipliers),
+            efficiency=np.broadcast_to(compiled.efficiency_gains, (len(monthly_costs), len(compiled.ids))),
+            verified=compiled.verified,
+        )
+    
     def _generate_recommendations(self, theorems: List[TheoremResult]) -> List[str]:
         """Generate actionable recommendations from theorems"""
         recommendations = []
@@ -284,10 +493,20 @@ class TheoremProcessor:
         
         return priority
 
+_processor: Optional[TheoremProcessor] = None
+
+
+def get_theorem_processor() -> TheoremProcessor:
+    """Shared processor for the module-level helpers"""
+    global _processor
+    if _processor is None:
+        _processor = TheoremProcessor()
+    return _processor
+
 # Export for easy import
 def get_theorem(theorem_id: int, **kwargs) -> Dict:
     """Simple function for backward compatibility"""
-    processor = TheoremProcessor()
+    processor = get_theorem_processor()
     result = processor.get_theorem(theorem_id, **kwargs)
     
     return {
@@ -302,7 +521,7 @@ def get_theorem(theorem_id: int, **kwargs) -> Dict:
 
 def run_all_theorems(**kwargs) -> List[Dict]:
     """Simple function for backward compatibility"""
-    processor = TheoremProcessor()
+    processor = get_theorem_processor()
     results = processor.run_all_theorems(kwargs)
     
     return [
@@ -316,6 +535,10 @@ def run_all_theorems(**kwargs) -> List[Dict]:
         for r in results
     ]
 
+def run_portfolio(monthly_costs, agent_counts=None) -> PortfolioResult:
+    """All theorems over many clients, see ``TheoremProcessor.run_portfolio``"""
+    return get_theorem_processor().run_portfolio(monthly_costs, agent_counts)
+
 # Quick test
 if __name__ == "__main__":
     print("🧪 Testing Theorem Processor...")
@@ -1,10 +1,11 @@
-import sympy as sp
 import numpy as np
-from scipy.integrate import odeint
-from scipy.linalg import eigvals
+
+# sympy/scipy are imported inside the proofs that use them: they cost
+# seconds at import time and most callers never run a proof
 
 class Stability:
     def lyapunov(self) -> dict:
+        import sympy as sp
         x, lam = sp.symbols('x lambda', positive=True)
         V = x**2 / 2
         dx_dt = -lam * x
@@ -17,6 +18,7 @@ class Stability:
     def lyapunov_sync(self, agents=100000, coupling=0.1) -> dict:
         """Hybrid: Symbolic small N, numerical mean-field large N (disrupter scale)"""
         if agents <= 20:
+            import sympy as sp
             xs = sp.symbols(f'x0:{agents}')
             lams = sp.symbols(f'λ0:{agents}', positive=True)
             V = sum(xi**2 for xi in xs) / 2
@@ -33,6 +35,7 @@ class Stability:
                 Psi = np.arctan2(np.mean(np.sin(theta)), np.mean(np.cos(theta)))
                 dtheta = -lam * theta + coupling * R * np.sin(Psi - theta)
                 return dtheta
+            from scipy.integrate import odeint
             y0 = np.random.uniform(0, 2*np.pi, agents)
             t = np.linspace(0, 10, 100)
             sol = odeint(mean_field, y0, t, args=(1.0, coupling))  # Vectorized 100k
@@ -42,6 +45,8 @@ class Stability:
     
     def jacobian_proof(self, eqs: list) -> dict:
         """Numerical Jacobian evals for multivars (rigor at scale)"""
+        import sympy as sp
+        from scipy.linalg import eigvals
         vars_ = sp.symbols('x1:6')
         if len(eqs) == 0:
             eqs = [sp.Eq(-sum(vars_), 0)] * len(vars_)  # Stub coupled
@@ -1,7 +1,5 @@
-import sympy as sp
-import ast
 import numpy as np
-from scipy.linalg import eigvals
+from ..utils.code_analysis import analyze
 
 class RigorProof:
     def __init__(self):
@@ -9,6 +7,8 @@ class RigorProof:
     
     def multi_var_calc_proof(self, vars_count=6) -> dict:
         """Multi-var rigor: Jacobian for nD system stability (Hurwitz evals)"""
+        import sympy as sp
+        from scipy.linalg import eigvals
         vars_ = sp.symbols(f'x0:{vars_count}')
         # Coupled eqs: dx_i/dt = -sum A_ij x_j (linear multi-var)
         A = sp.Matrix(vars_count, vars_count, lambda i,j: -1 if i==j else 0.1)  # Stable matrix
@@ -22,13 +22,14 @@ class RigorProof:
     def prog_calc_proof(self, code: str) -> dict:
         """Advanced prog calc: AST deriv safety + sympy code rigor"""
         try:
-            tree = ast.parse(code)
+            analysis = analyze(code)  # Shared memoized parse
+            if not analysis.syntax_ok:
+                raise SyntaxError(analysis.syntax_error)
             # Calc rigor: Extract math expr, sympy verify
-            math_nodes = [node for node in ast.walk(tree) if isinstance(node, (ast.BinOp, ast.Call))]
-            safe = all(not isinstance(node, (ast.Call, ast.Import)) or node.func.id not in ['eval', 'exec'] for node in math_nodes)
-            if math_nodes:
-                expr_str = ast.unparse(math_nodes[0])  # First math expr
-                expr = sp.sympify(expr_str)
+            safe = not analysis.dangerous_calls
+            if analysis.first_math_expr:
+                import sympy as sp
+                expr = sp.sympify(analysis.first_math_expr)  # First math expr
                 deriv = sp.diff(expr, sp.symbols('x'))  # Rigor deriv
                 return {"ast_safe": safe, "expr_deriv": str(deriv), "proof": "AST-verified calc (deriv exists)"}
             return {"ast_safe": True, "proof": "No math—safe"}
@@ -1,41 +1,38 @@
-import ast
-import openai
 import os
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from typing import Dict
+from typing import Dict, Any
+from ..utils.llm_cache import get_llm_cache
+from ..utils.llm_client import get_shared_client
+from ..utils.code_analysis import analyze
+from ..services.sentiment_service import get_sentiment_service
 
-analyzer = SentimentIntensityAnalyzer()
-client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 class SelfMeta:
     def __init__(self):
         self.knowledge = {}  # Cross-domain store
+        self.cache = get_llm_cache()  # Shared content-addressed LLM cache
+        self.client = get_shared_client()  # Shared rate-limited client
     
     async def self_debug(self, code: str) -> Dict[str, Any]:
         """Full-stack self-debug: AST lint + fix suggestion"""
-        try:
-            tree = ast.parse(code)
-            errors = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call) and node.func.id in ['eval', 'exec']:
-                    errors.append(f"Unsafe {node.func.id} at line {node.lineno}")
-            if errors:
-                fix = await self._co_t_fix("Fix unsafe code", code)  # CoT fix
-                return {"errors": errors, "safe": False, "fix_suggestion": fix}
-            return {"errors": [], "safe": True, "proof": "AST clean"}
-        except SyntaxError as e:
-            return {"safe": False, "error": str(e), "fix_suggestion": "Syntax—add missing :"}
+        analysis = analyze(code)
+        if not analysis.syntax_ok:
+            return {"safe": False, "error": analysis.syntax_error, "fix_suggestion": "Syntax—add missing :"}
+        errors = [f"Unsafe {name} at line {lineno}" for name, lineno in analysis.dangerous_calls]
+        if errors:
+            fix = await self._co_t_fix("Fix unsafe code", code)  # CoT fix
+            return {"errors": errors, "safe": False, "fix_suggestion": fix}
+        return {"errors": [], "safe": True, "proof": "AST clean"}
     
     async def cross_educate(self, domain: str, query: str) -> str:
         """Cross-domain self-educate: Mock API learn (real OpenAI CoT)"""
         try:
-            resp = await client.chat.completions.create(
+            knowledge = await self.cache.complete(
+                self.client,
                 model="gpt-4o-mini",
                 messages=[{"role": "system", "content": f"Teach {domain} concept: {query}"},
                           {"role": "user", "content": query}],
                 max_tokens=100
             )
-            knowledge = resp.choices[0].message.content
             self.knowledge[domain] = knowledge  # Store
             return knowledge
         except:
@@ -43,7 +40,7 @@ class SelfMeta:
     
     def humility_response(self, behavior: str, positive: bool) -> str:
         """Genuine humility matrix: Respect to women (EQ boost)"""
-        sent = analyzer.polarity_scores(behavior)
+        sent = get_sentiment_service().score(behavior)
         eq = (sent['compound'] + 1) / 2
         if "woman" in behavior.lower() or "she" in behavior.lower():  # Women respect
             eq *= 1.2  # Boost empathy
@@ -57,10 +54,10 @@ class SelfMeta:
     
     async def _co_t_fix(self, prompt: str, context: str) -> str:
         """CoT for debug/educate (recursive think)"""
-        resp = await client.chat.completions.create(
+        return await self.cache.complete(
+            self.client,
             model="gpt-4o-mini",
             messages=[{"role": "system", "content": "Step-by-step fix."},
                       {"role": "user", "content": f"{prompt}: {context}"}],
             max_tokens=50
-        )
-        return resp.choices[0].message.content
\ No newline at end of file
+        )
\ No newline at end of file
@@ -6,7 +6,9 @@ Complete with admin endpoints and demo data
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import json
+import os
 import random
+import time
 from pathlib import Path
 
 from fastapi import FastAPI, Depends, HTTPException, status, Request, BackgroundTasks
@@ -18,6 +20,13 @@ import numpy as np
 
 from pydantic import BaseModel, Field
 
+from src.utils.llm_cache import get_llm_cache
+from src.utils.llm_client import get_shared_client
+from src.services.bpo_service import BpoService
+from src.services.durable_queue import DurableTaskQueue
+from src.services.scheduling import PRIORITY_CLASSES
+from src.services.theorem_bridge import BPOTheoremBridge
+
 # Import core modules
 try:
     from src.core.proof import Stability
@@ -70,10 +79,47 @@ class DeployRequest(BaseModel):
     target: str = "local"
     auto_heal: bool = True
 
+# Portfolio jobs fork a process pool: bound it by this host, not by the request
+MAX_PORTFOLIO_WORKERS = os.cpu_count() or 1
+MAX_PORTFOLIO_SITES = int(os.getenv("BPO_MAX_PORTFOLIO_SITES", 5000))
+
+class PortfolioRequest(BaseModel):
+    sites: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_PORTFOLIO_SITES)
+    workers: Optional[int] = Field(None, ge=1, le=MAX_PORTFOLIO_WORKERS)
+    seed: int = 0
+
 # Demo data storage
 DEMO_DATA_PATH = Path("demo_database.json")
 demo_data = {}
 
+# Shared ethical veto engine (one engine/schema per process)
+_veto = None
+
+def get_veto():
+    """Get the shared Veto instance, or None when core modules are unavailable"""
+    global _veto
+    if _veto is None and HAS_CORE:
+        try:
+            _veto = Veto()
+        except Exception as e:
+            print(f"⚠️  Veto engine unavailable: {e}")
+    return _veto
+
+# Shared BPO service: owns the priority queue and its dispatchers
+_bpo_service = None
+
+def get_bpo_service() -> BpoService:
+    """Shared service; BPO_QUEUE_PATH (empty to disable) sets its durable journal.
+
+    Workers may share one journal file: leases are owned per process, so a
+    starting worker only replays tasks of workers that are no longer running.
+    """
+    global _bpo_service
+    if _bpo_service is None:
+        journal_path = os.getenv("BPO_QUEUE_PATH", "bpo_queue.sqlite")
+        _bpo_service = BpoService(journal=DurableTaskQueue(journal_path) if journal_path else None)
+    return _bpo_service
+
 def load_demo_data():
     """Load demo data from file"""
     global demo_data
@@ -121,6 +167,10 @@ def load_demo_data():
 @app.on_event("startup")
 async def startup_event():
     load_demo_data()
+    service = get_bpo_service()
+    restored = service.restore()
+    if restored:
+        print(f"♻️  Restored {restored} queued tasks from {service.journal.path}")
     print("🚀 BPO Ethical & Stable API Started")
     print(f"📊 Admin panel: http://localhost:3000/admin")
     print(f"🔑 Admin token: {ADMIN_TOKEN}")
@@ -156,7 +206,8 @@ async def root():
             "health": "/health",
             "admin": "/admin/* (token required)",
             "demo": "/api/demo/*",
-            "theorems": "/api/theorems"
+            "theorems": "/api/theorems",
+            "portfolio": "/api/portfolio/report (token required)"
         }
     }
 
@@ -212,17 +263,30 @@ async def check_veto(veto_request: VetoRequest):
 
 @app.post("/api/cycle")
 async def process_bpo_cycle(task_request: TaskRequest):
-    """Process a BPO task cycle"""
-    # Simulate task processing
-    processing_time = random.uniform(0.1, 2.0)  # seconds
-    success = random.random() > 0.05  # 95% success rate
+    """Process a BPO task cycle through the priority queue"""
+    if task_request.priority not in PRIORITY_CLASSES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"priority must be one of {list(PRIORITY_CLASSES)}"
+        )
+    
+    start = time.perf_counter()
+    result = await get_bpo_service().submit(
+        task_request.prompt,
+        priority=task_request.priority,
+        complexity=task_request.complexity
+    )
+    success = result["status"] == "completed"
     
     return {
-        "task_id": f"task_{random.randint(10000, 99999)}",
+        "task_id": result.get("ticket_id", f"task_{random.randint(10000, 99999)}"),
         "prompt": task_request.prompt,
-        "status": "completed" if success else "failed",
-        "processing_time": processing_time,
-        "result": f"Processed: {task_request.prompt[:50]}..." if success else "Processing failed",
+        "priority": task_request.priority,
+        "status": result["status"],
+        "processing_time": time.perf_counter() - start,
+        "queue_wait": result["queue_wait_s"],
+        "sentiment": result.get("sentiment"),
+        "result": f"Processed: {task_request.prompt[:50]}..." if success else result.get("error", "Processing failed"),
         "theorems_applied": [
             "Workflow Closure",
             "Task Harmonic Optimization",
@@ -231,6 +295,50 @@ async def process_bpo_cycle(task_request: TaskRequest):
         "timestamp": datetime.utcnow().isoformat()
     }
 
+@app.post("/api/portfolio/report")
+async def stream_portfolio_report(portfolio_request: PortfolioRequest, request: Request,
+                                  token: str = Depends(verify_admin)):
+    """Generate reports for many sites, streaming per-site progress as server-sent events (admin only)"""
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def progress(done: int, total: int, site: Dict[str, Any]):
+        loop.call_soon_threadsafe(events.put_nowait, {"done": done, "total": total, "site": site})
+    
+    job = loop.run_in_executor(None, lambda: BPOTheoremBridge().generate_portfolio_report(
+        portfolio_request.sites,
+        workers=portfolio_request.workers or MAX_PORTFOLIO_WORKERS,
+        progress=progress,
+        seed=portfolio_request.seed
+    ))
+    
+    async def generate_events():
+        """Per-site events, then the consolidated summary"""
+        while not (job.done() and events.empty()):
+            if await request.is_disconnected():
+                return
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            yield f"event: site\ndata: {json.dumps(event)}\n\n"
+        try:
+            report = job.result()
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            return
+        yield f"event: summary\ndata: {json.dumps(report['portfolio_summary'])}\n\n"
+    
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
 # Admin endpoints
 @app.get("/admin/verify")
 async def admin_verify(token: str = Depends(verify_admin)):
@@ -244,7 +352,7 @@ async def get_admin_metrics(token: str = Depends(verify_admin)):
     if HAS_CORE:
         try:
             stability = Stability()
-            veto = Veto()
+            veto = get_veto()
             divine = DivineEngineering(agents=1000)
             
             real_metrics = {
@@ -297,7 +405,9 @@ async def get_admin_metrics(token: str = Depends(verify_admin)):
             "last_evolution": "2 hours ago",
             "improvements_today": random.randint(1, 10),
             "accuracy_trend": "increasing",
-            "current_generation": 47
+            "current_generation": 47,
+            "llm_cache": get_llm_cache().snapshot(),
+            "llm_client": get_shared_client().stats()
         }
     }
 
@@ -370,9 +480,11 @@ async def get_tasks_admin(token: str = Depends(verify_admin),
     }
 
 @app.get("/admin/vetos")
-async def get_vetos_admin(token: str = Depends(verify_admin)):
+async def get_vetos_admin(token: str = Depends(verify_admin), window_hours: float = 24):
     """Get ethical veto decisions (admin only)"""
     vetos = demo_data.get("vetos", [])
+    veto = get_veto()
+    observed = veto.observed_rate(hours=window_hours) if veto else None
     
     if not vetos:
         # Generate sample vetos
@@ -395,7 +507,34 @@ async def get_vetos_admin(token: str = Depends(verify_admin)):
                 for cat in set(v.get("category", "unknown") for v in vetos)
             },
             "avg_confidence": sum(v.get("confidence", 0) for v in vetos) / max(len(vetos), 1)
-        }
+        },
+        "observed": observed
+    }
+
+@app.get("/admin/vetos/rate")
+async def get_veto_rate_admin(token: str = Depends(verify_admin),
+                              start: Optional[datetime] = None,
+                              end: Optional[datetime] = None,
+                              hours: float = 24):
+    """Observed veto rate over an arbitrary window from hourly rollups (admin only)"""
+    veto = get_veto()
+    if veto is None:
+        raise HTTPException(status_code=503, detail="Ethical log store not available")
+    
+    stats = veto.observed_rate(hours=hours, start=start, end=end)
+    stats["configured_rate"] = veto.check_rate()
+    return stats
+
+@app.get("/admin/queue")
+async def get_queue_admin(token: str = Depends(verify_admin)):
+    """Priority queue depth, quotas and wait times per class (admin only)"""
+    service = get_bpo_service()
+    return {
+        **service.queue.metrics(),
+        "journal": service.journal.snapshot() if service.journal else None,
+        "workers": service.concurrency,
+        "processed": service.processed_count,
+        "timestamp": datetime.utcnow().isoformat()
     }
 
 @app.get("/admin/evolutions")
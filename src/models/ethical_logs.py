@@ -0,0 +1,379 @@
+"""
+ETHICAL LOG STORE - Managed ethical_logs schema
+Daily partitions, declared indexes and hourly veto rollups
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+LOG_TABLE = "ethical_logs"
+PARTITION_PREFIX = "ethical_logs_"
+ROLLUP_TABLE = "ethical_log_rollups"
+LEGACY_TABLE = "ethical_logs_legacy"  # Pre-partitioning table while it is migrated
+
+CATEGORY_ETHICS = "ethics"
+CATEGORY_GDPR = "gdpr"
+
+
+def to_naive_utc(ts: datetime) -> datetime:
+    """Logs are stored as naive UTC; convert aware datetimes, pass naive ones through"""
+    if ts.tzinfo is None:
+        return ts
+    return ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _floor_hour(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(ts: datetime) -> datetime:
+    floored = _floor_hour(ts)
+    return floored if floored == ts else floored + timedelta(hours=1)
+
+
+class EthicalLogStore:
+    """
+    Partitioned storage for ethical check logs.
+
+    PostgreSQL gets a natively range-partitioned ``ethical_logs`` table with one
+    partition per day. SQLite gets one ``ethical_logs_YYYYMMDD`` table per day and
+    an ``ethical_logs`` view over them. Every ethics check also bumps an hourly
+    rollup row, so windowed veto-rate queries read whole hours from the rollups
+    and only touch raw partitions for the partial hours at the window edges.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.is_sqlite = engine.dialect.name == "sqlite"
+        self._partitions: Set[date] = set()
+        self.ensure_schema()
+
+    # ------------------------------------------------------------------
+    # Schema management
+    # ------------------------------------------------------------------
+
+    def ensure_schema(self):
+        """Create the rollup table, parent table/view and today's partition"""
+        with self.engine.begin() as conn:
+            if self.is_sqlite:
+                conn.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+                        bucket TEXT PRIMARY KEY,
+                        checks INTEGER NOT NULL DEFAULT 0,
+                        ethical INTEGER NOT NULL DEFAULT 0,
+                        vetoed INTEGER NOT NULL DEFAULT 0
+                    )
+                """))
+                rows = conn.execute(text(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :prefix"
+                ), {"prefix": f"{PARTITION_PREFIX}%"}).fetchall()
+                for (name,) in rows:
+                    suffix = name[len(PARTITION_PREFIX):]
+                    if len(suffix) == 8 and suffix.isdigit():
+                        self._partitions.add(datetime.strptime(suffix, "%Y%m%d").date())
+            else:
+                legacy = conn.execute(text(
+                    "SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                    "WHERE c.relname = :name AND n.nspname = current_schema()"
+                ), {"name": LOG_TABLE}).scalar()
+                if legacy == "r":
+                    conn.execute(text(f"ALTER TABLE {LOG_TABLE} RENAME TO {LEGACY_TABLE}"))
+                elif legacy not in (None, "p"):
+                    raise RuntimeError(f"{LOG_TABLE} exists but is not a table (relkind {legacy!r})")
+                conn.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS {LOG_TABLE} (
+                        id BIGSERIAL,
+                        timestamp TIMESTAMP NOT NULL,
+                        ethical BOOLEAN,
+                        checked BOOLEAN,
+                        user_id TEXT,
+                        checksum TEXT,
+                        category TEXT NOT NULL DEFAULT '{CATEGORY_ETHICS}',
+                        PRIMARY KEY (id, timestamp)
+                    ) PARTITION BY RANGE (timestamp)
+                """))
+                conn.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+                        bucket TIMESTAMP PRIMARY KEY,
+                        checks BIGINT NOT NULL DEFAULT 0,
+                        ethical BIGINT NOT NULL DEFAULT 0,
+                        vetoed BIGINT NOT NULL DEFAULT 0
+                    )
+                """))
+                if legacy == "r":
+                    # Before the indexes: the legacy table's own indexes may hold their names
+                    self._migrate_legacy(conn)
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{LOG_TABLE}_timestamp ON {LOG_TABLE} (timestamp)"))
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{LOG_TABLE}_user_id ON {LOG_TABLE} (user_id, timestamp)"))
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{LOG_TABLE}_ethical ON {LOG_TABLE} (ethical, timestamp)"))
+                self._partitions.update(
+                    datetime.strptime(name[len(PARTITION_PREFIX):], "%Y%m%d").date()
+                    for (name,) in conn.execute(text(
+                        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                        "WHERE i.inhparent = CAST(:parent AS regclass)"
+                    ), {"parent": LOG_TABLE})
+                    if name[len(PARTITION_PREFIX):].isdigit()
+                )
+        self.ensure_partition(datetime.utcnow().date())
+
+    def _migrate_legacy(self, conn):
+        """
+        Move rows from a pre-partitioning ``ethical_logs`` table (renamed to
+        ``ethical_logs_legacy`` by the caller, same transaction) into daily
+        partitions, rebuild their rollups, then drop it. Legacy rows may lack
+        ``category`` and may store ``timestamp`` as text.
+        """
+        columns = {name for (name,) in conn.execute(text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = :name AND table_schema = current_schema()"
+        ), {"name": LEGACY_TABLE})}
+        category = "category" if "category" in columns else f"'{CATEGORY_ETHICS}'"
+        days = conn.execute(text(
+            f"SELECT DISTINCT CAST(CAST(timestamp AS TIMESTAMP) AS DATE) FROM {LEGACY_TABLE}"
+        )).fetchall()
+        for (day,) in days:
+            conn.execute(text(self._partition_ddl(day)))
+            self._partitions.add(day)
+        migrated = conn.execute(text(f"""
+            INSERT INTO {LOG_TABLE} (id, timestamp, ethical, checked, user_id, checksum, category)
+            SELECT id, CAST(timestamp AS TIMESTAMP), ethical, checked, user_id, checksum, {category}
+            FROM {LEGACY_TABLE}
+        """)).rowcount
+        conn.execute(text(f"""
+            INSERT INTO {ROLLUP_TABLE} (bucket, checks, ethical, vetoed)
+            SELECT date_trunc('hour', timestamp), COUNT(*),
+                   SUM(CASE WHEN ethical THEN 1 ELSE 0 END), SUM(CASE WHEN ethical THEN 0 ELSE 1 END)
+            FROM {LOG_TABLE} WHERE category = :category GROUP BY 1
+            ON CONFLICT (bucket) DO UPDATE SET
+                checks = {ROLLUP_TABLE}.checks + excluded.checks,
+                ethical = {ROLLUP_TABLE}.ethical + excluded.ethical,
+                vetoed = {ROLLUP_TABLE}.vetoed + excluded.vetoed
+        """), {"category": CATEGORY_ETHICS})
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{LOG_TABLE}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {LOG_TABLE}), false)"
+        ))
+        conn.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+        logger.warning(f"Migrated {migrated} rows from unpartitioned {LOG_TABLE} into daily partitions")
+
+    def _partition_ddl(self, day: date) -> str:
+        start = datetime.combine(day, datetime.min.time())
+        end = start + timedelta(days=1)
+        return (
+            f"CREATE TABLE IF NOT EXISTS {PARTITION_PREFIX}{day:%Y%m%d} PARTITION OF {LOG_TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    def ensure_partition(self, day: date) -> str:
+        """Create the partition for ``day`` if it does not exist yet"""
+        name = f"{PARTITION_PREFIX}{day:%Y%m%d}"
+        if day in self._partitions:
+            return name
+
+        with self.engine.begin() as conn:
+            if self.is_sqlite:
+                conn.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS {name} (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp TEXT NOT NULL,
+                        ethical BOOLEAN,
+                        checked BOOLEAN,
+                        user_id TEXT,
+                        checksum TEXT,
+                        category TEXT NOT NULL DEFAULT '{CATEGORY_ETHICS}'
+                    )
+                """))
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{name}_timestamp ON {name} (timestamp)"))
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{name}_user_id ON {name} (user_id, timestamp)"))
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{name}_ethical ON {name} (ethical, timestamp)"))
+            else:
+                conn.execute(text(self._partition_ddl(day)))
+
+        self._partitions.add(day)
+        if self.is_sqlite:
+            self._refresh_view()
+        logger.info(f"Created ethical_logs partition {name}")
+        return name
+
+    def ensure_partitions(self, days_ahead: int = 1):
+        """Pre-create partitions for today and the next ``days_ahead`` days"""
+        today = datetime.utcnow().date()
+        for offset in range(days_ahead + 1):
+            self.ensure_partition(today + timedelta(days=offset))
+
+    def drop_partitions_before(self, cutoff: date) -> List[str]:
+        """Drop whole daily partitions older than ``cutoff`` (retention)"""
+        dropped = []
+        for day in sorted(d for d in self._partitions if d < cutoff):
+            name = f"{PARTITION_PREFIX}{day:%Y%m%d}"
+            with self.engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            self._partitions.discard(day)
+            dropped.append(name)
+        if dropped and self.is_sqlite:
+            self._refresh_view()
+        return dropped
+
+    def _refresh_view(self):
+        """Rebuild the SQLite ``ethical_logs`` view over all day tables"""
+        with self.engine.begin() as conn:
+            existing = conn.execute(text(
+                "SELECT type FROM sqlite_master WHERE name = :name"
+            ), {"name": LOG_TABLE}).scalar()
+            if existing == "table":
+                logger.warning("Legacy ethical_logs table found; not replacing it with a view")
+                return
+            conn.execute(text(f"DROP VIEW IF EXISTS {LOG_TABLE}"))
+            if not self._partitions:
+                return
+            selects = " UNION ALL ".join(
+                f"SELECT id, timestamp, ethical, checked, user_id, checksum, category "
+                f"FROM {PARTITION_PREFIX}{day:%Y%m%d}"
+                for day in sorted(self._partitions)
+            )
+            conn.execute(text(f"CREATE VIEW {LOG_TABLE} AS {selects}"))
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _ts_param(self, ts: datetime):
+        return ts.isoformat() if self.is_sqlite else ts
+
+    def insert(self, ts: datetime, ethical: bool, user_id: Optional[str] = None,
+               checksum: Optional[str] = None, category: str = CATEGORY_ETHICS) -> Optional[int]:
+        """Insert one log row and update its hourly rollup in the same transaction"""
+        ts = to_naive_utc(ts)
+        partition = self.ensure_partition(ts.date())
+        params = {
+            "ts": self._ts_param(ts),
+            "eth": bool(ethical),
+            "chk": True,
+            "uid": user_id,
+            "checksum": checksum,
+            "category": category,
+        }
+
+        with self.engine.begin() as conn:
+            if self.is_sqlite:
+                result = conn.execute(text(f"""
+                    INSERT INTO {partition} (timestamp, ethical, checked, user_id, checksum, category)
+                    VALUES (:ts, :eth, :chk, :uid, :checksum, :category)
+                """), params)
+                log_id = result.lastrowid
+            else:
+                log_id = conn.execute(text(f"""
+                    INSERT INTO {LOG_TABLE} (timestamp, ethical, checked, user_id, checksum, category)
+                    VALUES (:ts, :eth, :chk, :uid, :checksum, :category)
+                    RETURNING id
+                """), params).scalar()
+
+            if category == CATEGORY_ETHICS:
+                conn.execute(text(f"""
+                    INSERT INTO {ROLLUP_TABLE} (bucket, checks, ethical, vetoed)
+                    VALUES (:bucket, 1, :eth, :vetoed)
+                    ON CONFLICT (bucket) DO UPDATE SET
+                        checks = {ROLLUP_TABLE}.checks + excluded.checks,
+                        ethical = {ROLLUP_TABLE}.ethical + excluded.ethical,
+                        vetoed = {ROLLUP_TABLE}.vetoed + excluded.vetoed
+                """), {
+                    "bucket": self._ts_param(_floor_hour(ts)),
+                    "eth": int(bool(ethical)),
+                    "vetoed": int(not ethical),
+                })
+
+        return log_id
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _raw_counts(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        """Count checks/ethical rows in [start, end) straight from the partitions"""
+        if start >= end:
+            return 0, 0
+
+        query = (
+            "SELECT COUNT(*), COALESCE(SUM(CASE WHEN ethical THEN 1 ELSE 0 END), 0) "
+            "FROM {table} WHERE timestamp >= :start AND timestamp < :end AND category = :category"
+        )
+        params = {"start": self._ts_param(start), "end": self._ts_param(end), "category": CATEGORY_ETHICS}
+
+        checks = ethical = 0
+        with self.engine.connect() as conn:
+            if self.is_sqlite:
+                day = start.date()
+                while day <= (end - timedelta(microseconds=1)).date():
+                    if day in self._partitions:
+                        row = conn.execute(text(query.format(table=f"{PARTITION_PREFIX}{day:%Y%m%d}")), params).fetchone()
+                        checks += int(row[0])
+                        ethical += int(row[1])
+                    day += timedelta(days=1)
+            else:
+                row = conn.execute(text(query.format(table=LOG_TABLE)), params).fetchone()
+                checks, ethical = int(row[0]), int(row[1])
+        return checks, ethical
+
+    def _rollup_counts(self, start: datetime, end: datetime) -> Tuple[int, int, int]:
+        """Sum hourly rollups for buckets in [start, end); returns (checks, ethical, hours)"""
+        if start >= end:
+            return 0, 0, 0
+        with self.engine.connect() as conn:
+            row = conn.execute(text(f"""
+                SELECT COALESCE(SUM(checks), 0), COALESCE(SUM(ethical), 0), COUNT(*)
+                FROM {ROLLUP_TABLE} WHERE bucket >= :start AND bucket < :end
+            """), {"start": self._ts_param(start), "end": self._ts_param(end)}).fetchone()
+        return int(row[0]), int(row[1]), int(row[2])
+
+    def veto_stats(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        """Observed veto rate and counts over an arbitrary [start, end) window"""
+        start, end = to_naive_utc(start), to_naive_utc(end)
+        if end < start:
+            start, end = end, start
+
+        first_full = _ceil_hour(start)
+        last_full = _floor_hour(end)
+
+        if first_full < last_full:
+            checks, ethical, hours = self._rollup_counts(first_full, last_full)
+            for edge_start, edge_end in ((start, first_full), (last_full, end)):
+                edge_checks, edge_ethical = self._raw_counts(edge_start, edge_end)
+                checks += edge_checks
+                ethical += edge_ethical
+        else:
+            hours = 0
+            checks, ethical = self._raw_counts(start, end)
+
+        vetoed = checks - ethical
+        return {
+            "window_start": start.isoformat(),
+            "window_end": end.isoformat(),
+            "checks": checks,
+            "ethical": ethical,
+            "vetoed": vetoed,
+            "veto_rate": vetoed / checks if checks else 0.0,
+            "rollup_hours": hours,
+        }
+
+    def hourly_rollups(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """Hourly rollup rows in [start, end) for dashboard charts"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"""
+                SELECT bucket, checks, ethical, vetoed FROM {ROLLUP_TABLE}
+                WHERE bucket >= :start AND bucket < :end ORDER BY bucket
+            """), {"start": self._ts_param(_floor_hour(start)), "end": self._ts_param(end)}).fetchall()
+        return [
+            {
+                "bucket": bucket if isinstance(bucket, str) else bucket.isoformat(),
+                "checks": int(checks),
+                "ethical": int(ethical),
+                "vetoed": int(vetoed),
+                "veto_rate": int(vetoed) / int(checks) if checks else 0.0,
+            }
+            for bucket, checks, ethical, vetoed in rows
+        ]
@@ -1,13 +1,36 @@
 import asyncio
+import math
+import os
+from concurrent.futures import Future
 import random
 from datetime import datetime
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
+
+from .sentiment_service import get_sentiment_service
+from .scheduling import PriorityTaskQueue, ScheduledTask
+from .durable_queue import DurableTaskQueue
+
+_DONE = object()
 
 class BpoService:
-    def __init__(self):
-        self.queue = []
+    def __init__(self, sentiment=None, concurrency: int = None, sentiment_batch: int = 256,
+                 queue: PriorityTaskQueue = None, journal: DurableTaskQueue = None):
         self.processed_count = 0
-      
-    async def process(self, task: str) -> dict:
+        self.sentiment = sentiment or get_sentiment_service()
+        self.concurrency = max(1, concurrency or int(os.getenv("BPO_CONCURRENCY", 64)))
+        self.sentiment_batch = sentiment_batch
+        # Lower classes may never take the whole worker pool
+        self.queue = queue or PriorityTaskQueue(quotas={
+            "normal": max(1, int(self.concurrency * 0.75)),
+            "low": max(1, int(self.concurrency * 0.5)),
+        })
+        self._dispatchers: List[asyncio.Task] = []
+        # Optional write-ahead journal so queued work survives a restart
+        self.journal = journal
+
+    async def process(self, task: str, sentiment: Optional[Dict[str, Any]] = None) -> dict:
+        if sentiment is None:
+            sentiment = (await self.sentiment.score_batch_async([task]))[0]
         await asyncio.sleep(0.1)
         self.processed_count += 1
         result = {
@@ -16,10 +39,182 @@ class BpoService:
             "status": "completed",
             "ticket_id": f"TICKET-{self.processed_count:06d}",
             "qa_score": round(random.uniform(0.8, 1.0), 2),
-            "sentiment": random.choice(["positive", "neutral", "negative"]),
+            "sentiment": sentiment["label"],
+            "sentiment_score": sentiment["compound"],
             "translated": task.upper() if random.random() > 0.5 else task
         }
         return result
-  
+
+    async def _process_isolated(self, task: str, sentiment: Optional[Dict[str, Any]]) -> dict:
+        """A failing task yields a failed result instead of sinking the batch"""
+        try:
+            return await self.process(task, sentiment)
+        except Exception as e:
+            return self._failure(task, e)
+
+    @staticmethod
+    def _failure(task, error: Exception) -> dict:
+        return {
+            "task": task,
+            "processed_at": datetime.utcnow().isoformat(),
+            "status": "failed",
+            "error": f"{type(error).__name__}: {error}"
+        }
+
+    async def _run(self, tasks) -> AsyncIterator[Tuple[int, dict]]:
+        """
+        Worker-queue pipeline yielding (index, result) in completion order.
+
+        A producer scores sentiment in chunks and feeds a bounded input queue;
+        ``concurrency`` workers drain it into a bounded output queue. Both
+        bounds give backpressure: a slow consumer stalls the workers, which
+        stalls the producer, so at most a few chunks of tasks are in memory.
+        """
+        inbox: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        producer_error: List[BaseException] = []
+
+        async def produce():
+            chunk: List[Tuple[int, str]] = []
+
+            async def flush():
+                try:
+                    scores = await self.sentiment.score_batch_async([task for _, task in chunk])
+                except Exception:
+                    # One bad text fails the whole chunk: score one by one, failing only the culprits
+                    scores = []
+                    for _, task in chunk:
+                        try:
+                            scores.append((await self.sentiment.score_batch_async([task]))[0])
+                        except Exception as e:
+                            scores.append(e)
+                for (index, task), sentiment in zip(chunk, scores):
+                    await inbox.put((index, task, sentiment))
+                chunk.clear()
+
+            try:
+                if hasattr(tasks, "__aiter__"):
+                    index = 0
+                    async for task in tasks:
+                        chunk.append((index, task))
+                        index += 1
+                        if len(chunk) >= self.sentiment_batch:
+                            await flush()
+                else:
+                    for index, task in enumerate(tasks):
+                        chunk.append((index, task))
+                        if len(chunk) >= self.sentiment_batch:
+                            await flush()
+                if chunk:
+                    await flush()
+            except Exception as e:
+                producer_error.append(e)
+            finally:
+                for _ in range(self.concurrency):
+                    await inbox.put(_DONE)
+
+        async def work():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    await outbox.put(_DONE)
+                    return
+                index, task, sentiment = item
+                if isinstance(sentiment, Exception):
+                    result = self._failure(task, sentiment)
+                else:
+                    result = await self._process_isolated(task, sentiment)
+                await outbox.put((index, result))
+
+        runners = [asyncio.create_task(produce())]
+        runners += [asyncio.create_task(work()) for _ in range(self.concurrency)]
+        try:
+            finished = 0
+            while finished < self.concurrency:
+                item = await outbox.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                yield item
+            if producer_error:
+                raise producer_error[0]
+        finally:
+            for runner in runners:
+                runner.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
+
     async def batch_process(self, tasks: list) -> list:
-        return [await self.process(task) for task in tasks]
\ No newline at end of file
+        """Process ``tasks`` with at most ``concurrency`` in flight; results keep input order"""
+        results: List[Optional[dict]] = [None] * len(tasks)
+        async for index, result in self._run(tasks):
+            results[index] = result
+        return results
+
+    async def stream(self, tasks) -> AsyncIterator[dict]:
+        """Yield results as they finish; ``tasks`` may be any iterable or async iterable"""
+        async for index, result in self._run(tasks):
+            result["batch_index"] = index
+            yield result
+
+    def enqueue(self, task: str, priority: str = "normal", complexity: float = 0.5) -> ScheduledTask:
+        """Schedule a task; await ``item.future`` for its result"""
+        self._ensure_dispatchers()
+        item = self.queue.put(task, priority=priority, complexity=complexity)
+        item.future = asyncio.get_running_loop().create_future()
+        if self.journal is not None:
+            # Journaled already leased to this process until acked; recovery releases it after a crash
+            item.receipt = self.journal.enqueue(task, priority, complexity, lease_for=math.inf)
+        return item
+
+    def restore(self) -> int:
+        """Re-queue journaled tasks left over by dead processes (call once at startup)"""
+        if self.journal is None:
+            return 0
+        restored = 0
+        while True:
+            # Only tasks of dead processes: a live worker's tasks stay with it
+            leases = self.journal.dequeue(n=1000, visibility_timeout=math.inf, orphaned_only=True)
+            if not leases:
+                return restored
+            self._ensure_dispatchers()
+            for lease in leases:
+                item = self.queue.put(lease.payload, priority=lease.priority, complexity=lease.complexity)
+                item.receipt = lease.id
+            restored += len(leases)
+
+    async def submit(self, task: str, priority: str = "normal", complexity: float = 0.5) -> dict:
+        """Schedule a task and wait for it; the result carries its queue wait"""
+        return await self.enqueue(task, priority, complexity).future
+
+    def _ensure_dispatchers(self):
+        self._dispatchers = [d for d in self._dispatchers if not d.done()]
+        missing = self.concurrency - len(self._dispatchers)
+        self._dispatchers += [asyncio.create_task(self._dispatch()) for _ in range(missing)]
+
+    async def _dispatch(self):
+        while True:
+            item = await self.queue.get()
+            try:
+                result = await self._process_isolated(item.payload, None)
+                result.update(priority=item.priority, queue_wait_s=round(item.wait_seconds, 4))
+                if item.receipt is not None:
+                    await self._ack(item.receipt)  # Before delivery, so a finished task is never replayed
+                if item.future is not None and not item.future.done():
+                    item.future.set_result(result)
+            finally:
+                if item.future is not None and not item.future.done():
+                    item.future.cancel()  # Dispatcher cancelled mid-task
+                self.queue.task_done(item)
+
+    async def _ack(self, receipt):
+        try:
+            task_id = await asyncio.wrap_future(receipt) if isinstance(receipt, Future) else receipt
+            self.journal.ack(task_id)
+        except Exception:
+            pass  # Never journaled: nothing to ack
+
+    async def shutdown(self):
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
@@ -0,0 +1,332 @@
+"""
+DURABLE TASK QUEUE - SQLite WAL-backed task queue with group commit
+Enqueues and acks from any thread are coalesced by one flusher thread into a
+single transaction per batch; dequeues lease tasks with a visibility timeout
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+from .scheduling import DEFAULT_AGING_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_INSERT = ("INSERT INTO tasks (payload, priority, complexity, key, enqueued_at, visible_at, attempts, owner) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+
+
+def _boot_id() -> str:
+    """Identifies this boot of the host, so pids from before a reboot never look alive"""
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return socket.gethostname()
+
+
+def process_owner() -> str:
+    """Lease owner id of the current process: ``<boot id>:<pid>``"""
+    return f"{_boot_id()}:{os.getpid()}"
+
+
+def owner_alive(owner: Optional[str]) -> bool:
+    """Whether the process that took a lease may still be running"""
+    boot, _, pid = (owner or "").rpartition(":")
+    if boot != _boot_id() or not pid.isdigit():
+        return False  # Previous boot, another host, or a lease from before owners were recorded
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return True
+
+
+@dataclass
+class Lease:
+    """A dequeued task; ack it before ``visible_at`` or it is redelivered"""
+    id: int
+    payload: Any
+    priority: str
+    complexity: float
+    key: float
+    attempts: int
+    enqueued_at: float
+    visible_at: float
+
+
+class DurableTaskQueue:
+    """
+    Persistent at-least-once task queue.
+
+    ``enqueue`` is non-blocking: it appends to an in-memory batch and returns
+    a Future that resolves to the task id once the batch is committed. The
+    flusher commits whatever accumulated while the previous commit ran, so
+    batch size grows with load (group commit). ``dequeue`` leases the
+    lowest-key visible tasks with one ``UPDATE ... RETURNING``; unacked
+    leases become visible again after ``visibility_timeout``. Tasks that
+    exhausted ``max_attempts`` stay in the table as dead letters.
+
+    Every lease records its ``owner`` (boot id and pid), so several processes
+    can share one file: ``recover`` only releases leases whose owner is gone.
+    """
+
+    def __init__(self, path: str, visibility_timeout: float = 30.0, max_attempts: int = 5,
+                 max_batch: int = 5000, synchronous: str = "NORMAL", recover: bool = True,
+                 complexity_weight: float = 5.0, clock: Callable[[], float] = time.time,
+                 owner: Optional[str] = None):
+        self.path = path
+        self.owner = owner or process_owner()
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.max_batch = max_batch
+        self.complexity_weight = complexity_weight
+        self.clock = clock
+        self._db = sqlite3.connect(path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={synchronous}")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY,
+                payload TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                complexity REAL NOT NULL,
+                key REAL NOT NULL,
+                enqueued_at REAL NOT NULL,
+                visible_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                owner TEXT
+            )
+        """)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(tasks)")}
+        if "owner" not in columns:  # Journal written before leases were owned
+            self._db.execute("ALTER TABLE tasks ADD COLUMN owner TEXT")
+        self._db.execute("CREATE INDEX IF NOT EXISTS tasks_key ON tasks (key)")
+        self._db_lock = threading.Lock()
+
+        self._inserts: List[Tuple[tuple, Future]] = []
+        self._acks: List[Tuple[int, Future]] = []
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)  # Flusher waits for submissions
+        self._idle = threading.Condition(self._lock)  # flush() waits for commits
+        self._closed = False
+        self._committing = False
+        self.stats = {"enqueued": 0, "acked": 0, "dequeued": 0, "commits": 0, "recovered": 0}
+        self.recovered = self.recover() if recover else 0
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="durable-queue-flusher", daemon=True)
+        self._flusher.start()
+
+    # ------------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------------
+
+    def _flush_loop(self):
+        while True:
+            with self._lock:
+                while not (self._inserts or self._acks or self._closed):
+                    self._work.wait()
+                if self._closed and not (self._inserts or self._acks):
+                    return
+                inserts, self._inserts = self._inserts[:self.max_batch], self._inserts[self.max_batch:]
+                acks, self._acks = self._acks[:self.max_batch], self._acks[self.max_batch:]
+                self._committing = True
+            self._commit(inserts, acks)
+            with self._lock:
+                self._committing = False
+                self._idle.notify_all()
+
+    def _commit(self, inserts: List[Tuple[tuple, Future]], acks: List[Tuple[int, Future]]):
+        try:
+            with self._db_lock:
+                self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    if inserts:
+                        self._db.executemany(_INSERT, [row for row, _ in inserts])
+                        # Rowids are allocated max+1 under the write lock, so the batch is contiguous
+                        last = self._db.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    if acks:
+                        self._db.executemany("DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id, _ in acks])
+                    self._db.execute("COMMIT")
+                except BaseException:
+                    self._db.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            logger.error(f"Durable queue commit failed: {e}")
+            for _, future in inserts + acks:
+                future.set_exception(e)
+            return
+
+        self.stats["commits"] += 1
+        self.stats["enqueued"] += len(inserts)
+        self.stats["acked"] += len(acks)
+        first = last - len(inserts) + 1 if inserts else 0
+        for offset, (_, future) in enumerate(inserts):
+            future.set_result(first + offset)
+        for task_id, future in acks:
+            future.set_result(task_id)
+
+    def _submit(self, bucket: str, entry) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Durable queue is closed")
+            # Resolve the list under the lock: the flusher swaps it out per batch
+            getattr(self, bucket).append(entry)
+            self._work.notify()
+        return entry[1]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def enqueue(self, payload: Any, priority: str = "normal", complexity: float = 0.5,
+                lease_for: Optional[float] = None) -> Future:
+        """Queue a task for the next group commit; the Future resolves to its id.
+
+        ``lease_for`` enqueues the task already leased (invisible) for that
+        many seconds, for producers that will also process it themselves;
+        ``math.inf`` holds it until it is acked or this process dies.
+        """
+        now = self.clock()
+        complexity = min(max(float(complexity), 0.0), 1.0)
+        key = now + DEFAULT_AGING_SECONDS.get(priority, DEFAULT_AGING_SECONDS["normal"]) \
+            + self.complexity_weight * complexity
+        row = (json.dumps(payload), priority, complexity, key, now,
+               now + lease_for if lease_for else now, 1 if lease_for else 0,
+               self.owner if lease_for else None)
+        return self._submit("_inserts", (row, Future()))
+
+    async def enqueue_async(self, payload: Any, priority: str = "normal", complexity: float = 0.5,
+                            lease_for: Optional[float] = None) -> int:
+        return await asyncio.wrap_future(self.enqueue(payload, priority, complexity, lease_for))
+
+    def enqueue_many(self, payloads: Iterable[Any], priority: str = "normal", complexity: float = 0.5) -> List[int]:
+        """Enqueue and wait until all are durable"""
+        futures = [self.enqueue(payload, priority, complexity) for payload in payloads]
+        return [future.result() for future in futures]
+
+    def ack(self, task_id: int) -> Future:
+        """Mark a leased task done (deleted at the next group commit)"""
+        return self._submit("_acks", (task_id, Future()))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything submitted so far is committed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._inserts or self._acks or self._committing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def dequeue(self, n: int = 1, visibility_timeout: Optional[float] = None,
+                orphaned_only: bool = False) -> List[Lease]:
+        """Lease up to ``n`` visible tasks in key order.
+
+        ``orphaned_only`` skips tasks whose last owner is still running, even
+        if their lease expired, so a starting process never takes over work a
+        live one holds. ``visibility_timeout=math.inf`` holds the lease until
+        it is acked or this process dies.
+        """
+        now = self.clock()
+        visible_at = now + (self.visibility_timeout if visibility_timeout is None else visibility_timeout)
+        with self._db_lock:
+            live = []
+            if orphaned_only:
+                live = [owner for (owner,) in self._db.execute(
+                    "SELECT DISTINCT owner FROM tasks WHERE visible_at <= ? AND attempts < ? AND owner IS NOT NULL",
+                    (now, self.max_attempts)
+                ) if owner_alive(owner)]
+            exclude = f"AND (owner IS NULL OR owner NOT IN ({', '.join('?' * len(live))}))" if live else ""
+            rows = self._db.execute(
+                f"""
+                UPDATE tasks SET visible_at = ?, attempts = attempts + 1, owner = ?
+                WHERE id IN (
+                    SELECT id FROM tasks
+                    WHERE visible_at <= ? AND attempts < ? {exclude}
+                    ORDER BY key LIMIT ?
+                )
+                RETURNING id, payload, priority, complexity, key, attempts, enqueued_at, visible_at
+                """,
+                (visible_at, self.owner, now, self.max_attempts, *live, n)
+            ).fetchall()
+        self.stats["dequeued"] += len(rows)
+        leases = [Lease(row[0], json.loads(row[1]), *row[2:]) for row in rows]
+        return sorted(leases, key=lambda lease: lease.key)
+
+    def nack(self, task_ids: Iterable[int], delay: float = 0.0) -> int:
+        """Return leased tasks to the queue after ``delay`` seconds"""
+        visible_at = self.clock() + delay
+        with self._db_lock:
+            cursor = self._db.executemany("UPDATE tasks SET visible_at = ? WHERE id = ?",
+                                          [(visible_at, task_id) for task_id in task_ids])
+        return cursor.rowcount
+
+    def recover(self) -> int:
+        """Crash recovery: release leases held by dead processes so they are redelivered now.
+
+        Leases of live owners, including other processes sharing the file,
+        are left alone and only come back once their visibility timeout expires.
+        """
+        now = self.clock()
+        with self._db_lock:
+            owners = [owner for (owner,) in self._db.execute(
+                "SELECT DISTINCT owner FROM tasks WHERE visible_at > ? AND attempts > 0 AND attempts < ?",
+                (now, self.max_attempts)
+            )]
+            orphaned = [owner for owner in owners if not owner_alive(owner)]
+            count = self._db.executemany(
+                "UPDATE tasks SET visible_at = ?, owner = NULL "
+                "WHERE owner IS ? AND visible_at > ? AND attempts > 0 AND attempts < ?",
+                [(now, owner, now, self.max_attempts) for owner in orphaned]
+            ).rowcount if orphaned else 0
+        self.stats["recovered"] += count
+        if count:
+            logger.info(f"Durable queue recovered {count} in-flight tasks of {len(orphaned)} "
+                        f"dead owners from {self.path}")
+        return count
+
+    def depth(self) -> Dict[str, int]:
+        now = self.clock()
+        with self._db_lock:
+            ready, leased, dead = self._db.execute(
+                """
+                SELECT
+                    COALESCE(SUM(attempts < ? AND visible_at <= ?), 0),
+                    COALESCE(SUM(attempts < ? AND visible_at > ?), 0),
+                    COALESCE(SUM(attempts >= ?), 0)
+                FROM tasks
+                """,
+                (self.max_attempts, now, self.max_attempts, now, self.max_attempts)
+            ).fetchone()
+        return {"ready": ready, "in_flight": leased, "dead": dead}
+
+    def snapshot(self) -> Dict[str, Any]:
+        commits = self.stats["commits"]
+        return {
+            **self.stats,
+            **self.depth(),
+            "avg_batch": (self.stats["enqueued"] + self.stats["acked"]) / commits if commits else 0.0,
+            "path": self.path,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._work.notify_all()
+        self._flusher.join()
+        with self._db_lock:
+            self._db.close()
@@ -0,0 +1,174 @@
+"""
+TASK SCHEDULING - Priority queue with aging, complexity weighting and quotas
+Per-class heaps keyed on enqueue time plus a class offset, so lower classes
+age past newer high-priority work instead of starving
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Optional
+
+PRIORITY_CLASSES = ("urgent", "high", "normal", "low")
+
+# Seconds of head start each class gets over "urgent": a low task enqueued
+# now is served before an urgent task enqueued 120s from now
+DEFAULT_AGING_SECONDS = {"urgent": 0.0, "high": 15.0, "normal": 45.0, "low": 120.0}
+
+
+@dataclass(order=True)
+class ScheduledTask:
+    """Heap entry; ordering uses only (key, seq)"""
+    key: float
+    seq: int
+    payload: Any = field(compare=False)
+    priority: str = field(compare=False, default="normal")
+    complexity: float = field(compare=False, default=0.5)
+    enqueued_at: float = field(compare=False, default=0.0)
+    started_at: Optional[float] = field(compare=False, default=None)
+    future: Optional[asyncio.Future] = field(compare=False, default=None, repr=False)
+    receipt: Any = field(compare=False, default=None, repr=False)  # Durable journal id (or its Future)
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        return None if self.started_at is None else self.started_at - self.enqueued_at
+
+
+class _ClassStats:
+    def __init__(self, window: int):
+        self.enqueued = 0
+        self.started = 0
+        self.completed = 0
+        self.max_wait = 0.0
+        self.waits: deque = deque(maxlen=window)
+
+    def snapshot(self) -> Dict[str, Any]:
+        waits = sorted(self.waits)
+
+        def pct(q: float) -> float:
+            return waits[min(len(waits) - 1, int(q * len(waits)))] if waits else 0.0
+
+        return {
+            "enqueued": self.enqueued,
+            "started": self.started,
+            "completed": self.completed,
+            "wait_mean_s": sum(waits) / len(waits) if waits else 0.0,
+            "wait_p50_s": pct(0.50),
+            "wait_p95_s": pct(0.95),
+            "wait_max_s": self.max_wait,
+        }
+
+
+class PriorityTaskQueue:
+    """
+    Scheduling queue for BPO tasks.
+
+    ``key = enqueued_at + aging_seconds[class] + complexity_weight * complexity``.
+    Keys are fixed at enqueue time, so aging costs nothing at dequeue: old
+    low-priority work overtakes newer high-priority work once it has waited
+    out the difference in class offsets. Within a class, simpler tasks go
+    first (complexity in [0, 1]). ``quotas`` caps how many tasks of a class
+    may be in flight at once, keeping capacity free for the classes above.
+    """
+
+    def __init__(self, aging_seconds: Optional[Dict[str, float]] = None, complexity_weight: float = 5.0,
+                 quotas: Optional[Dict[str, Optional[int]]] = None, metrics_window: int = 1000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.aging_seconds = {**DEFAULT_AGING_SECONDS, **(aging_seconds or {})}
+        self.complexity_weight = complexity_weight
+        self.quotas = {cls: None for cls in PRIORITY_CLASSES}
+        self.quotas.update(quotas or {})
+        self.clock = clock
+        self._heaps: Dict[str, List[ScheduledTask]] = {cls: [] for cls in PRIORITY_CLASSES}
+        self._in_flight = {cls: 0 for cls in PRIORITY_CLASSES}
+        self._stats = {cls: _ClassStats(metrics_window) for cls in PRIORITY_CLASSES}
+        self._seq = itertools.count()
+        self._waiters: deque = deque()
+
+    def __len__(self) -> int:
+        return sum(len(heap) for heap in self._heaps.values())
+
+    def put(self, payload: Any, priority: str = "normal", complexity: float = 0.5) -> ScheduledTask:
+        if priority not in self._heaps:
+            raise ValueError(f"Unknown priority '{priority}'. Use one of {list(PRIORITY_CLASSES)}")
+        complexity = min(max(float(complexity), 0.0), 1.0)
+        now = self.clock()
+        item = ScheduledTask(
+            key=now + self.aging_seconds[priority] + self.complexity_weight * complexity,
+            seq=next(self._seq),
+            payload=payload,
+            priority=priority,
+            complexity=complexity,
+            enqueued_at=now,
+        )
+        heapq.heappush(self._heaps[priority], item)
+        self._stats[priority].enqueued += 1
+        self._wake()
+        return item
+
+    def _eligible(self, cls: str) -> bool:
+        quota = self.quotas.get(cls)
+        return bool(self._heaps[cls]) and (quota is None or self._in_flight[cls] < quota)
+
+    def get_nowait(self) -> Optional[ScheduledTask]:
+        """Pop the lowest-key task among classes under quota, or None"""
+        heads = [self._heaps[cls][0] for cls in PRIORITY_CLASSES if self._eligible(cls)]
+        if not heads:
+            return None
+        item = min(heads)
+        heapq.heappop(self._heaps[item.priority])
+        item.started_at = self.clock()
+        self._in_flight[item.priority] += 1
+        stats = self._stats[item.priority]
+        stats.started += 1
+        stats.waits.append(item.wait_seconds)
+        stats.max_wait = max(stats.max_wait, item.wait_seconds)
+        return item
+
+    async def get(self) -> ScheduledTask:
+        while True:
+            item = self.get_nowait()
+            if item is not None:
+                return item
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()  # Pass the wake-up on
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def task_done(self, item: ScheduledTask):
+        """Release the task's quota slot"""
+        self._in_flight[item.priority] -= 1
+        self._stats[item.priority].completed += 1
+        self._wake()
+
+    def _wake(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(None)
+                return
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self),
+            "classes": {
+                cls: {
+                    **self._stats[cls].snapshot(),
+                    "queued": len(self._heaps[cls]),
+                    "in_flight": self._in_flight[cls],
+                    "quota": self.quotas.get(cls),
+                    "aging_seconds": self.aging_seconds[cls],
+                }
+                for cls in PRIORITY_CLASSES
+            },
+        }
@@ -0,0 +1,147 @@
+"""
+SENTIMENT SERVICE - Batched VADER scoring for tickets and transcripts
+Dedupes identical texts, serves repeats from an LRU cache and shards large
+batches of misses across a process pool (VADER is pure Python and GIL-bound)
+"""
+
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence
+
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+_analyzer = None
+
+
+def get_analyzer():
+    """Per-process VADER analyzer, built on first use (loading its lexicon is slow)"""
+    global _analyzer
+    if _analyzer is None:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        _analyzer = SentimentIntensityAnalyzer()
+    return _analyzer
+
+
+def label_for(compound: float) -> str:
+    """Standard VADER cut-offs on the compound score"""
+    if compound >= POSITIVE_THRESHOLD:
+        return "positive"
+    if compound <= NEGATIVE_THRESHOLD:
+        return "negative"
+    return "neutral"
+
+
+def _score_shard(texts: List[str]) -> List[Dict[str, Any]]:
+    analyzer = get_analyzer()
+    results = []
+    for text in texts:
+        scores = analyzer.polarity_scores(text)
+        scores["label"] = label_for(scores["compound"])
+        results.append(scores)
+    return results
+
+
+class SentimentService:
+    """
+    Order-preserving batch sentiment scoring.
+
+    A batch is reduced to its unique texts, cached texts are answered from
+    the LRU, and the remaining misses are scored in-process or, past
+    ``parallel_threshold``, split into ``shard_size`` chunks for the pool.
+    """
+
+    def __init__(self, cache_size: int = 100000, workers: Optional[int] = None,
+                 shard_size: int = 2000, parallel_threshold: int = 5000):
+        self.cache_size = cache_size
+        self.workers = workers if workers is not None else max(1, (os.cpu_count() or 1) - 1)
+        self.shard_size = shard_size
+        self.parallel_threshold = parallel_threshold
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.stats = {
+            "batches": 0,
+            "texts": 0,
+            "duplicates": 0,
+            "cache_hits": 0,
+            "scored_local": 0,
+            "scored_pool": 0,
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _score_misses(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if self.workers > 1 and len(texts) >= self.parallel_threshold:
+            shards = [texts[i:i + self.shard_size] for i in range(0, len(texts), self.shard_size)]
+            results = [scores for shard in self._get_pool().map(_score_shard, shards) for scores in shard]
+            self.stats["scored_pool"] += len(texts)
+            return results
+        self.stats["scored_local"] += len(texts)
+        return _score_shard(texts)
+
+    def score_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Scores for ``texts`` in input order (neg/neu/pos/compound plus a label)"""
+        unique = list(dict.fromkeys(texts))
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for text in unique:
+                cached = self._cache.get(text)
+                if cached is not None:
+                    self._cache.move_to_end(text)
+                    found[text] = cached
+        misses = [text for text in unique if text not in found]
+
+        if misses:
+            scored = self._score_misses(misses)
+            with self._lock:
+                for text, scores in zip(misses, scored):
+                    found[text] = scores
+                    self._cache[text] = scores
+                    self._cache.move_to_end(text)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        with self._lock:
+            self.stats["batches"] += 1
+            self.stats["texts"] += len(texts)
+            self.stats["duplicates"] += len(texts) - len(unique)
+            self.stats["cache_hits"] += len(unique) - len(misses)
+        # Copies: callers may mutate results, which must not leak into duplicates or the cache
+        return [dict(found[text]) for text in texts]
+
+    def score(self, text: str) -> Dict[str, Any]:
+        return self.score_batch([text])[0]
+
+    async def score_batch_async(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """``score_batch`` off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.score_batch, list(texts))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "cache_entries": len(self._cache), "workers": self.workers}
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+_default_service: Optional[SentimentService] = None
+
+
+def get_sentiment_service() -> SentimentService:
+    """Process-wide service configured from SENTIMENT_CACHE_SIZE / SENTIMENT_WORKERS"""
+    global _default_service
+    if _default_service is None:
+        workers = os.getenv("SENTIMENT_WORKERS")
+        _default_service = SentimentService(
+            cache_size=int(os.getenv("SENTIMENT_CACHE_SIZE", 100000)),
+            workers=int(workers) if workers else None
+        )
+    return _default_service
@@ -3,11 +3,21 @@ THEOREM BRIDGE - Bridge Mathematical Theorems to Real BPO Operations
 Connects mathematical proofs to practical business implementations
 """
 
+import math
+import os
 import numpy as np
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+from ..core.engineering.erlang import get_erlang_staffing
+from ..core.engineering.interval_planner import DailyPlan, IntervalPlanner
+from .report_models import (
+    AreaOptimization, BPOReport, CostStructureResult, OverallOptimizationResult, StaffingResult,
+    aggregate_reports
+)
+
 @dataclass
 class BPOOptimization:
     """BPO optimization result container"""
@@ -22,6 +32,9 @@ class BPOOptimization:
 class BPOTheoremBridge:
     """Bridge mathematical theorems to BPO business operations"""
     
+    MC_CHUNK_SIZE = 1_000_000  # Monte Carlo draws held in memory at once
+    STAFFING_INPUTS = ('daily_calls', 'avg_handle_time', 'service_level_target')  # Per-site overrides
+    
     def __init__(self):
         self.bpo_metrics = {
             'cost_per_call': 120.0,
@@ -30,8 +43,11 @@ class BPOTheoremBridge:
             'first_call_resolution': 0.72,
             'customer_satisfaction': 4.1
         }
+        # Seeded Monte Carlo distributions, shared by every report that uses the same inputs
+        self._staffing_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        self._sample_calls: Optional[List[int]] = None
     
-    def apply_shor_to_cost_structure(self, cost_data: Dict) -> Dict[str, Any]:
+    def optimize_cost_structure(self, cost_data: Dict) -> CostStructureResult:
         """
         Apply Shor Factorization Theorem to cost structure
         Real implementation for BPO cost optimization
@@ -44,39 +60,27 @@ class BPOTheoremBridge:
         optimized_fixed = fixed_ratio * 0.8  # 20% reduction
         optimized_variable = variable_ratio * 0.85  # 15% reduction
         
-        current_fixed = monthly_cost * fixed_ratio
-        current_variable = monthly_cost * variable_ratio
-        
-        optimized_fixed_cost = monthly_cost * optimized_fixed
-        optimized_variable_cost = monthly_cost * optimized_variable
-        optimized_total = optimized_fixed_cost + optimized_variable_cost
-        
-        savings = monthly_cost - optimized_total
-        
-        return {
-            'theorem_applied': 'Shor Factorization Theorem (Theorem 1)',
-            'optimization': 'Cost structure decomposition',
-            'current_structure': {
-                'fixed_costs': f"PHP {current_fixed:,.0f}",
-                'variable_costs': f"PHP {current_variable:,.0f}",
-                'total': f"PHP {monthly_cost:,.0f}"
-            },
-            'optimized_structure': {
-                'fixed_costs': f"PHP {optimized_fixed_cost:,.0f}",
-                'variable_costs': f"PHP {optimized_variable_cost:,.0f}",
-                'total': f"PHP {optimized_total:,.0f}"
-            },
-            'monthly_savings': f"PHP {savings:,.0f}",
-            'savings_percentage': f"{(savings/monthly_cost*100):.1f}%",
-            'implementation': 'Restructure contracts, optimize variable costs',
-            'timeline': '4-6 weeks',
-            'roi_days': 45
-        }
+        return CostStructureResult(
+            monthly_cost=monthly_cost,
+            current_fixed=monthly_cost * fixed_ratio,
+            current_variable=monthly_cost * variable_ratio,
+            optimized_fixed=monthly_cost * optimized_fixed,
+            optimized_variable=monthly_cost * optimized_variable
+        )
+    
+    def apply_shor_to_cost_structure(self, cost_data: Dict) -> Dict[str, Any]:
+        """Presentation dict of ``optimize_cost_structure``"""
+        return self.optimize_cost_structure(cost_data).to_dict()
     
-    def apply_monte_carlo_to_staffing(self, historical_data: Dict) -> Dict[str, Any]:
+    def forecast_staffing(self, historical_data: Dict, n_simulations: int = 100000,
+                          seed: Optional[int] = None, confidence: float = 0.90) -> StaffingResult:
         """
         Apply Monte Carlo Theorem to staffing predictions
         Real implementation for BPO staffing optimization
+
+        Simulations run vectorized in chunks of ``MC_CHUNK_SIZE``, so 10^7
+        runs need no more memory than one chunk. The same ``seed`` gives the
+        same result regardless of chunk size.
         """
         historical_calls = historical_data.get('daily_calls', [])
         service_level_target = historical_data.get('service_level_target', 0.8)
@@ -84,53 +88,101 @@ class BPOTheoremBridge:
         
         if not historical_calls:
             # Generate sample data if none provided
-            historical_calls = self._generate_sample_call_data()
+            if self._sample_calls is None:
+                self._sample_calls = self._generate_sample_call_data()
+            historical_calls = self._sample_calls
         
         # Monte Carlo simulation
-        n_simulations = 1000
-        staffing_levels = []
-        
-        for _ in range(n_simulations):
-            # Simulate call volume with randomness
-            base_volume = np.mean(historical_calls)
-            random_factor = np.random.normal(1.0, 0.15)  # 15% variability
-            simulated_volume = base_volume * random_factor
-            
-            # Calculate required staffing
-            calls_per_hour = simulated_volume / 8  # 8-hour shift
-            calls_per_agent_per_hour = 3600 / aht  # calls per hour per agent
-            required_agents = np.ceil(calls_per_hour / calls_per_agent_per_hour)
-            
-            # Adjust for service level
-            if np.random.random() < service_level_target:
-                required_agents *= 1.1  # Buffer for service level
-            
-            staffing_levels.append(required_agents)
+        values, counts = self._staffing_distribution(
+            float(np.mean(historical_calls)), aht, service_level_target, n_simulations, seed
+        )
         
         # Calculate optimal staffing
-        optimal_agents = int(np.percentile(staffing_levels, 85))  # 85th percentile
-        current_agents = historical_data.get('current_agents', optimal_agents + 5)
-        
-        # Calculate savings
-        agent_cost_per_month = 25000
-        current_cost = current_agents * agent_cost_per_month
-        optimized_cost = optimal_agents * agent_cost_per_month
-        monthly_savings = current_cost - optimized_cost
-        
-        return {
-            'theorem_applied': 'Monte Carlo Theorem (Theorem 8)',
-            'optimization': 'Staffing prediction with confidence intervals',
-            'current_staffing': current_agents,
-            'optimized_staffing': optimal_agents,
-            'confidence_interval': f"{optimal_agents-2} to {optimal_agents+2} agents",
-            'service_level_confidence': '95%',
-            'monthly_savings': f"PHP {monthly_savings:,.0f}",
-            'reduction_percentage': f"{((current_agents - optimal_agents)/current_agents*100):.1f}%",
-            'implementation': 'Dynamic scheduling based on predictions',
-            'timeline': '2-3 weeks'
-        }
+        optimal_agents = int(self._weighted_percentile(values, counts, 85))  # 85th percentile
+        tail = (1 - confidence) / 2 * 100
+        low = int(np.floor(self._weighted_percentile(values, counts, tail)))
+        high = int(np.ceil(self._weighted_percentile(values, counts, 100 - tail)))
+        covered = counts[values <= optimal_agents].sum() / n_simulations
+        
+        return StaffingResult(
+            current_agents=historical_data.get('current_agents', optimal_agents + 5),
+            optimized_agents=optimal_agents,
+            interval_low=low,
+            interval_high=high,
+            confidence=confidence,
+            percentiles={
+                f"p{p}": round(float(self._weighted_percentile(values, counts, p)), 1)
+                for p in (5, 25, 50, 75, 85, 95)
+            },
+            coverage=float(covered),
+            simulations=n_simulations,
+            seed=seed
+        )
     
-    def apply_optimization_theorem_to_bpo(self, bpo_params: Dict) -> Dict[str, Any]:
+    def apply_monte_carlo_to_staffing(self, historical_data: Dict, n_simulations: int = 100000,
+                                      seed: Optional[int] = None, confidence: float = 0.90) -> Dict[str, Any]:
+        """Presentation dict of ``forecast_staffing``"""
+        return self.forecast_staffing(historical_data, n_simulations, seed, confidence).to_dict()
+    
+    def _staffing_distribution(self, base_volume: float, aht: float, service_level_target: float,
+                               n_simulations: int, seed: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """``_simulate_staffing``, memoized when seeded (an unseeded run is a fresh sample)"""
+        if seed is None:
+            return self._simulate_staffing(base_volume, aht, service_level_target, n_simulations, seed)
+        key = (base_volume, aht, service_level_target, n_simulations, seed)
+        if key not in self._staffing_cache:
+            self._staffing_cache[key] = self._simulate_staffing(*key)
+        return self._staffing_cache[key]
+    
+    def _simulate_staffing(self, base_volume: float, aht: float, service_level_target: float,
+                           n_simulations: int, seed: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distribution of required agents as (sorted values, counts).
+
+        Required agents are ceil(volume / capacity), optionally times the 1.1
+        service-level buffer, so each chunk reduces to two bincounts over the
+        integer agent count; chunk arrays are discarded after counting.
+        """
+        if n_simulations < 1:
+            raise ValueError("n_simulations must be at least 1")
+        # Independent streams for volume and buffer draws keep results chunk-size invariant
+        volume_rng, buffer_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(2))
+        calls_per_agent_per_hour = 3600 / aht  # calls per hour per agent
+        plain = np.zeros(0, dtype=np.int64)
+        buffered = np.zeros(0, dtype=np.int64)
+        
+        for start in range(0, n_simulations, self.MC_CHUNK_SIZE):
+            size = min(self.MC_CHUNK_SIZE, n_simulations - start)
+            # Simulate call volume with randomness (15% variability), 8-hour shift
+            calls_per_hour = base_volume * volume_rng.normal(1.0, 0.15, size) / 8
+            required = np.ceil(calls_per_hour / calls_per_agent_per_hour).clip(min=0).astype(np.int64)
+            # Buffer for service level
+            needs_buffer = buffer_rng.random(size) < service_level_target
+            plain = self._add_counts(plain, np.bincount(required[~needs_buffer]))
+            buffered = self._add_counts(buffered, np.bincount(required[needs_buffer]))
+        
+        agents = np.arange(max(len(plain), len(buffered)))
+        values = np.concatenate([agents[:len(plain)], agents[:len(buffered)] * 1.1])
+        counts = np.concatenate([plain, buffered])
+        order = np.argsort(values, kind='stable')
+        values, counts = values[order], counts[order]
+        keep = counts > 0
+        return values[keep], counts[keep]
+    
+    @staticmethod
+    def _add_counts(total: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        if len(counts) > len(total):
+            total = np.pad(total, (0, len(counts) - len(total)))
+        total[:len(counts)] += counts
+        return total
+    
+    @staticmethod
+    def _weighted_percentile(values: np.ndarray, counts: np.ndarray, q: float) -> float:
+        """Percentile of the expanded sample (inverted-CDF definition) without expanding it"""
+        rank = np.ceil(q / 100 * counts.sum())
+        return values[min(np.searchsorted(np.cumsum(counts), max(rank, 1)), len(values) - 1)]
+    
+    def optimize_operations(self, bpo_params: Dict) -> OverallOptimizationResult:
         """
         Apply Optimization Performance Theorem to overall BPO operations
         Real implementation for comprehensive optimization
@@ -173,23 +225,17 @@ class BPOTheoremBridge:
         ]
         
         # Calculate overall optimization
-        total_improvement = 0
-        weighted_improvement = 0
         optimizations = []
         
         for area in optimization_areas:
             current = area['current']
             target = area['target']
-            weight = area['weight']
             
             if current <= 0:
                 improvement = 0
             else:
                 improvement = ((target - current) / current) * 100
             
-            total_improvement += improvement
-            weighted_improvement += improvement * weight
-            
             # Calculate savings for cost-related areas
             if area['area'] == 'Cost per Call':
                 calls_per_month = bpo_params.get('calls_per_month', 10000)
@@ -199,28 +245,22 @@ class BPOTheoremBridge:
             else:
                 savings = monthly_cost * (improvement / 100) * 0.1  # 10% of improvement converts to savings
             
-            optimizations.append({
-                'area': area['area'],
-                'current': current,
-                'target': target,
-                'improvement_percentage': improvement,
-                'monthly_savings_php': savings
-            })
-        
-        total_savings = sum(o['monthly_savings_php'] for o in optimizations)
-        
-        return {
-            'theorem_applied': 'Optimization Performance Theorem (Theorem 13)',
-            'optimization': 'Multi-objective BPO optimization',
-            'overall_improvement': f"{weighted_improvement:.1f}%",
-            'total_monthly_savings': f"PHP {total_savings:,.0f}",
-            'optimization_areas': optimizations,
-            'implementation_priority': self._get_implementation_priority(optimizations),
-            'expected_timeline': '8-12 weeks for full implementation',
-            'roi_months': 2.5
-        }
+            optimizations.append(AreaOptimization(
+                area=area['area'],
+                current=current,
+                target=target,
+                weight=area['weight'],
+                improvement_percentage=improvement,
+                monthly_savings_php=savings
+            ))
+        
+        return OverallOptimizationResult(areas=optimizations)
     
-    def generate_bpo_report(self, bpo_data: Dict = None) -> Dict[str, Any]:
+    def apply_optimization_theorem_to_bpo(self, bpo_params: Dict) -> Dict[str, Any]:
+        """Presentation dict of ``optimize_operations``"""
+        return self.optimize_operations(bpo_params).to_dict()
+    
+    def build_bpo_report(self, bpo_data: Dict = None, staffing_seed: Optional[int] = None) -> BPOReport:
         """
         Generate complete BPO optimization report
         Real business report with actionable insights
@@ -234,85 +274,72 @@ class BPOTheoremBridge:
             }
         
         # Apply all major theorems
-        cost_optimization = self.apply_shor_to_cost_structure(bpo_data)
-        staffing_optimization = self.apply_monte_carlo_to_staffing({
-            'current_agents': bpo_data.get('agent_count', 50)
-        })
-        overall_optimization = self.apply_optimization_theorem_to_bpo(bpo_data)
-        
-        # Parse savings from results
-        def parse_savings(savings_str):
-            try:
-                # Extract number from "PHP X,XXX"
-                num_str = savings_str.replace('PHP', '').replace(',', '').strip()
-                return float(num_str)
-            except:
-                return 0
-        
-        shor_savings = parse_savings(cost_optimization['monthly_savings'])
-        monte_savings = parse_savings(staffing_optimization['monthly_savings'])
-        overall_savings = parse_savings(overall_optimization['total_monthly_savings'])
-        
-        total_savings = shor_savings + monte_savings + overall_savings
+        return BPOReport(
+            cost_structure=self.optimize_cost_structure(bpo_data),
+            staffing=self.forecast_staffing({
+                'current_agents': bpo_data.get('agent_count', 50),
+                **{key: bpo_data[key] for key in self.STAFFING_INPUTS if key in bpo_data}
+            }, seed=staffing_seed),
+            overall=self.optimize_operations(bpo_data)
+        )
+    
+    def generate_bpo_report(self, bpo_data: Dict = None) -> Dict[str, Any]:
+        """Presentation dict of ``build_bpo_report``"""
+        return self.build_bpo_report(bpo_data).to_dict()
+    
+    def iter_site_reports(self, sites: List[Dict], workers: Optional[int] = None,
+                          seed: int = 0) -> Iterator[Tuple[int, BPOReport]]:
+        """
+        Yield ``(site index, report)`` as sites finish, in completion order.
+
+        Sites without their own call history share one seeded staffing
+        simulation, computed here once and shipped to each worker. Sites are
+        sent to the process pool in chunks; with one worker, or too few sites
+        to fill a chunk per worker, everything runs in-process.
+        """
+        workers = workers or os.cpu_count() or 1
+        indexed = list(enumerate(sites))
+        # Shared precomputation: the default staffing distribution
+        self.forecast_staffing({}, seed=seed)
+        
+        chunk_size = max(1, math.ceil(len(indexed) / (workers * 4)))
+        if workers <= 1 or len(indexed) <= chunk_size:
+            for index, site in indexed:
+                yield index, self.build_bpo_report(site, staffing_seed=seed)
+            return
+        
+        chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_portfolio_worker,
+                                 initargs=(self._staffing_cache,)) as pool:
+            futures = [pool.submit(_portfolio_chunk, chunk, seed) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+    
+    def generate_portfolio_report(self, sites: List[Dict], workers: Optional[int] = None,
+                                  progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+                                  seed: int = 0) -> Dict[str, Any]:
+        """
+        Optimization reports for many sites plus a consolidated summary.
         
-        # Calculate ROI
-        implementation_cost = 250000  # PHP
-        monthly_savings = total_savings
-        roi_months = implementation_cost / monthly_savings if monthly_savings > 0 else 0
+        ``progress(done, total, site)`` is called as each site finishes, with
+        that site's rendered summary, so callers can stream results.
+        """
+        reports: List[Optional[BPOReport]] = [None] * len(sites)
+        site_summaries: List[Optional[Dict[str, Any]]] = [None] * len(sites)
+        for done, (index, report) in enumerate(self.iter_site_reports(sites, workers, seed), 1):
+            reports[index] = report
+            site_summaries[index] = {
+                'site_id': sites[index].get('site_id', f"site_{index + 1}"),
+                'report_id': report.report_id,
+                **report.to_dict()['executive_summary']
+            }
+            if progress:
+                progress(done, len(sites), site_summaries[index])
         
         return {
-            'report_id': f"BPO-OPT-{datetime.now().strftime('%Y%m%d')}",
-            'generation_date': datetime.now().isoformat(),
-            'executive_summary': {
-                'total_monthly_savings': f"PHP {total_savings:,.0f}",
-                'annual_savings': f"PHP {total_savings * 12:,.0f}",
-                'roi_months': f"{roi_months:.1f} months",
-                'efficiency_gain': "18-37% improvement",
-                'key_recommendations': 3
-            },
-            'detailed_optimizations': {
-                'cost_structure': cost_optimization,
-                'staffing_optimization': staffing_optimization,
-                'overall_optimization': overall_optimization
-            },
-            'implementation_roadmap': [
-                {
-                    'phase': 1,
-                    'duration': 'Weeks 1-4',
-                    'focus': 'Cost Structure Optimization',
-                    'theorem': 'Shor Factorization (Theorem 1)',
-                    'expected_savings': f"PHP {shor_savings:,.0f}/month",
-                    'resources': ['Finance Team', 'BPO Manager', 'Data Analyst']
-                },
-                {
-                    'phase': 2,
-                    'duration': 'Weeks 5-8',
-                    'focus': 'Staffing Optimization',
-                    'theorem': 'Monte Carlo (Theorem 8)',
-                    'expected_savings': f"PHP {monte_savings:,.0f}/month",
-                    'resources': ['Operations Manager', 'HR', 'Analytics Team']
-                },
-                {
-                    'phase': 3,
-                    'duration': 'Weeks 9-12',
-                    'focus': 'Overall System Optimization',
-                    'theorem': 'Optimization Performance (Theorem 13)',
-                    'expected_savings': f"PHP {overall_savings:,.0f}/month",
-                    'resources': ['All Teams', 'Executive Sponsor']
-                }
-            ],
-            'risk_assessment': {
-                'implementation_risk': 'Medium',
-                'financial_risk': 'Low',
-                'operational_risk': 'Medium',
-                'mitigation_strategy': 'Phased implementation with pilot testing'
-            },
-            'success_metrics': [
-                'Monthly savings ≥ PHP 150,000',
-                'Service level ≥ 85%',
-                'Agent utilization ≥ 75%',
-                'ROI within 3 months'
-            ]
+            'portfolio_summary': aggregate_reports(reports).to_dict(),
+            'sites': site_summaries,
+            'generation_date': datetime.now().isoformat()
         }
     
     def optimize_daily_operations(self, daily_data: Dict) -> Dict[str, Any]:
@@ -324,9 +351,11 @@ class BPOTheoremBridge:
         agents_available = daily_data.get('agents_available', 20)
         shift_hours = daily_data.get('shift_hours', 8)
         
-        # Calculate optimal daily schedule
+        aht = daily_data.get('avg_handle_time', 300)  # seconds
+        
+        # Calculate optimal daily schedule: Erlang C agents for 80% answered in 20s
         calls_per_hour = calls_expected / shift_hours
-        optimal_agents_per_hour = np.ceil(calls_per_hour / 12)  # 12 calls/agent/hour
+        optimal_agents_per_hour = int(get_erlang_staffing().required_agents(calls_per_hour, aht, interval_seconds=3600))
         
         # Stagger breaks for continuous coverage
         break_schedule = self._create_break_schedule(agents_available)
@@ -344,7 +373,7 @@ class BPOTheoremBridge:
         
         daily_savings = current_daily_cost - optimized_daily_cost
         
-        return {
+        result = {
             'date': datetime.now().strftime('%Y-%m-%d'),
             'calls_expected': calls_expected,
             'current_agents': agents_available,
@@ -360,6 +389,27 @@ class BPOTheoremBridge:
                 'Track first call resolution hourly'
             ]
         }
+        
+        # Interval-level plan when a (queues x intervals) demand matrix is supplied
+        if 'interval_demand' in daily_data:
+            result['interval_plan'] = self.plan_intervals(
+                daily_data['interval_demand'],
+                aht,
+                queue_names=daily_data.get('queues'),
+                interval_minutes=daily_data.get('interval_minutes', 15)
+            ).to_dict()
+        
+        return result
+    
+    def plan_intervals(self, demand, aht, queue_names: Optional[List[str]] = None,
+                       interval_minutes: int = 15, start_minute: int = 0) -> DailyPlan:
+        """
+        Array plan for a ``(..., queues, intervals)`` demand matrix: Erlang C
+        requirements, peak uplift and break coverage. Call ``to_dict()`` on
+        the result only when a rendered schedule is needed.
+        """
+        planner = IntervalPlanner(interval_minutes=interval_minutes)
+        return planner.plan(demand, aht, queue_names=queue_names, start_minute=start_minute)
     
     def _generate_sample_call_data(self) -> List[int]:
         """Generate sample call data for testing"""
@@ -370,27 +420,6 @@ class BPOTheoremBridge:
             pattern.extend([calls] * 3)  # Repeat for multiple days
         return pattern[:30]  # 30 days of data
     
-    def _get_implementation_priority(self, optimizations: List[Dict]) -> List[Dict]:
-        """Get implementation priority based on savings"""
-        sorted_optimizations = sorted(
-            optimizations, 
-            key=lambda x: x['monthly_savings_php'], 
-            reverse=True
-        )
-        
-        priority_list = []
-        for i, opt in enumerate(sorted_optimizations, 1):
-            priority_list.append({
-                'priority': i,
-                'area': opt['area'],
-                'monthly_savings': f"PHP {opt['monthly_savings_php']:,.0f}",
-                'improvement': f"{opt['improvement_percentage']:.1f}%",
-                'timeline_weeks': i * 2,
-                'complexity': 'Low' if i == 1 else 'Medium' if i == 2 else 'High'
-            })
-        
-        return priority_list
-    
     def _create_break_schedule(self, agent_count: int) -> Dict[str, List]:
         """Create staggered break schedule"""
         return {
@@ -408,25 +437,29 @@ class BPOTheoremBridge:
     def _create_daily_schedule(self, agents: int, shift_hours: int) -> Dict[str, Any]:
         """Create optimal daily schedule"""
         start_hour = 8
-        schedule = {}
         
-        for hour in range(shift_hours):
-            hour_key = f"{start_hour + hour:02d}:00"
-            
-            # Base agents with variations
-            base_agents = max(5, agents * 0.85)  # 85% available at any time
-            
-            # Adjust for typical patterns
-            if hour in [0, 7]:  # First and last hour
-                schedule[hour_key] = int(base_agents * 0.9)
-            elif hour in [2, 5]:  # Typical low periods
-                schedule[hour_key] = int(base_agents * 0.8)
-            elif hour in [3, 4]:  # Peak periods
-                schedule[hour_key] = int(base_agents * 1.1)
-            else:
-                schedule[hour_key] = int(base_agents)
+        # Base agents with variations
+        base_agents = max(5, agents * 0.85)  # 85% available at any time
         
-        return schedule
+        # Adjust for typical patterns
+        pattern = np.ones(shift_hours)
+        pattern[[h for h in (0, 7) if h < shift_hours]] = 0.9  # First and last hour
+        pattern[[h for h in (2, 5) if h < shift_hours]] = 0.8  # Typical low periods
+        pattern[[h for h in (3, 4) if h < shift_hours]] = 1.1  # Peak periods
+        
+        staffed = (base_agents * pattern).astype(np.int64).tolist()
+        return {f"{start_hour + hour:02d}:00": n for hour, n in enumerate(staffed)}
+
+# Portfolio workers: one bridge per process, seeded with the parent's precomputation
+_worker_bridge: Optional[BPOTheoremBridge] = None
+
+def _init_portfolio_worker(staffing_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]]):
+    global _worker_bridge
+    _worker_bridge = BPOTheoremBridge()
+    _worker_bridge._staffing_cache.update(staffing_cache)
+
+def _portfolio_chunk(chunk: List[Tuple[int, Dict]], seed: int) -> List[Tuple[int, BPOReport]]:
+    return [(index, _worker_bridge.build_bpo_report(site, staffing_seed=seed)) for index, site in chunk]
 
 # Quick test
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+"""
+CODE ANALYZER - Single-pass safety analysis for generated code
+Parses once, walks once, memoizes the verdicts by code hash
+"""
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+EVOLVER_SAFE_IMPORTS = frozenset({'os', 'sys', 'datetime', 'json', 'math', 'random', 'sympy'})
+DANGEROUS_CALLS = frozenset({'eval', 'exec', '__import__'})
+SYSTEM_MODULES = frozenset({'os', 'sys', 'subprocess'})
+MATH_NODES = (ast.BinOp, ast.Call)
+
+
+@dataclass(frozen=True)
+class CodeAnalysis:
+    """Every verdict the evolve loop needs about one piece of code"""
+    digest: str
+    syntax_ok: bool
+    syntax_error: Optional[str] = None
+    imports: Tuple[str, ...] = ()
+    dangerous_calls: Tuple[Tuple[str, int], ...] = ()
+    dangerous_patterns: Tuple[str, ...] = ()
+    dunder_names: Tuple[str, ...] = ()
+    system_access: Tuple[str, ...] = ()
+    calls_open: bool = False
+    math_node_count: int = 0
+    first_math_expr: Optional[str] = None
+    tree: Optional[ast.Module] = field(default=None, compare=False, repr=False)
+
+    @property
+    def unsafe_imports(self) -> Tuple[str, ...]:
+        return tuple(mod for mod in self.imports if mod not in EVOLVER_SAFE_IMPORTS)
+
+    @property
+    def evolver_safe(self) -> bool:
+        """Evolver policy: whitelisted imports, no eval/exec/__import__, no shell/file-write patterns"""
+        return (self.syntax_ok and not self.unsafe_imports
+                and not self.dangerous_calls and not self.dangerous_patterns)
+
+    @property
+    def sandbox_violations(self) -> List[str]:
+        """Sandbox policy: no imports, dunders, eval/exec, open() or os/sys/subprocess access"""
+        violations = []
+        if self.imports:
+            violations.append(f"import {self.imports[0]}")
+        if self.dunder_names:
+            violations.append(f"dunder access {self.dunder_names[0]}")
+        if self.dangerous_calls:
+            violations.append(f"call to {self.dangerous_calls[0][0]}")
+        if self.calls_open:
+            violations.append("call to open")
+        if self.system_access:
+            violations.append(f"system access {self.system_access[0]}")
+        return violations
+
+    @property
+    def sandbox_safe(self) -> bool:
+        return self.syntax_ok and not self.sandbox_violations
+
+    @property
+    def reasons(self) -> List[str]:
+        """Human-readable reasons the Evolver policy rejects this code"""
+        if not self.syntax_ok:
+            return [f"Syntax error: {self.syntax_error}"]
+        reasons = [f"Unsafe import: {mod}" for mod in self.unsafe_imports]
+        reasons += [f"Unsafe {name} at line {lineno}" for name, lineno in self.dangerous_calls]
+        reasons += list(self.dangerous_patterns)
+        return reasons
+
+
+class _SafetyVisitor(ast.NodeVisitor):
+    """Collects imports, dangerous calls/patterns, dunder use and math nodes in one walk"""
+
+    def __init__(self):
+        self.imports: List[str] = []
+        self.dangerous_calls: List[Tuple[str, int]] = []
+        self.dangerous_patterns: List[str] = []
+        self.dunder_names: List[str] = []
+        self.system_access: List[str] = []
+        self.calls_open = False
+        self.math_node_count = 0
+        self.first_math: Optional[ast.AST] = None
+        self._first_math_depth = None
+        self._depth = 0
+
+    def generic_visit(self, node):
+        if isinstance(node, MATH_NODES):
+            self.math_node_count += 1
+            # Shallowest-first matches the breadth-first order of ast.walk
+            if self._first_math_depth is None or self._depth < self._first_math_depth:
+                self.first_math, self._first_math_depth = node, self._depth
+        self._depth += 1
+        super().generic_visit(node)
+        self._depth -= 1
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self._add_import(alias.name)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        self._add_import(node.module or "")
+        self.generic_visit(node)
+
+    def _add_import(self, name: str):
+        module = name.split('.')[0]
+        self.imports.append(module)
+        if '__' in name:
+            self.dunder_names.append(name)
+
+    def visit_Call(self, node):
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+        if name in DANGEROUS_CALLS:
+            self.dangerous_calls.append((name, node.lineno))
+        elif name == 'open':
+            self.calls_open = True
+            mode = node.args[1] if len(node.args) > 1 else next(
+                (kw.value for kw in node.keywords if kw.arg == 'mode'), None)
+            if isinstance(mode, ast.Constant) and isinstance(mode.value, str) and (
+                    '+' in mode.value or 'w' in mode.value or 'a' in mode.value):
+                self.dangerous_patterns.append(f"File write via open(mode={mode.value!r}) at line {node.lineno}")
+        elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) \
+                and func.value.id == 'os' and func.attr in ('system', 'popen'):
+            self.dangerous_patterns.append(f"Shell call os.{func.attr} at line {node.lineno}")
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        if '__' in node.attr:
+            self.dunder_names.append(node.attr)
+        if isinstance(node.value, ast.Name) and node.value.id in SYSTEM_MODULES:
+            self.system_access.append(f"{node.value.id}.{node.attr}")
+            if node.value.id == 'subprocess':
+                self.dangerous_patterns.append(f"subprocess.{node.attr} at line {node.lineno}")
+        elif node.attr.lstrip('_') in SYSTEM_MODULES:
+            # Reached through another module, e.g. datetime.sys or collections._sys
+            self.system_access.append(f".{node.attr}")
+        self.generic_visit(node)
+
+    def visit_Name(self, node):
+        if '__' in node.id:
+            self.dunder_names.append(node.id)
+        self.generic_visit(node)
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, str):
+            if 'rm -rf' in node.value:
+                self.dangerous_patterns.append(f"Shell pattern 'rm -rf' at line {node.lineno}")
+            if '__' in node.value:
+                self.dunder_names.append(node.value)
+
+    def visit_Delete(self, node):
+        for target in node.targets:
+            if isinstance(target, ast.Attribute) and target.attr == '__class__':
+                self.dangerous_patterns.append(f"del of __class__ at line {node.lineno}")
+        self.generic_visit(node)
+
+
+_MAX_ENTRIES = 2048
+_cache: "OrderedDict[str, CodeAnalysis]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _analyze_uncached(code: str, digest: str) -> CodeAnalysis:
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError) as e:
+        return CodeAnalysis(digest=digest, syntax_ok=False, syntax_error=str(e))
+
+    visitor = _SafetyVisitor()
+    visitor.visit(tree)
+    first_math_expr = None
+    if visitor.first_math is not None:
+        try:
+            first_math_expr = ast.unparse(visitor.first_math)
+        except Exception:
+            first_math_expr = None
+
+    return CodeAnalysis(
+        digest=digest,
+        syntax_ok=True,
+        imports=tuple(visitor.imports),
+        dangerous_calls=tuple(visitor.dangerous_calls),
+        dangerous_patterns=tuple(visitor.dangerous_patterns),
+        dunder_names=tuple(visitor.dunder_names),
+        system_access=tuple(visitor.system_access),
+        calls_open=visitor.calls_open,
+        math_node_count=visitor.math_node_count,
+        first_math_expr=first_math_expr,
+        tree=tree,
+    )
+
+
+def analyze(code: str) -> CodeAnalysis:
+    """Analyze `code`, parsing it only the first time this exact source is seen"""
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+    with _cache_lock:
+        cached = _cache.get(digest)
+        if cached is not None:
+            _cache.move_to_end(digest)
+            _cache_stats["hits"] += 1
+            return cached
+        _cache_stats["misses"] += 1
+
+    analysis = _analyze_uncached(code, digest)
+    with _cache_lock:
+        _cache[digest] = analysis
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return analysis
+
+
+def analysis_cache_info() -> Dict[str, Any]:
+    """Memo counters: misses equal the number of actual parses"""
+    with _cache_lock:
+        return {**_cache_stats, "entries": len(_cache), "max_entries": _MAX_ENTRIES}
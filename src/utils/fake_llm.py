@@ -0,0 +1,74 @@
+"""
+FAKE LLM CLIENT - Local stand-in for openai.AsyncOpenAI
+Mimics client.chat.completions.create for tests and offline runs
+"""
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Union
+
+
+class _Completions:
+    def __init__(self, owner: "FakeAsyncOpenAI"):
+        self._owner = owner
+
+    async def create(self, model: str = "", messages: List[Dict] = None, **kwargs):
+        return await self._owner._complete(model, messages or [], kwargs)
+
+
+class _Chat:
+    def __init__(self, owner: "FakeAsyncOpenAI"):
+        self.completions = _Completions(owner)
+
+
+class FakeAsyncOpenAI:
+    """
+    Drop-in fake for ``openai.AsyncOpenAI`` chat completions.
+
+    ``responses`` are returned in order (cycling), or ``responder(messages)``
+    builds each reply. ``latency`` is seconds per call, or a callable taking
+    the call index. Tracks calls, concurrency and cancellations so tests can
+    assert on how the client was driven.
+    """
+
+    def __init__(self, responses: Optional[List[str]] = None,
+                 latency: Union[float, Callable[[int], float]] = 0.05,
+                 responder: Optional[Callable[[List[Dict]], str]] = None):
+        self.chat = _Chat(self)
+        self._responses = itertools.cycle(responses or ["Mock completion"])
+        self._latency = latency
+        self._responder = responder
+        self._counter = itertools.count()
+        self.calls: List[Dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def _complete(self, model: str, messages: List[Dict], kwargs: Dict):
+        index = next(self._counter)
+        self.calls.append({"model": model, "messages": messages, **kwargs})
+        delay = self._latency(index) if callable(self._latency) else self._latency
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        content = self._responder(messages) if self._responder else next(self._responses)
+        prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        return SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, message=SimpleNamespace(role="assistant", content=content))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens
+            )
+        )
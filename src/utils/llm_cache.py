@@ -0,0 +1,236 @@
+"""
+LLM RESPONSE CACHE - Content-addressed cache for chat completions
+In-memory LRU in front of a SQLite file shared across processes,
+with TTLs and coalescing of in-flight duplicate prompts
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(model: str, messages: List[Dict], temperature: Optional[float] = None,
+              max_tokens: Optional[int] = None) -> str:
+    """SHA-256 of the canonical JSON form of (model, messages, temperature, max_tokens)"""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+        sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _InFlight:
+    """An upstream call shared by every caller awaiting the same key"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class LLMCache:
+    """Two-level (memory LRU + SQLite) cache for chat completion contents"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1024, ttl_seconds: float = 86400):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[float, str, float]]" = OrderedDict()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "saved_latency_s": 0.0,
+        }
+        if path:
+            self._open_db(path)
+
+    def _open_db(self, path: str):
+        try:
+            self._db = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    latency REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache disk tier disabled ({path}): {e}")
+            self._db = None
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, expires_at: float, content: str, latency: float):
+        self._memory[key] = (expires_at, content, latency)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, content, latency = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                self.stats["memory_hits"] += 1
+                self.stats["saved_latency_s"] += latency
+                return content
+            del self._memory[key]
+
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT content, latency, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[2] <= now:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                row = None
+        if row is None:
+            return None
+
+        content, latency, expires_at = row
+        self._remember(key, expires_at, content, latency)
+        self.stats["hits"] += 1
+        self.stats["disk_hits"] += 1
+        self.stats["saved_latency_s"] += latency
+        return content
+
+    def _store(self, key: str, content: str, latency: float, ttl: Optional[float]):
+        now = time.time()
+        expires_at = now + (self.ttl_seconds if ttl is None else ttl)
+        self._remember(key, expires_at, content, latency)
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, content, latency, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, content, latency, now, expires_at)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def complete(self, client, model: str, messages: List[Dict],
+                       temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                       ttl: Optional[float] = None) -> str:
+        """Return the completion content for this prompt, calling `client` only on a miss"""
+        key = cache_key(model, messages, temperature, max_tokens)
+
+        content = self._lookup(key)
+        if content is not None:
+            return content
+
+        entry = self._inflight.get(key)
+        if entry is None:
+            # The upstream call belongs to no caller: it runs until its last waiter leaves
+            task = asyncio.get_running_loop().create_task(
+                self._fetch(client, key, model, messages, temperature, max_tokens, ttl))
+            entry = self._inflight[key] = _InFlight(task)
+            task.add_done_callback(lambda _, entry=entry: self._forget(key, entry))
+            self.stats["misses"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                self._forget(key, entry)
+                entry.task.cancel()
+
+    async def _fetch(self, client, key: str, model: str, messages: List[Dict],
+                     temperature: Optional[float], max_tokens: Optional[int], ttl: Optional[float]) -> str:
+        kwargs = {"model": model, "messages": messages}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+
+        try:
+            start = time.perf_counter()
+            response = await client.chat.completions.create(**kwargs)
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        content = response.choices[0].message.content
+        self._store(key, content, time.perf_counter() - start, ttl)
+        return content
+
+    def _forget(self, key: str, entry: "_InFlight"):
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers; returns rows removed from disk"""
+        now = time.time()
+        for key in [k for k, (expires_at, _, _) in self._memory.items() if expires_at <= now]:
+            del self._memory[key]
+        if self._db is None:
+            return 0
+        with self._db_lock:
+            return self._db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+
+    def clear(self):
+        self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus derived hit rate, for metrics endpoints"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "in_flight": len(self._inflight),
+            "path": self.path,
+        }
+
+
+_default_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide cache configured from LLM_CACHE_PATH / LLM_CACHE_SIZE / LLM_CACHE_TTL"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMCache(
+            path=os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite") or None,
+            max_entries=int(os.getenv("LLM_CACHE_SIZE", 1024)),
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL", 86400))
+        )
+    return _default_cache
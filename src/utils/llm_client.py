@@ -0,0 +1,325 @@
+"""
+SHARED LLM CLIENT - Rate-limited, adaptive wrapper around openai.AsyncOpenAI
+Token buckets on requests/min and tokens/min, AIMD concurrency,
+p95-based request hedging and per-call latency histograms
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class TokenBucket:
+    """
+    Continuous-refill token bucket. Callers reserve tokens up front and sleep
+    off any deficit, so waiting callers are served in arrival order without
+    needing a loop-bound lock.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        self._refill()
+        if self.tokens < amount:
+            return False
+        self.tokens -= amount
+        return True
+
+    def adjust(self, delta: float):
+        """Charge (positive) or refund (negative) once the real cost is known"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit: +1/limit per success (about +1 per window), halve on overload"""
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 64):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self._waiters: deque = deque()
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self):
+        while not self._has_slot():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()  # Pass the wake-up on
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def try_acquire(self) -> bool:
+        if not self._has_slot():
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            waiter.set_result(None)
+            free -= 1
+
+    def on_success(self):
+        self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_overload(self):
+        self.limit = max(float(self.minimum), self.limit / 2.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)"""
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float):
+        ms = seconds * 1000.0
+        index = next((i for i, bound in enumerate(self.bounds) if ms <= bound), len(self.bounds))
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the q-th quantile, capped at the observed max"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound:g}ms" for bound in self.bounds] + [f">{self.bounds[-1]:g}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    return (type(error).__name__ == "RateLimitError"
+            or getattr(error, "status_code", None) == 429)
+
+
+class LLMClient:
+    """
+    Drop-in for ``openai.AsyncOpenAI`` chat completions shared by every caller.
+
+    ``create`` waits on the request and token buckets, then on the AIMD
+    concurrency limit. Once enough latencies are recorded, it fires a second
+    (hedged) attempt if the first one outlives the observed p95. 429s halve
+    the concurrency limit and are retried with jittered backoff. The wrapped
+    client is built lazily with its own retries disabled, so every rate
+    limit is seen here.
+    """
+
+    def __init__(self, client=None, requests_per_minute: float = 500, tokens_per_minute: float = 200000,
+                 max_concurrency: int = 16, initial_concurrency: Optional[int] = None,
+                 hedge: bool = True, hedge_after: Optional[float] = None, hedge_min_samples: int = 20,
+                 max_retries: int = 3, backoff_base: float = 0.5, default_max_tokens: int = 256):
+        self._client = client
+        self.requests = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.concurrency = AdaptiveConcurrency(initial_concurrency or max(1, max_concurrency // 2),
+                                               maximum=max_concurrency)
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+        self.hedge_min_samples = hedge_min_samples
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.default_max_tokens = default_max_tokens
+        self.latency = LatencyHistogram()
+        self.counters = {
+            "requests": 0,
+            "attempts": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "errors": 0,
+            "tokens": 0,
+        }
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    @property
+    def client(self):
+        if self._client is None:
+            import openai
+            self._client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+        return self._client
+
+    def _estimate_tokens(self, kwargs: Dict) -> int:
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in kwargs.get("messages") or [])
+        return prompt_chars // 4 + (kwargs.get("max_tokens") or self.default_max_tokens)
+
+    def _hedge_delay(self) -> Optional[float]:
+        if not self.hedge:
+            return None
+        if self.hedge_after is not None:
+            return self.hedge_after
+        if self.latency.count < self.hedge_min_samples:
+            return None
+        return self.latency.quantile(0.95) / 1000.0
+
+    async def create(self, **kwargs):
+        self.counters["requests"] += 1
+        estimate = self._estimate_tokens(kwargs)
+
+        for attempt in range(self.max_retries + 1):
+            await self.requests.acquire(1)
+            await self.token_bucket.acquire(estimate)
+            try:
+                response = await self._hedged(kwargs)
+            except Exception as e:
+                if _is_rate_limit(e) and attempt < self.max_retries:
+                    self.counters["retries"] += 1
+                    delay = self.backoff_base * (2 ** attempt)
+                    await asyncio.sleep(delay * (0.5 + random.random()))
+                    continue
+                self.counters["errors"] += 1
+                raise
+
+            usage = getattr(response, "usage", None)
+            used = getattr(usage, "total_tokens", None)
+            if used is not None:
+                self.counters["tokens"] += used
+                self.token_bucket.adjust(used - estimate)
+            return response
+
+    async def _attempt(self, kwargs: Dict):
+        """One upstream call; the caller has already taken a concurrency slot"""
+        self.counters["attempts"] += 1
+        start = time.perf_counter()
+        try:
+            response = await self.client.chat.completions.create(**kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if _is_rate_limit(e):
+                self.counters["rate_limited"] += 1
+                self.concurrency.on_overload()
+            raise
+        else:
+            self.latency.observe(time.perf_counter() - start)
+            self.concurrency.on_success()
+            return response
+        finally:
+            self.concurrency.release()
+
+    async def _hedged(self, kwargs: Dict):
+        await self.concurrency.acquire()
+        primary = asyncio.ensure_future(self._attempt(kwargs))
+        pending = {primary}
+        hedge = None
+        error = None
+        try:
+            delay = self._hedge_delay()
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                # Hedge only with spare capacity, never by queueing behind others
+                if not done and self.concurrency.try_acquire():
+                    if self.requests.try_acquire(1):
+                        hedge = asyncio.ensure_future(self._attempt(kwargs))
+                        pending.add(hedge)
+                        self.counters["hedges"] += 1
+                    else:
+                        self.concurrency.release()
+                pending |= done
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.counters["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "in_flight": self.concurrency.in_flight,
+            "hedge_delay_s": self._hedge_delay(),
+            "latency": self.latency.snapshot(),
+        }
+
+
+_shared_client: Optional[LLMClient] = None
+
+
+def get_shared_client() -> LLMClient:
+    """Process-wide client configured from LLM_RPM / LLM_TPM / LLM_MAX_CONCURRENCY / LLM_HEDGE"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = LLMClient(
+            requests_per_minute=float(os.getenv("LLM_RPM", 500)),
+            tokens_per_minute=float(os.getenv("LLM_TPM", 200000)),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", 16)),
+            hedge=os.getenv("LLM_HEDGE", "1") not in ("0", "false", "False")
+        )
+    return _shared_client
@@ -1,41 +1,306 @@
-import ast
+"""
+SANDBOX - Process-isolated execution of generated code
+Pre-forked worker pool with CPU/memory rlimits and wall-clock kill-and-respawn
+"""
+
+import asyncio
+import atexit
 import builtins
+import collections
+import datetime
+import hashlib
+import itertools
+import json
+import logging
+import math
+import multiprocessing as mp
+import os
+import pickle
+import queue
+import re
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional
 
-class Sandbox:
-    SAFE_MODULES = ['math', 'json', 'datetime', 're', 'collections', 'itertools']
-    UNSAFE_KEYWORDS = ['__', 'eval', 'exec', 'import', 'open', 'os.', 'sys.', 'subprocess']
-  
-    def execute(self, code: str) -> dict:
+from .code_analysis import analyze
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Imported up front so forked workers never touch the import machinery
+SAFE_MODULES = {
+    'math': math,
+    'json': json,
+    'datetime': datetime,
+    're': re,
+    'collections': collections,
+    'itertools': itertools,
+}
+BLOCKED_BUILTINS = {'exec', 'eval', 'compile', '__import__', 'open', 'input', 'breakpoint'}
+
+# Per-worker compiled code, keyed by the analysis digest the parent vetted
+_MAX_COMPILED = 256
+_compiled_cache: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+
+
+def _compiled(digest: str, code: str):
+    """Code object for `code`, compiling each digest once per worker"""
+    compiled = _compiled_cache.get(digest)
+    if compiled is not None:
+        _compiled_cache.move_to_end(digest)
+        return compiled
+    compiled = _compiled_cache[digest] = compile(code, "<sandbox>", "exec")
+    while len(_compiled_cache) > _MAX_COMPILED:
+        _compiled_cache.popitem(last=False)
+    return compiled
+
+
+def _run_code(digest: str, code: str) -> dict:
+    """Execute vetted code with restricted builtins (runs inside a worker process)"""
+    try:
+        safe_globals = {
+            '__builtins__': {
+                k: v for k, v in builtins.__dict__.items()
+                if not k.startswith('_') and k not in BLOCKED_BUILTINS
+            },
+            **SAFE_MODULES
+        }
+        exec(_compiled(digest, code), safe_globals)
+
+        if 'result' in safe_globals:
+            result = safe_globals['result']
+            try:
+                pickle.dumps(result)
+            except Exception:
+                result = repr(result)
+            return {"safe": True, "result": result}
+
+        return {"safe": True, "result": "Code executed successfully"}
+
+    except MemoryError:
+        return {"safe": False, "error": "Execution error: memory limit exceeded"}
+    except Exception as e:
+        return {"safe": False, "error": f"Execution error: {str(e)}"}
+
+
+def _address_space_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmSize:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _cpu_seconds_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _worker_main(conn, cpu_seconds: int, memory_mb: int):
+    """Worker loop: apply rlimits, then execute one job per message until the pipe closes"""
+    if resource is not None and memory_mb:
+        # Cap growth relative to the forked image, which already holds the parent's mappings
+        base = _address_space_bytes() or 0
+        limit = base + memory_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+        except (ValueError, OSError):
+            pass
+
+    while True:
         try:
-            for keyword in self.UNSAFE_KEYWORDS:
-                if keyword in code:
-                    return {"safe": False, "error": f"Unsafe keyword: {keyword}"}
-          
-            ast.parse(code)
-          
-            safe_globals = {
-                '__builtins__': {
-                    k: v for k, v in builtins.__dict__.items()
-                    if not k.startswith('_') and k not in ['exec', 'eval', 'compile', '__import__']
-                }
-            }
-          
-            for mod_name in self.SAFE_MODULES:
-                try:
-                    module = __import__(mod_name)
-                    safe_globals[mod_name] = module
-                except ImportError:
-                    pass
-          
-            exec(code, safe_globals, {})
-          
-            if 'result' in safe_globals:
-                result = safe_globals['result']
-                return {"safe": True, "result": result}
-          
-            return {"safe": True, "result": "Code executed successfully"}
-          
-        except SyntaxError as e:
-            return {"safe": False, "error": f"Syntax error: {str(e)}"}
-        except Exception as e:
-            return {"safe": False, "error": f"Execution error: {str(e)}"}
\ No newline at end of file
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+
+        if resource is not None and cpu_seconds:
+            # RLIMIT_CPU is cumulative per process, so re-arm it relative to usage so far
+            soft = int(_cpu_seconds_used()) + cpu_seconds
+            try:
+                resource.setrlimit(resource.RLIMIT_CPU, (soft, resource.getrlimit(resource.RLIMIT_CPU)[1]))
+            except (ValueError, OSError):
+                pass
+
+        conn.send(_run_code(*job))
+
+
+class SandboxPool:
+    """
+    Pool of pre-forked sandbox worker processes fed from a job queue.
+
+    Each worker slot has a supervisor thread that takes jobs from the shared
+    queue, ships the code to its worker over a pipe, and waits up to the
+    wall-clock timeout. A worker that times out, exceeds its CPU rlimit
+    (SIGXCPU) or dies for any other reason is killed and respawned. The
+    caller gets an error result, and the API process is never at risk.
+    """
+
+    def __init__(self, workers: int = None, cpu_seconds: int = 2, memory_mb: int = 256, timeout: float = 5.0):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.timeout = timeout
+        self._ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._threads = []
+        self._started = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "completed": 0, "timeouts": 0, "crashes": 0, "respawns": 0}
+
+    def start(self) -> "SandboxPool":
+        with self._lock:
+            if self._started:
+                return self
+            self._started = True
+            for slot in range(self.workers):
+                # Fork every worker up front; supervisors only respawn after a kill
+                proc, conn = self._spawn()
+                thread = threading.Thread(target=self._supervise, args=(proc, conn),
+                                          name=f"sandbox-{slot}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(target=_worker_main, args=(child_conn, self.cpu_seconds, self.memory_mb),
+                                 daemon=True)
+        proc.start()
+        child_conn.close()
+        return proc, parent_conn
+
+    @staticmethod
+    def _kill(proc, conn):
+        try:
+            conn.close()
+        except OSError:
+            pass
+        if proc.is_alive():
+            proc.kill()
+        proc.join(timeout=1.0)
+
+    def _supervise(self, proc, conn):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            source, timeout, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                conn.send(source)
+                if conn.poll(timeout):
+                    result = conn.recv()
+                else:
+                    self.stats["timeouts"] += 1
+                    result = {"safe": False, "error": f"Execution error: timed out after {timeout:.1f}s"}
+                    self._kill(proc, conn)
+                    proc, conn = self._spawn()
+                    self.stats["respawns"] += 1
+            except (EOFError, OSError):
+                # Worker died mid-job: CPU rlimit, OOM kill or a hard crash
+                self._kill(proc, conn)
+                self.stats["crashes"] += 1
+                result = {"safe": False, "error": f"Execution error: worker killed (exit code {proc.exitcode})"}
+                proc, conn = self._spawn()
+                self.stats["respawns"] += 1
+
+            self.stats["completed"] += 1
+            future.set_result(result)
+
+        try:
+            conn.send(None)
+        except OSError:
+            pass
+        self._kill(proc, conn)
+
+    def submit(self, code: str, timeout: float = None, digest: str = None) -> Future:
+        """Queue code for execution; the returned Future resolves to the result dict.
+
+        ``digest`` (the code analysis hash) keys the workers' compiled-code cache.
+        """
+        if self._closed:
+            raise RuntimeError("Sandbox pool is shut down")
+        self.start()
+        if digest is None:
+            digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+        future: Future = Future()
+        self.stats["submitted"] += 1
+        self._jobs.put(((digest, code), timeout or self.timeout, future))
+        return future
+
+    def run(self, code: str, timeout: float = None, digest: str = None) -> dict:
+        return self.submit(code, timeout, digest).result()
+
+    async def run_async(self, code: str, timeout: float = None, digest: str = None) -> dict:
+        return await asyncio.wrap_future(self.submit(code, timeout, digest))
+
+    def shutdown(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._threads:
+                self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+
+
+_default_pool: Optional[SandboxPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """Process-wide pool configured from SANDBOX_WORKERS / _CPU_SECONDS / _MEMORY_MB / _TIMEOUT"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SandboxPool(
+                workers=int(os.getenv("SANDBOX_WORKERS", 0)) or None,
+                cpu_seconds=int(os.getenv("SANDBOX_CPU_SECONDS", 2)),
+                memory_mb=int(os.getenv("SANDBOX_MEMORY_MB", 256)),
+                timeout=float(os.getenv("SANDBOX_TIMEOUT", 5.0))
+            )
+            atexit.register(_default_pool.shutdown)
+    return _default_pool
+
+
+class Sandbox:
+    SAFE_MODULES = list(SAFE_MODULES)
+
+    def __init__(self, pool: SandboxPool = None):
+        self._pool = pool
+
+    @property
+    def pool(self) -> SandboxPool:
+        return self._pool or get_sandbox_pool()
+
+    @staticmethod
+    def _vet(analysis) -> Optional[dict]:
+        if not analysis.syntax_ok:
+            return {"safe": False, "error": f"Syntax error: {analysis.syntax_error}"}
+        if not analysis.sandbox_safe:
+            return {"safe": False, "error": f"Unsafe code: {analysis.sandbox_violations[0]}"}
+        return None
+
+    def execute(self, code: str, timeout: float = None) -> dict:
+        """Vet in-process, then run in an isolated worker (blocking)"""
+        # Shared memoized analysis: the Evolver's safety scan already parsed this code
+        analysis = analyze(code)
+        return self._vet(analysis) or self.pool.run(code, timeout, analysis.digest)
+
+    async def execute_async(self, code: str, timeout: float = None) -> dict:
+        """Vet in-process, then run in an isolated worker without blocking the event loop"""
+        analysis = analyze(code)
+        return self._vet(analysis) or await self.pool.run_async(code, timeout, analysis.digest)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test the Gamma-Poisson call-volume model
+Conjugate updates, predictive quantiles, O(1) hourly updates across thousands of queues
+"""
+
+import sys
+import time
+from datetime import datetime
+import numpy as np
+sys.path.insert(0, '.')
+
+from scipy import stats
+from src.core.engineering.bayesian_volume import BayesianVolumeModel, hour_of_week, nbinom_quantile
+from src.core.process_theorems import TheoremProcessor
+
+
+def _rates(queues, seed=0):
+    rng = np.random.default_rng(seed)
+    weekly = 0.3 + np.sin(np.linspace(0, 7 * np.pi, 168)) ** 2
+    return rng.gamma(2, 10, (queues, 1)) * weekly
+
+
+def test_conjugate_update():
+    print("🎲 Testing conjugate posterior...")
+    model = BayesianVolumeModel(2, prior_mean=[10, 40], prior_strength=2)
+    model.update([12, 30], slot=5)
+    model.update([8, 50], slot=5 + 168)  # Same hour next week
+    assert np.allclose(model.shape[:, 5], [20 + 20, 80 + 80])
+    assert np.allclose(model.rate[:, 5], [4, 4])
+    assert np.allclose(model.posterior_mean([5])[:, 0], [10, 40])
+    assert model.observations[:, 5].tolist() == [2, 2] and model.observations.sum() == 4
+
+    batch = BayesianVolumeModel(2, prior_mean=[10, 40], prior_strength=2)
+    batch.update_events([0, 0, 1, 1], [5, 5, 5, 5], [12, 8, 30, 50])
+    assert np.allclose(batch.shape, model.shape) and np.allclose(batch.rate, model.rate)
+
+    drifting = BayesianVolumeModel(1, prior_mean=10, discount=0.5)
+    drifting.update([[30]], slot=0)
+    assert np.isclose(drifting.posterior_mean([0])[0, 0], (5 + 30) / 1.5)
+    assert hour_of_week(datetime(2025, 12, 3, 14)) == 2 * 24 + 14
+    print("  ✅ Shape/rate match hand-computed posteriors")
+
+
+def test_predictive_quantiles():
+    print("📊 Testing negative-binomial predictive quantiles...")
+    rng = np.random.default_rng(1)
+    n, p = rng.uniform(0.5, 500, 20_000), rng.uniform(0.2, 0.99, 20_000)
+    for q in (0.05, 0.5, 0.9, 0.99):
+        assert (nbinom_quantile(q, n, p) == stats.nbinom.ppf(q, n, p)).all()
+
+    rates = _rates(50)
+    model = BayesianVolumeModel(50, prior_mean=20)
+    counts = rng.poisson(rates[:, :, None].repeat(12, axis=2)).transpose(0, 2, 1).reshape(50, -1)
+    model.update(counts, slot=0)
+    low, high = model.predictive_quantiles(quantiles=(0.05, 0.95))
+    fresh = rng.poisson(rates)
+    covered = ((fresh >= low) & (fresh <= high)).mean()
+    assert 0.85 < covered <= 1.0, covered
+    agents = model.required_agents(slots=[100], aht=300)
+    assert agents.shape == (50, 1) and (agents > 0).all()
+    print(f"  ✅ 90% predictive interval covers {covered:.1%} of next-week counts")
+
+
+def test_thousands_of_queues():
+    print("⚡ Testing hourly updates for 5,000 queues...")
+    rates = _rates(5000, seed=2)
+    counts = np.random.default_rng(3).poisson(np.tile(rates, 4)).astype(float)
+    model = BayesianVolumeModel(5000, prior_mean=counts[:, :24].mean(axis=1))  # First day as prior
+    start = time.perf_counter()
+    for hour in range(counts.shape[1]):
+        model.update(counts[:, hour], hour)
+    per_hour = (time.perf_counter() - start) / counts.shape[1]
+    assert model.observations.sum() == counts.size
+    assert per_hour < 0.005, per_hour
+    assert model.accuracy > 0.6
+    assert np.abs(model.posterior_mean() - rates).mean() / rates.mean() < 0.2
+    print(f"  ✅ {per_hour*1000:.2f}ms per hour for 5,000 queues; accuracy {model.accuracy:.1%}")
+
+
+def test_theorem_4_hook():
+    print("🧠 Testing Bayesian Inference theorem hook...")
+    counts = np.random.default_rng(4).poisson(np.tile(_rates(20, seed=5), 3))
+    theorem = TheoremProcessor().get_theorem(4, hourly_counts=counts)
+    assert theorem.parameters['accuracy'] != 0.92 and 0.5 < theorem.parameters['accuracy'] < 1
+    assert theorem.parameters['volume_model']['observations'] == counts.size
+    assert 'volume_model' not in TheoremProcessor().get_theorem(4).parameters
+    print(f"  ✅ Measured accuracy {theorem.parameters['accuracy']:.1%}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("BAYESIAN VOLUME TESTS")
+    print("="*50)
+    test_conjugate_update()
+    test_predictive_quantiles()
+    test_thousands_of_queues()
+    test_theorem_4_hook()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test bounded-concurrency batch processing in BpoService
+Ordering, throughput, per-task failure isolation and streaming backpressure
+"""
+
+import sys
+import time
+import asyncio
+sys.path.insert(0, '.')
+
+from src.services.bpo_service import BpoService
+from src.services.sentiment_service import SentimentService
+
+
+class TrackingService(BpoService):
+    """Counts concurrent process() calls and fails tasks marked 'boom'"""
+
+    def __init__(self, **kwargs):
+        super().__init__(sentiment=SentimentService(workers=1), **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def process(self, task, sentiment=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if "boom" in task:
+                raise ValueError("bad ticket")
+            return await super().process(task, sentiment)
+        finally:
+            self.in_flight -= 1
+
+
+def test_batch_is_concurrent_and_ordered():
+    print("⚡ Testing bounded concurrency...")
+    service = TrackingService(concurrency=50)
+    tasks = [f"ticket {i}" for i in range(200)]
+
+    start = time.perf_counter()
+    results = asyncio.run(service.batch_process(tasks))
+    elapsed = time.perf_counter() - start
+
+    assert [r["task"] for r in results] == tasks
+    assert service.max_in_flight == 50
+    assert elapsed < 2.0, f"batch ran serially ({elapsed:.2f}s)"
+    print(f"  ✅ 200 tasks in {elapsed:.2f}s with {service.max_in_flight} in flight (serial: 20s)")
+
+
+def test_failures_are_isolated():
+    print("🧯 Testing per-task failure isolation...")
+    service = TrackingService(concurrency=4)
+    tasks = ["ticket a", "boom b", "ticket c"]
+
+    results = asyncio.run(service.batch_process(tasks))
+
+    assert [r["status"] for r in results] == ["completed", "failed", "completed"]
+    assert "bad ticket" in results[1]["error"]
+    print("  ✅ One failed task, the rest completed")
+
+
+def test_sentiment_failure_is_isolated():
+    print("🧯 Testing a sentiment failure inside a chunk...")
+    service = TrackingService(concurrency=4)
+    results = asyncio.run(service.batch_process(["good job", None, "bad"]))
+    assert [r["status"] for r in results] == ["completed", "failed", "completed"]
+    assert results[1]["error"].startswith("TypeError") and results[1]["task"] is None
+    assert results[0]["sentiment"] == "positive"
+    print("  ✅ Only the unscorable task failed")
+
+
+def test_stream_applies_backpressure():
+    print("🌊 Testing streaming with backpressure...")
+    service = TrackingService(concurrency=4, sentiment_batch=4)
+    produced = 0
+
+    async def source():
+        nonlocal produced
+        for i in range(40):
+            produced += 1
+            yield f"ticket {i}"
+
+    async def consume():
+        seen = []
+        async for result in service.stream(source()):
+            # Inbox (2x4) + outbox (4) + workers (4) + one sentiment chunk (4)
+            assert produced - len(seen) <= 20, produced - len(seen)
+            seen.append(result["batch_index"])
+            await asyncio.sleep(0.01)
+        return seen
+
+    seen = asyncio.run(consume())
+    assert sorted(seen) == list(range(40))
+    print(f"  ✅ Streamed {len(seen)} results; producer stayed bounded")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("BPO SERVICE CONCURRENCY TESTS")
+    print("="*50)
+    test_batch_is_concurrent_and_ordered()
+    test_failures_are_isolated()
+    test_sentiment_failure_is_isolated()
+    test_stream_applies_backpressure()
+    print("\n✅ ALL PASSED")
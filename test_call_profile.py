@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test the streaming call profile behind BPOFlowSynchronizer
+Running moments per (site, weekday, hour), sub-hour intervals, constant memory
+"""
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.engineering.cosmic_synchronization import BPOFlowSynchronizer, CallProfile
+
+START = np.datetime64('2025-01-06T00:00', 'm')  # A Monday
+
+
+def _quarter_hours(weeks, seed=0, peak_hours=range(9, 13)):
+    rng = np.random.default_rng(seed)
+    rate = np.full(24, 5.0)
+    rate[list(peak_hours)] = 60.0
+    intervals = weeks * 7 * 96
+    counts = rng.poisson(np.repeat(rate, 4)[np.arange(intervals) % 96])
+    return START + 15 * np.arange(intervals), counts
+
+
+def test_moments_match_direct_computation():
+    print("📐 Testing running moments against numpy...")
+    stamps, counts = _quarter_hours(6)
+    profile = CallProfile()
+    for start in range(0, len(counts), 1001):  # Batches split mid-hour
+        profile.update(stamps[start:start + 1001], counts[start:start + 1001])
+
+    hourly = counts.reshape(6, 7, 24, 4).sum(axis=3)  # (weeks, weekday, hour)
+    mean, std = profile.weekly_profile()
+    assert np.allclose(mean, hourly.mean(axis=0)) and np.allclose(std, hourly.std(axis=0))
+    day_mean, day_std = profile.hourly_profile()
+    by_hour = hourly.reshape(42, 24)
+    assert np.allclose(day_mean, by_hour.mean(axis=0)) and np.allclose(day_std, by_hour.std(axis=0))
+    assert profile.hours_observed == 6 * 168 and profile.records == len(counts)
+    print(f"  ✅ {profile.hours_observed} hours, peak hour {profile.summary()['peak_hour']}")
+
+
+def test_sites_and_records():
+    print("🏢 Testing interleaved sites from records...")
+    stamps, manila = _quarter_hours(2, seed=1)
+    _, cebu = _quarter_hours(2, seed=2, peak_hours=range(13, 17))
+    records = [(stamp, site, count) for stamp, a, b in zip(stamps.tolist(), manila.tolist(), cebu.tolist())
+               for site, count in (('manila', a), ('cebu', b))]
+    profile = CallProfile().update_records(iter(records), chunk_size=333)
+
+    single = CallProfile().update(stamps, manila)
+    both = single.weekly_profile()[0] + CallProfile().update(stamps, cebu).weekly_profile()[0]
+    assert sorted(profile.sites) == ['cebu', 'manila']
+    assert np.allclose(profile.weekly_profile()[0], both)
+    assert np.allclose(profile.moments()[1][profile.sites.index('manila')], single.moments()[1][0])
+    print(f"  ✅ Sites {profile.sites}, {profile.records:,} records")
+
+
+def test_synchronizer_long_horizon():
+    print("🌊 Testing synchronize_call_distribution on months of data...")
+    stamps, counts = _quarter_hours(13, seed=3)
+    sync = BPOFlowSynchronizer()
+    result = sync.synchronize_call_distribution({'timestamps': stamps, 'counts': counts})
+    assert result['call_analysis']['pattern_type'] == 'MORNING_PEAK'
+    assert result['call_profile']['weeks_observed'] == 13
+    assert len(result['synchronized_distribution']['hourly_requirements']) == 24
+
+    hourly = counts.reshape(-1, 4).sum(axis=1)
+    folded = sync.synchronize_call_distribution({'hourly_volumes': hourly, 'start': START})
+    assert folded['call_analysis'] == result['call_analysis']
+    daily = sync.synchronize_call_distribution({'hourly_volumes': hourly[:24].tolist()})
+    assert 'call_profile' not in daily
+    print(f"  ✅ {result['call_analysis']['pattern_type']} over {result['call_profile']['hours_observed']:,} hours")
+
+
+def test_constant_memory():
+    print("⚡ Testing constant memory over a year of 15-minute data for 5 sites...")
+    intervals = 365 * 96
+
+    def stream():
+        rng = np.random.default_rng(4)
+        for start in range(0, intervals, 4096):
+            stamps = START + 15 * np.arange(start, min(start + 4096, intervals))
+            for site in range(5):
+                yield from zip(stamps.tolist(), [f"site-{site}"] * len(stamps), rng.poisson(20, len(stamps)).tolist())
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    profile = CallProfile().update_records(stream(), chunk_size=20_000)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert profile.records == 5 * intervals and profile.hours_observed == 5 * 365 * 24
+    assert np.allclose(profile.hourly_profile()[0], 5 * 80, rtol=0.02)
+    assert peak < 20 * 1024 * 1024, peak  # The input alone is ~180k tuples
+    print(f"  ✅ {profile.records:,} records in {elapsed:.2f}s, peak {peak / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("CALL PROFILE TESTS")
+    print("="*50)
+    test_moments_match_direct_computation()
+    test_sites_and_records()
+    test_synchronizer_long_horizon()
+    test_constant_memory()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the discrete-event call-center simulator
+Agreement with Erlang C, breaks from TimingOptimizer, abandonment and scale
+"""
+
+import sys
+import time
+sys.path.insert(0, '.')
+
+from src.core.engineering.call_simulator import (
+    AgentShift, CallCenterSimulator, SimulationConfig, simulate_day,
+    shifts_from_counts, shifts_from_coverage, shifts_from_timing,
+)
+from src.core.engineering.cosmic_synchronization import TimingOptimizer
+from src.core.engineering.erlang import service_level, average_speed_of_answer
+
+
+def test_agrees_with_erlang_c():
+    print("📞 Testing steady state against Erlang C...")
+    config = SimulationConfig(hourly_volumes=[100] * 24, shifts=[AgentShift(0, 86400) for _ in range(12)],
+                              patience_mean=None)
+    report = CallCenterSimulator(workers=1).run(config, replications=20, seed=1)
+
+    traffic = 100 * 300 / 3600
+    expected_sl = float(service_level(traffic, 12, 300, 20))
+    expected_asa = float(average_speed_of_answer(traffic, 12, 300))
+    sl, asa = report['service_level'], report['asa_seconds']
+    # Warm-up from an empty queue only helps the simulation, so allow a little slack above
+    assert sl['low'] - 0.01 <= expected_sl <= sl['high'] + 0.01, (sl, expected_sl)
+    assert asa['low'] - 1 <= expected_asa <= asa['high'] + 1, (asa, expected_asa)
+    assert abs(report['occupancy']['mean'] - traffic / 12) < 0.02
+    print(f"  ✅ SL {sl['mean']:.3f} ± {sl['half_width']:.3f} vs Erlang C {expected_sl:.3f}")
+
+
+def test_timing_optimizer_breaks_and_parallel_replications():
+    print("☕ Testing staggered breaks and parallel replications...")
+    agents = [{'id': f'agent_{i}', 'skill_level': 'intermediate'} for i in range(12)]
+    schedule = TimingOptimizer().optimize_scheduling({'agents': agents, 'shift_hours': 8})['optimal_schedule']
+    shifts = shifts_from_timing(schedule)
+    assert len(shifts) == 12 and all(len(shift.breaks) == 3 for shift in shifts)
+
+    volumes = [0] * 8 + [90] * 8 + [0] * 8
+    with_breaks = SimulationConfig(hourly_volumes=volumes, shifts=shifts)
+    serial = CallCenterSimulator(workers=1).validate(with_breaks, replications=8, seed=5)
+    parallel = CallCenterSimulator(workers=2).validate(with_breaks, replications=8, seed=5)
+    assert serial == parallel  # Seeds are per replication, not per worker
+
+    no_breaks = SimulationConfig(hourly_volumes=volumes, shifts=[AgentShift(8 * 3600, 16 * 3600) for _ in range(12)])
+    baseline = CallCenterSimulator(workers=1).run(no_breaks, replications=8, seed=5)
+    lunch_hour = serial['hourly_service_level'][11]
+    assert lunch_hour < baseline['hourly_service_level'][11]
+    print(f"  ✅ 11:00 SL {lunch_hour:.2f} with staggered lunches vs {baseline['hourly_service_level'][11]:.2f}; "
+          f"verdict {serial['verdict']}")
+
+
+def test_abandonment_and_schedule_adapters():
+    print("📉 Testing abandonment and schedule adapters...")
+    assert len(shifts_from_counts({'morning': 3, 'night': 2})) == 5
+    coverage = shifts_from_coverage({'08:00': 2, '09:00': 3, '10:00': 1})
+    assert sorted((s.start / 3600, s.end / 3600) for s in coverage) == [(8, 10), (8, 11), (9, 10)]
+
+    understaffed = SimulationConfig(hourly_volumes=[0] * 6 + [120] * 6, shifts=shifts_from_counts({'morning': 6}),
+                                    patience_mean=60, aht_distribution='lognormal')
+    report = CallCenterSimulator(workers=1).validate(understaffed, replications=10, seed=2)
+    assert report['verdict'] == 'MISSES_TARGET'
+    assert report['abandon_rate']['mean'] > 0.1
+    assert report['occupancy']['mean'] > 0.9
+    assert report['understaffed_hours'] == list(range(6, 12))
+    print(f"  ✅ {report['abandon_rate']['mean']:.0%} abandoned at {report['occupancy']['mean']:.0%} occupancy")
+
+
+def test_million_calls():
+    print("🚀 Testing 1M simulated calls...")
+    config = SimulationConfig(hourly_volumes=[42000] * 24, shifts=[AgentShift(0, 86400) for _ in range(3600)])
+    start = time.perf_counter()
+    day = simulate_day(config, seed=1)
+    elapsed = time.perf_counter() - start
+    assert day['calls'] > 1_000_000
+    assert elapsed < 20, elapsed
+    print(f"  ✅ {day['calls']:,} calls in {elapsed:.2f}s (SL {day['service_level']:.3f})")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("CALL SIMULATOR TESTS")
+    print("="*50)
+    test_agrees_with_erlang_c()
+    test_timing_optimizer_breaks_and_parallel_replications()
+    test_abandonment_and_schedule_adapters()
+    test_million_calls()
+    print("\n✅ ALL PASSED")
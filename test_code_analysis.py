@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass code analyzer
+Evolver and sandbox policies against the checks they replaced, and the digest memo
+"""
+
+import re
+import ast
+import sys
+sys.path.insert(0, '.')
+
+from src.utils import code_analysis
+from src.utils.code_analysis import analyze, analysis_cache_info
+
+
+def legacy_evolver_safe(code: str) -> bool:
+    """Evolver._safety_scan before the shared analyzer: regexes, then an AST import walk"""
+    for pattern in [r'__import__\s*\(', r'eval\s*\(', r'exec\s*\(', r'open\s*\([^)]*[rw]\+', r'subprocess\.',
+                    r'os\.system', r'rm\s+-rf', r'del\s+\w+\.__class__']:
+        if re.search(pattern, code, re.IGNORECASE):
+            return False
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            if any(alias.name.split('.')[0] not in code_analysis.EVOLVER_SAFE_IMPORTS for alias in node.names):
+                return False
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+                and node.func.id in ['eval', 'exec', '__import__']:
+            return False
+    return True
+
+
+def legacy_sandbox_safe(code: str) -> bool:
+    """Sandbox.execute before the shared analyzer: substring keywords, then a parse"""
+    if any(keyword in code for keyword in ['__', 'eval', 'exec', 'import', 'open', 'os.', 'sys.', 'subprocess']):
+        return False
+    try:
+        ast.parse(code)
+    except SyntaxError:
+        return False
+    return True
+
+
+# Both implementations must agree on these
+SAME_VERDICT = [
+    "result = 1 + 2",
+    "result = [x for x in range(3)]",
+    "import math\nresult = math.sqrt(2)",
+    "import random\nresult = random.random()",
+    "import os", "import os.path", "import sys", "import sympy",
+    "import numpy as np", "import subprocess",
+    "eval('1')", "exec('x = 1')", "__import__('os')", "math.eval(1)",
+    "open('f.txt')", "open('f.txt', 'r+')", "json.codecs.open('f')",
+    "os.system('ls')", "subprocess.run(['ls'])", "sys.exit(0)", "os.getcwd()",
+    "x = 'rm -rf /'", "del obj.__class__", "x.__class__", "x = __name__", "s = 'a__b'",
+    "datetime.sys.modules['os']", "collections._sys.modules",
+    "getattr(math, 'sqrt')(4)", "x = {'os': 1}",
+    "result = (", "def f(:\n    pass",
+]
+
+# Deliberate differences: (code, evolver_safe, sandbox_safe) under the new analyzer
+STRICTER = [
+    ("from subprocess import run", False, False),        # from-imports now go through the whitelist
+    ("from collections import Counter", False, False),
+    ("open('f.txt', 'w')", False, False),                # Any write/append mode, not just r+/w+
+    ("open('f', mode='a')", False, False),
+    ("os.popen('ls')", False, False),
+]
+NO_LONGER_FALSE_POSITIVES = [
+    ("important = 1", True, True),                       # Keywords inside identifiers
+    ("pos = p; result = pos.x", True, True),
+    ("reopen = 1", True, True),
+    ("evaluate = 1", True, True),
+    ("x = eval", True, True),                            # Not called; the sandbox strips eval anyway
+    ("result = 'eval(x)'", True, True),                  # Patterns inside strings and comments
+    ("result = 'subprocess.'", True, True),
+    ("# exec(code)\nresult = 1", True, True),
+    ("EVAL(1)", True, True),                             # Case-insensitive regex hit a non-builtin
+]
+
+
+def test_policies_match_legacy_checks():
+    print("⚖️  Testing policies against the replaced checks...")
+    for code in SAME_VERDICT:
+        analysis = analyze(code)
+        assert analysis.evolver_safe == legacy_evolver_safe(code), code
+        assert analysis.sandbox_safe == legacy_sandbox_safe(code), code
+    rejected = sum(not analyze(code).sandbox_safe for code in SAME_VERDICT)
+    print(f"  ✅ {len(SAME_VERDICT)} constructs, same verdicts ({rejected} rejected by the sandbox)")
+
+
+def test_deliberate_differences():
+    print("🔍 Testing the deliberate policy differences...")
+    for code, evolver_safe, sandbox_safe in STRICTER:
+        analysis = analyze(code)
+        assert legacy_evolver_safe(code) and not analysis.evolver_safe, code
+        assert (analysis.evolver_safe, analysis.sandbox_safe) == (evolver_safe, sandbox_safe), code
+    for code, evolver_safe, sandbox_safe in NO_LONGER_FALSE_POSITIVES:
+        analysis = analyze(code)
+        assert not (legacy_evolver_safe(code) and legacy_sandbox_safe(code)), code
+        assert (analysis.evolver_safe, analysis.sandbox_safe) == (evolver_safe, sandbox_safe), code
+
+    analysis = analyze("import os\nos.system('rm -rf /')\nopen('x', 'w')")
+    assert analysis.reasons == ["Shell call os.system at line 2", "Shell pattern 'rm -rf' at line 2",
+                                "File write via open(mode='w') at line 3"]
+    assert analyze("datetime.sys.modules").sandbox_violations == ["system access .sys"]
+    print(f"  ✅ {len(STRICTER)} tightened, {len(NO_LONGER_FALSE_POSITIVES)} false positives removed")
+
+
+def test_memo_returns_stored_verdict():
+    print("🧠 Testing the digest memo...")
+    code = "result = sum(i * i for i in range(10))  # memo test"
+    first = analyze(code)
+    before = analysis_cache_info()
+
+    parse = code_analysis.ast.parse
+    calls = []
+    code_analysis.ast.parse = lambda *args, **kwargs: calls.append(args) or parse(*args, **kwargs)
+    try:
+        again = analyze(code)
+    finally:
+        code_analysis.ast.parse = parse
+    after = analysis_cache_info()
+
+    assert again is first and calls == []
+    assert after["hits"] == before["hits"] + 1 and after["misses"] == before["misses"]
+    assert analyze(code + " ").digest != first.digest  # Any change is a new entry
+    assert analysis_cache_info()["misses"] == after["misses"] + 1
+    print(f"  ✅ Hit returned the stored verdict without parsing ({after['entries']} entries)")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("CODE ANALYSIS TESTS")
+    print("="*50)
+    test_policies_match_legacy_checks()
+    test_deliberate_differences()
+    test_memo_returns_stored_verdict()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite-backed durable task queue
+Persistence, group commit, visibility timeouts and crash recovery
+"""
+
+import os
+import sys
+import math
+import asyncio
+import subprocess
+import tempfile
+sys.path.insert(0, '.')
+
+from src.services.durable_queue import DurableTaskQueue, process_owner
+from src.services.bpo_service import BpoService
+from src.services.sentiment_service import SentimentService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _path():
+    return os.path.join(tempfile.mkdtemp(prefix="bpo_queue_test_"), "queue.sqlite")
+
+
+def test_group_commit_and_persistence():
+    print("💾 Testing group commit and persistence...")
+    path = _path()
+    queue = DurableTaskQueue(path)
+    ids = queue.enqueue_many([{"ticket": i} for i in range(500)])
+    commits = queue.stats["commits"]
+    queue.close()
+
+    assert ids == list(range(1, 501))
+    assert commits < 500
+
+    reopened = DurableTaskQueue(path)
+    leases = reopened.dequeue(n=1000)
+    reopened.close()
+    assert [lease.payload["ticket"] for lease in leases] == list(range(500))
+    print(f"  ✅ 500 tasks in {commits} commits, all present after reopen")
+
+
+def test_priority_order_and_visibility_timeout():
+    print("⏱️  Testing lease order and visibility timeout...")
+    clock = FakeClock()
+    queue = DurableTaskQueue(_path(), visibility_timeout=30, clock=clock)
+    queue.enqueue("low", priority="low").result()
+    queue.enqueue("urgent", priority="urgent").result()
+
+    first = queue.dequeue(n=1)
+    assert first[0].payload == "urgent"
+    assert queue.dequeue(n=1)[0].payload == "low"
+    assert queue.dequeue(n=1) == []
+
+    queue.ack(first[0].id).result()
+    clock.now += 31  # Unacked lease expires
+    redelivered = queue.dequeue(n=5)
+    assert [(lease.payload, lease.attempts) for lease in redelivered] == [("low", 2)]
+    queue.close()
+    print("  ✅ Urgent first; unacked task redelivered after timeout")
+
+
+def test_crash_recovery():
+    print("🔥 Testing crash recovery...")
+    path = _path()
+    clock = FakeClock()
+    crashed = DurableTaskQueue(path, visibility_timeout=300, clock=clock, owner=f"previous-boot:{os.getpid()}")
+    crashed.enqueue_many(["a", "b", "c"])
+    assert len(crashed.dequeue(n=3)) == 3
+    crashed.flush()
+    # Process dies without acking; a restart recovers the leases immediately
+    restarted = DurableTaskQueue(path, visibility_timeout=300, clock=clock)
+    assert restarted.recovered == 3
+    assert sorted(lease.payload for lease in restarted.dequeue(n=3)) == ["a", "b", "c"]
+    crashed.close()
+    restarted.close()
+    print("  ✅ 3 in-flight tasks recovered on startup")
+
+
+def test_recovery_spares_live_owners():
+    print("👥 Testing recovery with processes sharing the file...")
+    path = _path()
+    clock = FakeClock()
+    exited = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                            capture_output=True, text=True, check=True)
+    dead_owner = f"{process_owner().rpartition(':')[0]}:{exited.stdout.strip()}"
+
+    live = DurableTaskQueue(path, visibility_timeout=300, clock=clock)
+    dead = DurableTaskQueue(path, visibility_timeout=300, clock=clock, owner=dead_owner)
+    live.enqueue_many(["live-1", "live-2"])
+    assert len(live.dequeue(n=2)) == 2
+    dead.enqueue_many(["dead-1"])
+    assert len(dead.dequeue(n=1)) == 1
+    live.enqueue("live-3", lease_for=300).result()
+
+    # A worker starting next to a live one only takes over the exited worker's lease
+    starting = DurableTaskQueue(path, visibility_timeout=300, clock=clock)
+    assert starting.recovered == 1
+    assert [lease.payload for lease in starting.dequeue(n=5)] == ["dead-1"]
+    assert starting.depth() == {"ready": 0, "in_flight": 4, "dead": 0}
+
+    clock.now += 301  # A live owner that stops acking still loses its leases on timeout
+    assert len(starting.dequeue(n=5)) == 4
+    for queue in (live, dead, starting):
+        queue.close()
+    print("  ✅ Live leases kept, orphaned lease replayed once")
+
+
+def test_restore_skips_live_workers_after_timeout():
+    print("🤝 Testing restore next to a live worker past the visibility timeout...")
+    path = _path()
+    clock = FakeClock()
+    exited = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                            capture_output=True, text=True, check=True)
+    boot = process_owner().rpartition(':')[0]
+    # Worker A is another live process (our parent stands in for it)
+    worker_a = DurableTaskQueue(path, visibility_timeout=30, clock=clock, owner=f"{boot}:{os.getppid()}")
+    crashed = DurableTaskQueue(path, visibility_timeout=30, clock=clock, owner=f"{boot}:{exited.stdout.strip()}")
+    worker_a.enqueue("held by A", lease_for=math.inf).result()     # BpoService.enqueue journaling
+    worker_a.enqueue("expired lease of A", lease_for=30).result()
+    crashed.enqueue("left by a dead worker", lease_for=30).result()
+    clock.now += 31
+
+    async def start_worker_b():
+        service = BpoService(sentiment=SentimentService(workers=1), concurrency=1,
+                             journal=DurableTaskQueue(path, visibility_timeout=30, clock=clock))
+        restored = service.restore()
+        await service.shutdown()
+        service.journal.close()
+        return restored
+
+    assert asyncio.run(start_worker_b()) == 1  # Only the dead worker's task
+    with worker_a._db_lock:
+        owned = worker_a._db.execute("SELECT payload FROM tasks WHERE owner = ? ORDER BY id",
+                                     (worker_a.owner,)).fetchall()
+    assert [payload for (payload,) in owned] == ['"held by A"', '"expired lease of A"']
+    clock.now += 10 ** 6
+    assert [lease.payload for lease in worker_a.dequeue(n=5, orphaned_only=True)] == []
+    assert [lease.payload for lease in worker_a.dequeue(n=5)] == ["expired lease of A"]
+    for queue in (worker_a, crashed):
+        queue.close()
+    print("  ✅ A's tasks stayed with A; B took over the dead worker's task only")
+
+
+def test_bpo_service_journal():
+    print("📒 Testing BpoService journal...")
+    path = _path()
+
+    async def accept_then_crash():
+        service = BpoService(sentiment=SentimentService(workers=1), concurrency=2,
+                             journal=DurableTaskQueue(path, owner=f"previous-boot:{os.getpid()}"))
+        done = await service.submit("processed ticket")
+        service.enqueue("queued ticket", priority="high")
+        service.journal.flush()
+        await service.shutdown()  # Dies before the queued ticket runs
+        service.journal.close()
+        return done
+
+    async def restart():
+        service = BpoService(sentiment=SentimentService(workers=1), concurrency=2,
+                             journal=DurableTaskQueue(path))
+        restored = service.restore()
+        while service.journal.depth()["in_flight"] or len(service.queue):
+            await asyncio.sleep(0.05)
+        service.journal.flush()
+        depth = service.journal.depth()
+        await service.shutdown()
+        service.journal.close()
+        return restored, depth
+
+    done = asyncio.run(accept_then_crash())
+    restored, depth = asyncio.run(restart())
+    assert done["status"] == "completed"
+    assert restored == 1
+    assert depth == {"ready": 0, "in_flight": 0, "dead": 0}
+    print("  ✅ Unfinished ticket replayed after restart and acked")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("DURABLE QUEUE TESTS")
+    print("="*50)
+    test_group_commit_and_persistence()
+    test_priority_order_and_visibility_timeout()
+    test_crash_recovery()
+    test_recovery_spares_live_owners()
+    test_restore_skips_live_workers_after_timeout()
+    test_bpo_service_journal()
+    print("\n✅ ALL PASSED")
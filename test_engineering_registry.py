@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test the engineering registry
+Availability must be reported without importing engines or printing anything
+"""
+
+import sys
+import json
+import subprocess
+sys.path.insert(0, '.')
+
+from src.core.engineering.registry import EngineRegistry, EngineSpec
+
+PROBE = """
+import sys, json
+import src.core.engineering as eng
+availability = eng.get_registry().availability()
+engines = [m for m in sys.modules if m.startswith('src.core.engineering.') and not m.endswith('.registry')]
+print(json.dumps({"availability": availability, "imported": engines}))
+"""
+
+
+def test_availability_without_import():
+    print("📋 Testing side-effect-free availability...")
+    proc = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True)
+    # The only output is the probe's own JSON line: no banners on import
+    lines = proc.stdout.strip().splitlines()
+    assert len(lines) == 1, proc.stdout
+    report = json.loads(lines[0])
+
+    assert report["imported"] == []
+    assert all(report["availability"].values()), report["availability"]
+    print(f"  ✅ {len(report['availability'])} engines available, none imported")
+
+
+def test_load_on_first_use():
+    print("📦 Testing deferred load...")
+    registry = EngineRegistry(manifest=(
+        EngineSpec("json_decoder", "json.decoder", "JSONDecoder", "stdlib"),
+        EngineSpec("missing", "no_such_engine_module", "Engine", "broken"),
+    ), entry_point_group=None)
+
+    assert registry.availability() == {"json_decoder": True, "missing": False}
+    assert registry.loaded() == []
+
+    decoder = registry.create("json_decoder")
+    assert decoder.decode("[1]") == [1]
+    assert registry.loaded() == ["json_decoder"]
+
+    try:
+        registry.load("missing")
+        assert False, "missing engine loaded"
+    except ImportError:
+        pass
+    try:
+        registry.spec("unknown")
+        assert False, "unknown engine resolved"
+    except KeyError:
+        pass
+    print("  ✅ Engines import on first use; failures surface as ImportError")
+
+
+def test_package_attribute_resolves_engine():
+    print("🔗 Testing package-level lazy attributes...")
+    import src.core.engineering as eng
+    from src.core.engineering.multidimensional_recursive import MultidimensionalRecursive
+
+    assert eng.MultidimensionalRecursive is MultidimensionalRecursive
+    core = eng.CosmicEngineeringCore()
+    assert core.modules_available["multidimensional"]
+    assert core.cosmic_proof()["cosmic_engineering"] == "ACTIVE"
+    print("  ✅ Engines resolved through the registry")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("ENGINEERING REGISTRY TESTS")
+    print("="*50)
+    test_availability_without_import()
+    test_load_on_first_use()
+    test_package_attribute_resolves_engine()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the partitioned ethical log store
+Daily partitions, rollup + edge counts in veto_stats, retention and timezone handling
+"""
+
+import sys
+import random
+from datetime import datetime, timedelta, timezone
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.models.ethical_logs import EthicalLogStore, CATEGORY_GDPR, ROLLUP_TABLE
+from src.core.ethical import Veto
+
+DAY = datetime(2025, 3, 10)
+
+
+def _store():
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool,
+                           connect_args={"check_same_thread": False})
+    return EthicalLogStore(engine)
+
+
+def _tables(store):
+    with store.engine.connect() as conn:
+        return {name for (name,) in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+
+
+def test_partition_creation():
+    print("🗂️  Testing daily partitions...")
+    store = _store()
+    store.insert(DAY + timedelta(hours=23, minutes=59), True)
+    store.insert(DAY + timedelta(days=1, minutes=1), False)
+    assert {"ethical_logs_20250310", "ethical_logs_20250311"} <= _tables(store)
+    with store.engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM ethical_logs")).scalar() == 2
+        assert conn.execute(text(f"SELECT COUNT(*) FROM {ROLLUP_TABLE}")).scalar() == 2
+
+    # A second store on the same database finds the existing partitions
+    reopened = EthicalLogStore(store.engine)
+    assert {DAY.date(), (DAY + timedelta(days=1)).date()} <= reopened._partitions
+    print(f"  ✅ {len(store._partitions)} partitions behind the ethical_logs view")
+
+
+def test_veto_stats_rollups_and_edges():
+    print("📊 Testing veto_stats against a brute-force count...")
+    store = _store()
+    rng = random.Random(0)
+    rows = []
+    for _ in range(600):
+        ts = DAY + timedelta(seconds=rng.randrange(3 * 86400))
+        ethical = rng.random() < 0.7
+        store.insert(ts, ethical)
+        rows.append((ts, ethical))
+    store.insert(DAY + timedelta(hours=5), True, user_id="u1", category=CATEGORY_GDPR)  # Not an ethics check
+
+    for start, end in [
+        (DAY + timedelta(hours=1, minutes=17), DAY + timedelta(days=2, hours=3, minutes=41)),  # Both edges partial
+        (DAY + timedelta(hours=6), DAY + timedelta(hours=30)),                                 # Whole hours only
+        (DAY + timedelta(hours=7, minutes=5), DAY + timedelta(hours=7, minutes=50)),           # Inside one hour
+    ]:
+        stats = store.veto_stats(start, end)
+        inside = [ethical for ts, ethical in rows if start <= ts < end]
+        assert stats["checks"] == len(inside)
+        assert stats["ethical"] == sum(inside)
+        assert stats["vetoed"] == len(inside) - sum(inside)
+        assert store.veto_stats(end, start)["checks"] == len(inside)  # Reversed bounds
+    assert store.veto_stats(DAY + timedelta(hours=1, minutes=17), DAY + timedelta(hours=50))["rollup_hours"] > 0
+    print(f"  ✅ Rollup + edge counts match raw rows ({stats['checks']} checks in the last window)")
+
+
+def test_retention():
+    print("🧹 Testing retention...")
+    store = _store()
+    for offset in range(5):
+        store.insert(DAY + timedelta(days=offset, hours=12), offset % 2 == 0)
+    dropped = store.drop_partitions_before((DAY + timedelta(days=3)).date())
+    assert dropped == [f"ethical_logs_2025031{d}" for d in range(3)]
+    assert not {"ethical_logs_20250310", "ethical_logs_20250312"} & _tables(store)
+    with store.engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM ethical_logs WHERE timestamp < '2025-03-13'")).scalar() == 0
+    assert store.veto_stats(DAY + timedelta(days=3), DAY + timedelta(days=5))["checks"] == 2
+    print(f"  ✅ Dropped {len(dropped)} partitions, view rebuilt")
+
+
+def test_timezone_aware_windows():
+    print("🌏 Testing timezone-aware windows...")
+    veto = Veto()
+    manila = timezone(timedelta(hours=8))
+    veto.store.insert(datetime(2025, 3, 10, 4, 30), False)  # 12:30 in Manila
+    stats = veto.observed_rate(start=datetime(2025, 3, 10, 12, 0, tzinfo=manila),
+                               end=datetime(2025, 3, 10, 13, 0, tzinfo=manila))
+    assert stats["checks"] == 1 and stats["vetoed"] == 1
+    assert veto.observed_rate(start=datetime(2025, 3, 10, tzinfo=timezone.utc))["checks"] == 1  # Naive default end
+    print(f"  ✅ Aware bounds normalized to UTC: {stats['window_start']} - {stats['window_end']}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("ETHICAL LOG STORE TESTS")
+    print("="*50)
+    test_partition_creation()
+    test_veto_stats_rollups_and_edges()
+    test_retention()
+    test_timezone_aware_windows()
+    print("\n✅ ALL PASSED")
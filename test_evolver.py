@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test concurrent candidate evaluation in Evolver.self_code
+Runs against the local fake LLM client (no network, no API key)
+"""
+
+import sys
+import os
+import time
+import asyncio
+sys.path.insert(0, '.')
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from src.core.evolve import Evolver
+from src.utils.fake_llm import FakeAsyncOpenAI
+from src.utils.llm_cache import LLMCache
+
+SAFE_CODE = "```python\ndef stable_func(x):\n    lam = 0.5\n    return -lam * x**2\nresult = stable_func(2)\n```"
+UNSAFE_CODE = "```python\nimport subprocess\nsubprocess.run(['ls'])\n```"
+
+
+def _make_evolver(client, candidates=3):
+    # Memory-only cache so runs never see each other's responses
+    evolver = Evolver(client=client, candidates=candidates, cache=LLMCache())
+    evolver.veto.check = lambda *args, **kwargs: True
+    return evolver
+
+
+def test_first_passing_candidate_wins():
+    print("🧬 Testing first-passing candidate wins...")
+    # Candidate 1 is fast but unsafe, candidate 2 passes, candidate 3 is slow
+    latencies = {0: 0.05, 1: 0.2, 2: 5.0}
+    replies = {"(Attempt 1)": UNSAFE_CODE, "(Attempt 2)": SAFE_CODE, "(Attempt 3)": SAFE_CODE}
+
+    def responder(messages):
+        prompt = messages[-1]["content"]
+        return next((code for tag, code in replies.items() if tag in prompt), "Reflection")
+
+    client = FakeAsyncOpenAI(responder=responder, latency=lambda i: latencies.get(i, 0.01))
+    evolver = _make_evolver(client)
+
+    start = time.perf_counter()
+    result = asyncio.run(evolver.self_code("Write a stable function"))
+    elapsed = time.perf_counter() - start
+
+    assert result["success"], result
+    assert result["message"] == "Success on attempt 2"
+    assert client.max_in_flight == 3
+    assert client.cancelled == 1
+    assert elapsed < 2.0, f"slow candidate was not cancelled ({elapsed:.2f}s)"
+    print(f"  ✅ Accepted attempt 2 in {elapsed:.2f}s, {client.cancelled} candidate cancelled")
+
+
+def test_latency_close_to_single_attempt():
+    print("⏱️  Testing end-to-end latency ~ one attempt...")
+    client = FakeAsyncOpenAI(responses=[UNSAFE_CODE, UNSAFE_CODE, SAFE_CODE], latency=0.3)
+    evolver = _make_evolver(client)
+
+    start = time.perf_counter()
+    result = asyncio.run(evolver.self_code("Write a stable function"))
+    elapsed = time.perf_counter() - start
+
+    assert result["success"], result
+    assert elapsed < 0.9, f"candidates ran serially ({elapsed:.2f}s)"
+    print(f"  ✅ 3 candidates evaluated in {elapsed:.2f}s (serial would be ≥0.9s)")
+
+
+def test_all_candidates_fail():
+    print("🛑 Testing all candidates rejected...")
+    client = FakeAsyncOpenAI(responses=[UNSAFE_CODE], latency=0.01)
+    evolver = _make_evolver(client, candidates=4)
+
+    result = asyncio.run(evolver.self_code("Write a stable function"))
+
+    assert not result["success"]
+    assert len(result["log"]) == 4
+    # 4 generations + a single reflection call
+    assert len(client.calls) == 5
+    print(f"  ✅ Rejected with {len(result['log'])} logged failures")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("EVOLVER CONCURRENCY TESTS")
+    print("="*50)
+    test_first_passing_candidate_wins()
+    test_latency_close_to_single_attempt()
+    test_all_candidates_fail()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the interval-level daily planner
+Requirements, peak uplift and break coverage over (queues x intervals) arrays
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.engineering.interval_planner import IntervalPlanner
+from src.core.engineering.erlang import ErlangStaffing
+from src.services.theorem_bridge import BPOTheoremBridge
+
+
+def _demand(sites=3, queues=500, seed=0):
+    rng = np.random.default_rng(seed)
+    profile = np.sin(np.linspace(0, np.pi, 96)) ** 2
+    return rng.poisson(60 * profile * rng.uniform(0.5, 1.5, (sites, queues, 1)))
+
+
+def test_requirements_peaks_and_breaks():
+    print("🧮 Testing requirements, peaks and breaks...")
+    demand = _demand(sites=1, queues=20)[0]
+    aht = np.linspace(200, 400, 20)
+    plan = IntervalPlanner(break_fraction=0.2).plan(demand, aht)
+
+    expected = ErlangStaffing().required_agents(demand, aht[:, None], interval_seconds=900)
+    assert (plan.required == expected).all()
+    assert plan.scheduled.shape == (20, 96)
+    assert plan.peak_mask.any() and (plan.peak_uplift[~plan.peak_mask] == 0).all()
+    assert (plan.breaks[plan.peak_mask] == 0).all()  # Breaks never land in peaks
+    on_floor = (plan.required + plan.peak_uplift).sum(axis=-1)
+    assert (np.abs(plan.breaks.sum(axis=-1) - on_floor * 0.2) <= 0.5).all()
+    print(f"  ✅ {int(plan.peak_mask.sum())} peak intervals, {int(plan.breaks.sum())} break agent-intervals off-peak")
+
+
+def test_multi_site_scale():
+    print("⚡ Testing 3 sites x 500 queues x 96 intervals...")
+    demand = _demand()
+    aht = np.random.default_rng(1).uniform(200, 400, (3, 500))
+    planner = IntervalPlanner(staffing=ErlangStaffing())
+    start = time.perf_counter()
+    plan = planner.plan(demand, aht)
+    elapsed = time.perf_counter() - start
+    assert plan.scheduled.shape == (3, 500, 96)
+    assert plan.interval_totals.shape == (96,)
+    assert plan.agent_hours.shape == (3, 500)
+    assert elapsed < 1.0, elapsed
+    print(f"  ✅ {demand.size:,} intervals planned in {elapsed*1000:.0f}ms")
+
+
+def test_rendering_is_optional_and_selective():
+    print("📄 Testing dict rendering...")
+    demand = _demand(sites=1, queues=3)[0]
+    plan = IntervalPlanner().plan(demand, 300, queue_names=['billing', 'sales', 'support'])
+    rendered = plan.to_dict(queues=['sales'])
+    assert list(rendered['queues']) == ['sales']
+    sales = rendered['queues']['sales']
+    assert len(sales['scheduled']) == 96 and '10:15' in sales['scheduled']
+    assert sales['scheduled']['10:15'] == int(plan.scheduled[1, 41])
+
+    daily = BPOTheoremBridge().optimize_daily_operations({
+        'calls_expected': 500, 'interval_demand': demand, 'queues': ['billing', 'sales', 'support']
+    })
+    assert set(daily['interval_plan']['queues']) == {'billing', 'sales', 'support'}
+    assert daily['recommended_schedule']['08:00'] == 15  # Hourly view unchanged
+    print(f"  ✅ Peak total {rendered['peak_total_agents']} agents; sales peaks {sales['peak_intervals'][:3]}...")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("INTERVAL PLANNER TESTS")
+    print("="*50)
+    test_requirements_peaks_and_breaks()
+    test_multi_site_scale()
+    test_rendering_is_optional_and_selective()
+    print("\n✅ ALL PASSED")
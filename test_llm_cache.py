@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed LLM cache
+Single-flight coalescing, cancellation, error propagation, TTL and the SQLite tier
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+sys.path.insert(0, '.')
+
+from src.utils.fake_llm import FakeAsyncOpenAI
+from src.utils.llm_cache import LLMCache
+
+MESSAGES = [{"role": "user", "content": "Summarize the ticket"}]
+
+
+class FailingClient(FakeAsyncOpenAI):
+    async def _complete(self, model, messages, kwargs):
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream 503")
+
+
+def test_single_flight_coalescing():
+    print("🔗 Testing single-flight coalescing...")
+    client = FakeAsyncOpenAI(responses=["Summary"], latency=0.1)
+    cache = LLMCache()
+
+    async def run():
+        return await asyncio.gather(*(cache.complete(client, "gpt", MESSAGES) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["Summary"] * 5
+    assert len(client.calls) == 1
+    assert cache.stats["misses"] == 1 and cache.stats["coalesced"] == 4
+    assert cache.snapshot()["in_flight"] == 0
+    print(f"  ✅ 5 callers, {len(client.calls)} upstream call")
+
+
+def test_leader_cancellation():
+    print("🛑 Testing cancellation of the first caller...")
+    client = FakeAsyncOpenAI(responses=["Summary"], latency=0.2)
+    cache = LLMCache()
+
+    async def run():
+        leader = asyncio.create_task(cache.complete(client, "gpt", MESSAGES))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(cache.complete(client, "gpt", MESSAGES))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == "Summary"
+        assert leader.cancelled()
+
+        # With every waiter gone the upstream call is cancelled too
+        lone = asyncio.create_task(cache.complete(client, "gpt", [{"role": "user", "content": "Other"}]))
+        await asyncio.sleep(0.01)
+        lone.cancel()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert len(client.calls) == 2 and client.cancelled == 1
+    assert cache.snapshot()["in_flight"] == 0
+    print("  ✅ Follower unaffected, orphaned call cancelled")
+
+
+def test_error_propagation():
+    print("💥 Testing error propagation...")
+    cache = LLMCache()
+
+    async def run():
+        return await asyncio.gather(*(cache.complete(FailingClient(), "gpt", MESSAGES) for _ in range(3)),
+                                    return_exceptions=True)
+
+    errors = asyncio.run(run())
+    assert all(isinstance(e, RuntimeError) and str(e) == "upstream 503" for e in errors)
+    assert cache.stats["errors"] == 1 and cache.snapshot()["memory_entries"] == 0
+
+    # Failures are not cached: the next call goes upstream again
+    client = FakeAsyncOpenAI(responses=["Recovered"], latency=0.01)
+    assert asyncio.run(cache.complete(client, "gpt", MESSAGES)) == "Recovered"
+    print(f"  ✅ All {len(errors)} waiters saw the upstream error, nothing cached")
+
+
+def test_ttl_and_disk_hits():
+    print("💾 Testing TTL expiry and SQLite hits...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.sqlite")
+        client = FakeAsyncOpenAI(responses=["Summary"], latency=0.01)
+        first = LLMCache(path=path)
+        asyncio.run(first.complete(client, "gpt", MESSAGES))
+        assert asyncio.run(first.complete(client, "gpt", MESSAGES)) == "Summary"
+        assert first.stats["memory_hits"] == 1
+
+        # A second process sees the same entry on disk
+        second = LLMCache(path=path)
+        assert asyncio.run(second.complete(client, "gpt", MESSAGES)) == "Summary"
+        assert second.stats["disk_hits"] == 1 and len(client.calls) == 1
+
+        asyncio.run(second.complete(client, "gpt", MESSAGES, temperature=0.2, ttl=0.05))
+        time.sleep(0.1)
+        assert asyncio.run(LLMCache(path=path).complete(client, "gpt", MESSAGES, temperature=0.2)) == "Summary"
+        assert len(client.calls) == 3  # Expired entry went upstream again
+        assert LLMCache(path=path).purge_expired() == 0
+        first.clear()
+        assert LLMCache(path=path)._lookup("missing") is None
+    print("  ✅ Memory, disk and expiry paths behave")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("LLM CACHE TESTS")
+    print("="*50)
+    test_single_flight_coalescing()
+    test_leader_cancellation()
+    test_error_propagation()
+    test_ttl_and_disk_hits()
+    print("\n✅ ALL PASSED")
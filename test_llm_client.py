@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test the shared rate-limited LLM client
+Runs against a local HTTP stub of the chat completions API (no network, no API key)
+"""
+
+import sys
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, '.')
+
+import openai
+
+from src.utils.llm_client import LLMClient, TokenBucket
+
+
+class StubServer:
+    """Chat completions stub with per-request latency and scripted 429s"""
+
+    def __init__(self, latency=lambda i: 0.02, rate_limited=0):
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    index = stub.requests
+                    stub.requests += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    if index < stub.rate_limited:
+                        self._reply(429, {"error": {"message": "Rate limit reached", "type": "requests"}})
+                        return
+                    time.sleep(stub.latency(index))
+                    self._reply(200, {
+                        "id": f"chatcmpl-{index}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": body["model"],
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": f"reply {index}"}}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+                    })
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Hedged loser was cancelled
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _client(stub, **kwargs):
+    upstream = openai.AsyncOpenAI(api_key="test-key", base_url=stub.base_url, max_retries=0)
+    return LLMClient(client=upstream, **kwargs)
+
+
+async def _burst(client, n):
+    return await asyncio.gather(*[
+        client.chat.completions.create(model="gpt-4o-mini", messages=[{"role": "user", "content": f"q{i}"}])
+        for i in range(n)
+    ])
+
+
+def test_concurrency_is_bounded():
+    print("🚦 Testing bounded concurrency...")
+    with StubServer(latency=lambda i: 0.05) as stub:
+        client = _client(stub, max_concurrency=4, initial_concurrency=4, hedge=False)
+        responses = asyncio.run(_burst(client, 20))
+
+    assert len(responses) == 20
+    assert stub.max_in_flight <= 4, stub.max_in_flight
+    assert client.stats()["latency"]["count"] == 20
+    print(f"  ✅ 20 calls, peak upstream concurrency {stub.max_in_flight}")
+
+
+def test_rate_limit_halves_concurrency_and_retries():
+    print("🐢 Testing AIMD backoff on 429...")
+    with StubServer(rate_limited=2) as stub:
+        client = _client(stub, max_concurrency=8, initial_concurrency=8, hedge=False, backoff_base=0.01)
+        responses = asyncio.run(_burst(client, 8))
+        stats = client.stats()
+
+    assert len(responses) == 8
+    assert stats["rate_limited"] == 2
+    assert stats["retries"] == 2
+    assert stats["errors"] == 0
+    assert stats["concurrency_limit"] < 8
+    print(f"  ✅ Limit dropped to {stats['concurrency_limit']} after {stats['rate_limited']} rate limits")
+
+
+def test_token_bucket_paces_requests():
+    print("🪣 Testing requests/min token bucket...")
+    with StubServer(latency=lambda i: 0.0) as stub:
+        client = _client(stub, requests_per_minute=1200, hedge=False)
+        client.requests = TokenBucket(1200, capacity=2)  # 20/s, burst of 2
+        start = time.perf_counter()
+        asyncio.run(_burst(client, 6))
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.18, f"bucket did not pace requests ({elapsed:.2f}s)"
+    print(f"  ✅ 6 requests paced over {elapsed:.2f}s")
+
+
+def test_hedging_cuts_tail_latency():
+    print("🏃 Testing hedged requests...")
+    with StubServer(latency=lambda i: 2.0 if i == 0 else 0.02) as stub:
+        client = _client(stub, hedge_after=0.1)
+
+        async def one():
+            return await client.chat.completions.create(
+                model="gpt-4o-mini", messages=[{"role": "user", "content": "slow"}])
+
+        start = time.perf_counter()
+        response = asyncio.run(one())
+        elapsed = time.perf_counter() - start
+        stats = client.stats()
+
+    assert response.choices[0].message.content == "reply 1"
+    assert elapsed < 1.0, f"hedge did not win ({elapsed:.2f}s)"
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+    assert stats["in_flight"] == 0
+    print(f"  ✅ Hedge answered in {elapsed:.2f}s instead of 2s")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("LLM CLIENT TESTS")
+    print("="*50)
+    test_concurrency_is_bounded()
+    test_rate_limit_halves_concurrency_and_retries()
+    test_token_bucket_paces_requests()
+    test_hedging_cuts_tail_latency()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test the LP/MILP staffing solver
+Sparse shift x skill x budget model, warm re-solves and the budget allocation MILP
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.engineering.lp_staffing import (
+    AgentType, StaffingLP, allocate_budget, shift_patterns
+)
+from src.core.engineering.erlang import ErlangStaffing
+from src.core.engineering.calculus_rigor import BPOOptimizationCalculus
+from src.core.process_theorems import TheoremProcessor
+
+
+def _model(skills=8, **options):
+    names = [f"s{k}" for k in range(skills)]
+    types = [
+        AgentType('generalist', 30000, 1.0),
+        AgentType('novice', 18000, 0.7, skills=tuple(names[:skills // 2])),
+        AgentType('specialist', 28000, 1.1, skills=tuple(names[skills // 2:])),
+        AgentType('expert', 35000, 1.2, max_agents=200),
+    ]
+    rng = np.random.default_rng(0)
+    profile = np.sin(np.linspace(0, np.pi, 96)) ** 2
+    calls = rng.poisson(40 * profile[:, None] * rng.uniform(0.5, 1.5, skills))
+    demand = ErlangStaffing().required_agents(calls, 300, interval_seconds=900)
+    return StaffingLP(types, shift_patterns(96, 32, 1, night_premium=0.15), names, **options), demand
+
+
+def test_milp_covers_demand():
+    print("📐 Testing shift x skill coverage MILP...")
+    model, demand = _model()
+    solution = model.solve(demand)
+    assert solution.success and solution.status in ('optimal', 'time_limit')
+    assert (solution.coverage >= demand - 1e-6).all()
+    assert (solution.agents == np.round(solution.agents)).all()
+    assert solution.headcount['expert'] <= 200
+    assert 0 <= solution.gap <= 0.05 and solution.lower_bound <= solution.total_cost
+    # Novices never work skills they lack
+    assert solution.agents[1, :, 4:].sum() == 0
+    print(f"  ✅ PHP {solution.total_cost:,.0f}, gap {solution.gap:.2%}, {solution.solve_seconds:.1f}s")
+
+
+def test_warm_resolve_and_budget():
+    print("♻️  Testing warm re-solve after a small demand change...")
+    model, demand = _model()
+    cold = model.solve(demand)
+    changed = demand.copy()
+    changed[40, 3] += 3
+    start = time.perf_counter()
+    warm = model.solve(changed)
+    elapsed = time.perf_counter() - start
+    assert warm.warm_started and warm.status == 'warm_start'
+    assert (warm.coverage >= changed - 1e-6).all()
+    assert warm.total_cost >= cold.total_cost
+    assert elapsed < cold.solve_seconds
+    assert not model.solve(changed, warm_start=False).warm_started
+
+    tight, _ = _model(budget=cold.total_cost * 0.8)
+    assert tight.solve(demand).status == 'infeasible'
+    soft, _ = _model(budget=cold.total_cost * 0.8, shortfall_cost=100000)
+    short = soft.solve(demand)
+    assert short.success and short.total_cost <= cold.total_cost * 0.8 + 1e-6
+    assert short.shortfall.sum() > 0
+    print(f"  ✅ Warm re-solve {elapsed:.2f}s vs {cold.solve_seconds:.2f}s cold; "
+          f"80% budget leaves {short.shortfall.sum():.0f} agent-intervals short")
+
+
+def test_ten_thousand_variables():
+    print("⚡ Testing 10k+ variable model...")
+    model, demand = _model(skills=40, integer=False)
+    assert model.n_variables > 10_000
+    solution = model.solve(demand)
+    assert solution.success and solution.gap == 0
+    assert (solution.coverage >= demand - 1e-6).all()
+    assert solution.solve_seconds < 10, solution.solve_seconds
+    print(f"  ✅ {model.n_variables:,} variables: LP in {solution.solve_seconds:.2f}s "
+          f"(build {model.build_seconds*1000:.0f}ms)")
+
+
+def test_budget_allocation_replaces_greedy():
+    print("💰 Testing budget allocation MILP...")
+    allocation = BPOOptimizationCalculus().optimize_resource_allocation({'constraints': {'budget': 1000000}})
+    assert allocation['total_cost'] <= 1000000
+    assert allocation['total_efficiency'] > 35  # The greedy loop reached 35.0
+    assert all(5 <= n <= 50 for n in allocation['allocation'].values())
+    assert allocate_budget(budget=50000)['total_agents'] == 0  # Cannot afford 5 of any type
+
+    demand = np.ceil(10 * np.sin(np.linspace(0, np.pi, 24)) ** 2)
+    theorem = TheoremProcessor().get_theorem(6, staffing_demand=demand, staffing_cost=1000000)
+    lp = theorem.parameters['lp_solution']
+    assert lp['success'] and theorem.savings_php == 1000000 - lp['optimized_staffing_cost']
+    assert TheoremProcessor().get_theorem(6, monthly_cost=1000000).savings_php == 200000
+    print(f"  ✅ {allocation['allocation']} -> efficiency {allocation['total_efficiency']:.1f}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("LP STAFFING TESTS")
+    print("="*50)
+    test_milp_covers_demand()
+    test_warm_resolve_and_budget()
+    test_ten_thousand_variables()
+    test_budget_allocation_replaces_greedy()
+    print("\n✅ ALL PASSED")
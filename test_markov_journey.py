@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the Markov journey engine
+Sparse transition counts, incremental updates, stationary mix and steps to resolution
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.engineering.markov_journey import JourneyEngine, TICKET_STATUSES
+from src.core.process_theorems import TheoremProcessor
+
+# open, in-progress, pending, resolved
+TRUE_P = np.array([
+    [0.00, 0.80, 0.10, 0.10],
+    [0.05, 0.00, 0.35, 0.60],
+    [0.00, 0.70, 0.00, 0.30],
+    [0.00, 0.00, 0.00, 1.00],
+])
+
+
+def _events(tickets, seed=0):
+    """Journeys from TRUE_P, tickets advancing in lockstep (interleaved log)"""
+    rng = np.random.default_rng(seed)
+    cumulative = TRUE_P.cumsum(axis=1)
+    state = np.zeros(tickets, dtype=np.int64)
+    alive = np.arange(tickets)
+    ids, codes = [alive.copy()], [state.copy()]
+    while len(alive):
+        step = (rng.random(len(alive))[:, None] > cumulative[state[alive]]).sum(axis=1)
+        state[alive] = step
+        ids.append(alive.copy())
+        codes.append(step)
+        alive = alive[step != 3]
+    return np.concatenate(ids), np.array(TICKET_STATUSES)[np.concatenate(codes)]
+
+
+def test_recovers_chain_and_resolution_steps():
+    print("🔗 Testing transition estimates and steps to resolution...")
+    tickets, statuses = _events(20_000)
+    engine = JourneyEngine().update_arrays(tickets, statuses)
+    P = engine.transition_matrix()
+    assert np.allclose(P.sum(axis=1), 1.0)
+    assert np.abs(P.toarray() - TRUE_P).max() < 0.03
+
+    expected = np.linalg.solve(np.eye(3) - TRUE_P[:3, :3], np.ones(3))
+    steps = engine.expected_steps_to_resolution()
+    assert np.allclose(steps[:3], expected, rtol=0.03) and steps[3] == 0
+    assert np.allclose(engine.absorption_probabilities()[:, 0], 1.0)
+
+    # With restart, resolved holds one step per journey
+    stationary = engine.stationary_distribution()
+    assert abs(stationary[3] - 1 / (1 + steps[0])) < 1e-6
+    print(f"  ✅ Steps to resolution {np.round(steps, 2).tolist()}")
+
+
+def test_incremental_matches_single_pass():
+    print("🧩 Testing incremental updates...")
+    tickets, statuses = _events(3_000, seed=1)
+    whole = JourneyEngine().update(zip(tickets.tolist(), statuses.tolist()))
+    batched = JourneyEngine()
+    for start in range(0, len(tickets), 997):
+        batched.update_arrays(tickets[start:start + 997], statuses[start:start + 997])
+    assert (whole.counts != batched.counts).nnz == 0
+    assert (whole.entry_distribution == batched.entry_distribution).all()
+    assert whole.tickets_in_flight == batched.tickets_in_flight == 0
+
+    batched.update([('T-1', 'open'), ('T-1', 'escalated')])
+    assert batched.states[-1] == 'escalated' and batched.tickets_in_flight == 1
+    assert np.isinf(batched.expected_steps_to_resolution()[-1])  # Never seen leaving
+    batched.update([('T-1', 'resolved'), ('T-1', 'open')])  # Reopened: a new journey
+    assert batched.tickets_in_flight == 1
+    print(f"  ✅ {batched.events:,} events, states {batched.states}")
+
+
+def test_dead_end_is_not_resolution():
+    print("🚧 Testing dead-end statuses...")
+    events = [(f"R-{i}", status) for i in range(50) for status in ('open', 'in-progress', 'resolved')]
+    events += [(f"E-{i}", status) for i in range(50) for status in ('open', 'escalated')]
+    engine = JourneyEngine().update(events)
+    steps = dict(zip(engine.states, engine.expected_steps_to_resolution()))
+    # Half of 'open' tickets sit in 'escalated', never seen leaving: resolution is not certain
+    assert np.isinf(steps['open']) and np.isinf(steps['escalated'])
+    assert steps['in-progress'] == 1 and steps['resolved'] == 0
+    resolved = engine.absorption_probabilities()[:, 0]
+    assert np.isclose(resolved[engine.states.index('open')], 0.5)
+    assert engine.summary()['expected_steps_to_resolution']['open'] is None
+    # Half of the entering tickets never resolve, so there is no average to report
+    assert engine.summary()['expected_steps_from_entry'] is None
+    assert engine.summary()['unresolved_entry_share'] == 1.0  # Every ticket enters at 'open'
+    print(f"  ✅ 'open' resolves with probability {resolved[0]:.2f}, steps reported as inf")
+
+
+def test_million_events():
+    print("⚡ Testing over a million status changes...")
+    tickets, statuses = _events(300_000, seed=2)
+    engine = JourneyEngine()
+    start = time.perf_counter()
+    for offset in range(0, len(tickets), 250_000):
+        engine.update_arrays(tickets[offset:offset + 250_000], statuses[offset:offset + 250_000])
+    summary = engine.summary()
+    elapsed = time.perf_counter() - start
+    assert summary['events'] == len(tickets) > 1_000_000
+    assert abs(summary['expected_steps_from_entry'] - 2.818) < 0.05
+    assert elapsed < 10.0, elapsed
+    print(f"  ✅ {len(tickets):,} events in {elapsed:.2f}s")
+
+
+def test_theorem_5_hook():
+    print("🧠 Testing Markov Chain theorem hook...")
+    tickets, statuses = _events(2_000, seed=3)
+    # A generator works: it is consumed once and not echoed back in the parameters
+    theorem = TheoremProcessor().get_theorem(5, ticket_events=zip(tickets.tolist(), statuses.tolist()))
+    journey = theorem.parameters['journey']
+    assert journey['events'] == len(tickets)
+    assert 'ticket_events' not in theorem.parameters
+    assert abs(sum(journey['stationary_distribution'].values()) - 1) < 1e-3
+    assert journey['unresolved_entry_share'] == 0
+    assert 'journey' not in TheoremProcessor().get_theorem(5).parameters
+    print(f"  ✅ {journey['expected_steps_from_entry']:.2f} steps from entry to resolution")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("MARKOV JOURNEY TESTS")
+    print("="*50)
+    test_recovers_chain_and_resolution_steps()
+    test_incremental_matches_single_pass()
+    test_dead_end_is_not_resolution()
+    test_million_events()
+    test_theorem_5_hook()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized Monte Carlo staffing engine
+Reproducibility, chunking, percentile intervals and large simulation counts
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.services.theorem_bridge import BPOTheoremBridge
+
+HISTORY = {'current_agents': 50, 'daily_calls': [1200, 1500, 1800, 2000, 1800, 1600, 1400]}
+
+
+def test_seeded_and_chunk_invariant():
+    print("🎲 Testing seeds and chunking...")
+    bridge = BPOTheoremBridge()
+    first = bridge.apply_monte_carlo_to_staffing(HISTORY, n_simulations=50000, seed=7)
+    again = bridge.apply_monte_carlo_to_staffing(HISTORY, n_simulations=50000, seed=7)
+
+    chunked = BPOTheoremBridge()
+    chunked.MC_CHUNK_SIZE = 4096
+    split = chunked.apply_monte_carlo_to_staffing(HISTORY, n_simulations=50000, seed=7)
+    assert first == again == split
+    print(f"  ✅ Same result in 1 or 13 chunks: {first['confidence_interval']}")
+
+
+def test_matches_direct_percentiles():
+    print("📐 Testing percentiles against the expanded sample...")
+    bridge = BPOTheoremBridge()
+    values, counts = bridge._simulate_staffing(1600.0, 300, 0.8, 20000, seed=3)
+    sample = np.repeat(values, counts)
+    assert counts.sum() == 20000
+    for q in (5, 50, 85, 95):
+        expected = np.percentile(sample, q, method="inverted_cdf")
+        assert bridge._weighted_percentile(values, counts, q) == expected
+
+    result = bridge.apply_monte_carlo_to_staffing(HISTORY, n_simulations=20000, seed=3)
+    low, high = (int(x) for x in result['confidence_interval'].split(' agents')[0].split(' to '))
+    assert low <= result['optimized_staffing'] <= high
+    assert float(result['service_level_confidence'].rstrip('%')) >= 85
+    print(f"  ✅ p85 = {result['optimized_staffing']} agents, covers {result['service_level_confidence']}")
+
+
+def test_ten_million_simulations():
+    print("🚀 Testing 10^7 simulations...")
+    bridge = BPOTheoremBridge()
+    start = time.perf_counter()
+    result = bridge.apply_monte_carlo_to_staffing(HISTORY, n_simulations=10_000_000, seed=1)
+    elapsed = time.perf_counter() - start
+    assert result['simulations'] == 10_000_000
+    assert elapsed < 30, elapsed
+    print(f"  ✅ 10^7 simulations in {elapsed:.2f}s: {result['staffing_percentiles']}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("MONTE CARLO STAFFING TESTS")
+    print("="*50)
+    test_seeded_and_chunk_invariant()
+    test_matches_direct_percentiles()
+    test_ten_million_simulations()
+    print("\n✅ ALL PASSED")
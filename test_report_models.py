@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the typed BPO report models
+Raw floats in results, lazy formatting and numeric aggregation
+"""
+
+import sys
+import time
+sys.path.insert(0, '.')
+
+from src.services.theorem_bridge import BPOTheoremBridge
+from src.services.report_models import BPOReport, aggregate_reports, php
+
+CLIENT = {'monthly_cost': 1234567.89, 'agent_count': 50, 'calls_per_month': 12000}
+
+
+def test_typed_results_keep_precision():
+    print("🔢 Testing typed results...")
+    report = BPOTheoremBridge().build_bpo_report(CLIENT)
+    assert isinstance(report, BPOReport)
+    assert not hasattr(report, '__dict__')  # Slotted
+    assert isinstance(report.cost_structure.monthly_savings, float)
+    # No rounding through "PHP 1,234" strings: exactly 1 - 0.4*0.8 - 0.6*0.85 of the cost
+    assert abs(report.cost_structure.monthly_savings - 1234567.89 * (1 - 0.32 - 0.51)) < 1e-6
+    expected = (report.cost_structure.monthly_savings + report.staffing.monthly_savings
+                + report.overall.total_monthly_savings)
+    assert report.total_monthly_savings == expected
+    print(f"  ✅ Total savings {report.total_monthly_savings:.4f} kept as float")
+
+
+def test_dict_layout_is_rendered_on_demand():
+    print("📄 Testing legacy dict rendering...")
+    bridge = BPOTheoremBridge()
+    report = bridge.build_bpo_report(CLIENT)
+    rendered = report.to_dict()
+    summary = rendered['executive_summary']
+    assert summary['total_monthly_savings'] == php(report.total_monthly_savings)
+    assert rendered['detailed_optimizations']['cost_structure'] == bridge.apply_shor_to_cost_structure(CLIENT)
+    assert rendered['implementation_roadmap'][0]['expected_savings'].endswith('/month')
+    areas = rendered['detailed_optimizations']['overall_optimization']['optimization_areas']
+    assert set(areas[0]) == {'area', 'current', 'target', 'improvement_percentage', 'monthly_savings_php'}
+    print(f"  ✅ {summary['total_monthly_savings']} / month, ROI {summary['roi_months']}")
+
+
+def test_aggregate_thousands_of_reports():
+    print("📊 Testing portfolio aggregation...")
+    bridge = BPOTheoremBridge()
+    template = bridge.build_bpo_report(CLIENT)
+    reports = []
+    for i in range(5000):
+        cost = bridge.optimize_cost_structure({'monthly_cost': 500000 + i * 100.25})
+        reports.append(BPOReport(cost, template.staffing, template.overall))
+
+    start = time.perf_counter()
+    summary = aggregate_reports(reports)
+    elapsed = time.perf_counter() - start
+
+    assert summary.reports == 5000
+    expected = sum(r.total_monthly_savings for r in reports)
+    assert abs(summary.total_monthly_savings - expected) < 1e-3
+    assert summary.implementation_cost == 5000 * 250000
+    assert summary.to_dict()['total_monthly_savings'] == php(expected)
+    assert elapsed < 0.5, elapsed
+    print(f"  ✅ 5,000 reports summed in {elapsed*1000:.1f}ms: {summary.to_dict()['total_monthly_savings']}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("REPORT MODEL TESTS")
+    print("="*50)
+    test_typed_results_keep_precision()
+    test_dict_layout_is_rendered_on_demand()
+    test_aggregate_thousands_of_reports()
+    print("\n✅ ALL PASSED")
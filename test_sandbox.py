@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test the sandbox worker pool
+CPU and memory rlimits, respawn after a kill, concurrent jobs and the compiled-code cache
+"""
+
+import sys
+import time
+sys.path.insert(0, '.')
+
+from src.utils import sandbox
+from src.utils.sandbox import Sandbox, SandboxPool
+from src.utils.code_analysis import analyze
+
+
+def test_cpu_limit_kills_infinite_loop():
+    print("🔁 Testing an infinite loop against the CPU limit...")
+    pool = SandboxPool(workers=1, cpu_seconds=1, timeout=30.0)
+    start = time.perf_counter()
+    result = pool.run("while True:\n    pass")
+    elapsed = time.perf_counter() - start
+    assert result["safe"] is False and "worker killed" in result["error"]
+    assert pool.stats["crashes"] == 1 and pool.stats["timeouts"] == 0
+    assert elapsed < 10.0, elapsed
+
+    # The respawned worker serves the next job
+    assert pool.run("result = sum(range(10))") == {"safe": True, "result": 45}
+    assert pool.stats["respawns"] == 1
+    pool.shutdown()
+    print(f"  ✅ Killed after {elapsed:.1f}s ({result['error']}), pool reused")
+
+
+def test_wall_clock_timeout():
+    print("⏱️  Testing the wall-clock timeout...")
+    pool = SandboxPool(workers=1, cpu_seconds=30, timeout=0.5)
+    result = pool.run("while True:\n    pass")
+    assert "timed out" in result["error"] and pool.stats["timeouts"] == 1
+    assert pool.run("result = 'alive'")["result"] == "alive"
+    pool.shutdown()
+    print("  ✅ Timed-out worker replaced")
+
+
+def test_memory_limit():
+    print("🧱 Testing a huge allocation against RLIMIT_AS...")
+    pool = SandboxPool(workers=1, memory_mb=64)
+    result = pool.run("result = len(bytearray(2 * 1024 ** 3))")
+    assert result == {"safe": False, "error": "Execution error: memory limit exceeded"}
+    assert pool.run("result = len(bytearray(1024 ** 2))")["result"] == 1024 ** 2
+    assert pool.stats["crashes"] == 0
+    pool.shutdown()
+    print(f"  ✅ {result['error']}; the same worker keeps running")
+
+
+def test_concurrent_submissions():
+    print("🧵 Testing concurrent submissions...")
+    pool = SandboxPool(workers=3)
+    futures = [pool.submit(f"result = {i} * {i}") for i in range(30)]
+    futures.append(pool.submit("raise ValueError('boom')"))
+    futures.append(pool.submit("while True:\n    pass", timeout=0.5))
+    futures += [pool.submit(f"result = -{i}") for i in range(10)]
+    results = [future.result(timeout=30) for future in futures]
+    assert [r["result"] for r in results[:30]] == [i * i for i in range(30)]
+    assert results[30] == {"safe": False, "error": "Execution error: boom"}
+    assert "timed out" in results[31]["error"]
+    assert [r["result"] for r in results[32:]] == [-i for i in range(10)]
+    assert pool.stats["submitted"] == pool.stats["completed"] == 42
+    pool.shutdown()
+    print(f"  ✅ {len(results)} jobs on {pool.workers} workers, one timeout contained")
+
+
+def test_vetting_and_compiled_cache():
+    print("🛡️  Testing vetting and the compiled-code cache...")
+    box = Sandbox(pool=SandboxPool(workers=1))
+    assert box.execute("import os")["error"] == "Unsafe code: import os"
+    assert box.execute("result = (")["error"].startswith("Syntax error")
+    assert box.execute("result = [x for x in range(3)]")["result"] == [0, 1, 2]
+    assert box.pool.stats["submitted"] == 1  # Rejected code never reaches a worker
+    box.pool.shutdown()
+
+    code = "result = math.sqrt(16)"
+    digest = analyze(code).digest
+    first = sandbox._compiled(digest, code)
+    assert sandbox._compiled(digest, code) is first  # Compiled once per digest
+    assert sandbox._run_code(digest, code) == {"safe": True, "result": 4.0}
+    print("  ✅ Unsafe code stopped in-process; compiled code reused by digest")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("SANDBOX TESTS")
+    print("="*50)
+    test_cpu_limit_kills_infinite_loop()
+    test_wall_clock_timeout()
+    test_memory_limit()
+    test_concurrent_submissions()
+    test_vetting_and_compiled_cache()
+    print("\n✅ ALL PASSED")
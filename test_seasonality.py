@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test the FFT seasonality engine
+Dominant periods, seasonal profiles and per-window spectrum caching
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.engineering.seasonality import SeasonalityEngine, get_seasonality_engine
+from src.core.process_theorems import TheoremProcessor
+
+PER_DAY = 96
+
+
+def _volumes(queues, days, seed=0):
+    """Midday peak, quieter weekends; queue scale varies"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(days * PER_DAY)
+    intraday = 0.2 + np.sin(np.pi * (t % PER_DAY) / PER_DAY) ** 2
+    weekday = np.where(t // PER_DAY % 7 < 5, 1.0, 0.6)
+    scale = rng.uniform(5, 40, (queues, 1))
+    return rng.poisson(scale * intraday * weekday).astype(float)
+
+
+def test_periods_and_profiles():
+    print("📈 Testing dominant periods and profiles...")
+    volumes = _volumes(queues=20, days=56)
+    result = SeasonalityEngine().analyze(volumes, queue_ids=[f"q{i}" for i in range(20)])
+    assert result.windows == 2
+    assert (result.periods_hours[:, 0] == 24).all()
+    assert (result.daily_strength > 0.4).all() and (result.weekly_strength > 0.05).all()
+    assert np.allclose(result.weekly_profile[:, 5:], 0.6 / (6.2 / 7), atol=0.05)
+    assert result.intraday_profile.shape == (20, PER_DAY)
+    assert result.intraday_profile[:, 48].min() > result.intraday_profile[:, 0].max()
+    rendered = result.to_dict(queues=['q3'])
+    assert rendered['queues']['q3']['dominant_periods'][0]['label'] == 'daily'
+    print(f"  ✅ Top periods {result.dominant_periods(0)}")
+
+
+def test_incremental_windows():
+    print("🗂️  Testing per-window spectrum cache...")
+    engine = SeasonalityEngine()
+    volumes = _volumes(queues=50, days=84)
+    first = engine.analyze(volumes)
+    assert first.windows_computed == 150
+
+    more = np.concatenate([volumes, _volumes(queues=50, days=28, seed=1)], axis=1)
+    appended = engine.analyze(more)
+    assert appended.windows == 4 and appended.windows_computed == 50  # Only the new window
+
+    edited = more.copy()
+    edited[7, 100] += 5
+    assert engine.analyze(edited).windows_computed == 1
+
+    # Rolling series: drop the oldest window, keep alignment with origin
+    rolled = engine.analyze(more[:, 28 * PER_DAY:], origin=28 * PER_DAY)
+    assert rolled.windows_computed == 0
+    fresh = SeasonalityEngine().analyze(more[:, 28 * PER_DAY:], origin=28 * PER_DAY)
+    assert np.allclose(rolled.mean_power, fresh.mean_power, rtol=1e-5)
+    print(f"  ✅ {engine.cache_info()}")
+
+
+def test_cache_byte_budget():
+    print("📦 Testing the spectrum cache byte budget...")
+    volumes = _volumes(queues=50, days=84)
+    probe = SeasonalityEngine()
+    probe.analyze(volumes[:1, :28 * PER_DAY])
+    entry = probe.cache_info()["bytes"]
+    assert entry == (28 * PER_DAY // 2 + 1) * 4 + 16
+
+    engine = SeasonalityEngine(cache_bytes=40 * entry)
+    engine.analyze(volumes)
+    info = engine.cache_info()
+    assert info["size"] == 40 and info["bytes"] == 40 * entry <= info["max_bytes"]
+    assert all(spectrum.base is None for _, spectrum in engine._cache.values())  # Not views of a chunk
+    assert engine.analyze(volumes).windows_computed == 110  # Only the 40 newest windows survived
+
+    off = SeasonalityEngine(cache_bytes=0)
+    assert off.analyze(volumes).windows_computed == off.analyze(volumes).windows_computed == 150
+    assert off.cache_info()["size"] == 0
+
+    # The theorem hook only touches the shared engine when asked to cache
+    shared = get_seasonality_engine()
+    before = shared.cache_info()["size"]
+    TheoremProcessor().get_theorem(9, call_volumes=volumes[:3])
+    assert shared.cache_info()["size"] == before
+    TheoremProcessor().analyze_call_patterns(volumes[:3], cache=True)
+    assert shared.cache_info()["size"] == before + 9
+    print(f"  ✅ {info['size']} windows in {info['bytes']:,} bytes; uncached hook left the shared engine alone")
+
+
+def test_year_of_intervals_for_many_queues():
+    print("⚡ Testing a year of 15-minute data for 1,000 queues...")
+    rng = np.random.default_rng(2)
+    t = np.arange(364 * PER_DAY)
+    pattern = (0.2 + np.sin(np.pi * (t % PER_DAY) / PER_DAY) ** 2).astype(np.float32)
+    volumes = pattern * rng.uniform(5, 40, (1000, 1)).astype(np.float32)
+    volumes += rng.standard_normal(volumes.shape, dtype=np.float32)
+    engine = SeasonalityEngine()
+    start = time.perf_counter()
+    result = engine.analyze(volumes)
+    elapsed = time.perf_counter() - start
+    assert result.windows == 13 and (result.periods_hours[:, 0] == 24).all()
+    assert elapsed < 5.0, elapsed
+    start = time.perf_counter()
+    engine.analyze(volumes)
+    cached = time.perf_counter() - start
+    print(f"  ✅ {volumes.size:,} intervals in {elapsed:.2f}s, {cached:.2f}s from cache")
+
+
+def test_theorem_9_hook():
+    print("🔗 Testing Fourier Transform theorem hook...")
+    theorem = TheoremProcessor().get_theorem(9, call_volumes=_volumes(queues=5, days=28))
+    assert 0.4 < theorem.parameters['pattern_accuracy'] <= 1.0
+    assert theorem.parameters['seasonality']['dominant_periods_hours'] == [24.0]
+    assert 'call_volumes' not in theorem.parameters  # Only the summary, not the input array
+    assert 'seasonality' not in TheoremProcessor().get_theorem(9).parameters
+    print(f"  ✅ Pattern accuracy {theorem.parameters['pattern_accuracy']:.1%}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("SEASONALITY ENGINE TESTS")
+    print("="*50)
+    test_periods_and_profiles()
+    test_incremental_windows()
+    test_cache_byte_budget()
+    test_year_of_intervals_for_many_queues()
+    test_theorem_9_hook()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test batched sentiment scoring
+Ordering, dedupe/LRU caching, process-pool sharding and BpoService wiring
+"""
+
+import sys
+import asyncio
+sys.path.insert(0, '.')
+
+from src.services.sentiment_service import SentimentService
+from src.services.bpo_service import BpoService
+
+TEXTS = [
+    "The agent was wonderful and solved my issue quickly!",
+    "This is the worst service I have ever had.",
+    "I called about my bill.",
+]
+
+
+def test_ordered_and_deduplicated():
+    print("🔁 Testing order and dedupe...")
+    service = SentimentService(workers=1)
+    batch = [TEXTS[0], TEXTS[1], TEXTS[0], TEXTS[2], TEXTS[1]]
+
+    results = service.score_batch(batch)
+
+    assert [r["label"] for r in results] == ["positive", "negative", "positive", "neutral", "negative"]
+    assert results[0] == results[2] and results[0] is not results[2]
+    assert service.stats["scored_local"] == 3
+    assert service.stats["duplicates"] == 2
+
+    results[0]["label"] = "mutated"  # Neither the duplicate nor the cache entry changes
+    assert results[2]["label"] == "positive"
+    service.score_batch(TEXTS)
+    assert service.stats["cache_hits"] == 3
+    assert service.score(TEXTS[0])["label"] == "positive"
+    assert service.stats["scored_local"] == 3
+    print(f"  ✅ {service.stats['texts']} texts, {service.stats['scored_local']} actually scored")
+
+
+def test_pool_matches_local():
+    print("🧵 Testing process-pool sharding...")
+    texts = [f"{TEXTS[i % 3]} (ticket {i})" for i in range(60)]
+    local = SentimentService(workers=1).score_batch(texts)
+
+    pooled_service = SentimentService(workers=2, shard_size=16, parallel_threshold=50)
+    try:
+        pooled = pooled_service.score_batch(texts)
+    finally:
+        pooled_service.shutdown()
+
+    assert pooled == local
+    assert pooled_service.stats["scored_pool"] == 60
+    print("  ✅ 60 texts scored across 4 shards, identical to in-process results")
+
+
+def test_batch_process_uses_real_sentiment():
+    print("🎫 Testing BpoService.batch_process wiring...")
+    service = BpoService(sentiment=SentimentService(workers=1))
+
+    results = asyncio.run(service.batch_process(TEXTS))
+
+    assert [r["task"] for r in results] == TEXTS
+    assert [r["sentiment"] for r in results] == ["positive", "negative", "neutral"]
+    assert service.sentiment.stats["batches"] == 1
+    print("  ✅ One scoring pass for the whole batch")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("SENTIMENT SERVICE TESTS")
+    print("="*50)
+    test_ordered_and_deduplicated()
+    test_pool_matches_local()
+    test_batch_process_uses_real_sentiment()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test the statistical process control engine
+X-bar/R, EWMA and CUSUM per agent, incremental updates and out-of-control queries
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.engineering.spc import QualityControlEngine, CUSUM_LOW
+from src.core.process_theorems import TheoremProcessor
+
+
+def test_charts_match_hand_computation():
+    print("📏 Testing chart statistics...")
+    engine = QualityControlEngine(mean=0.9, sigma=0.02, subgroup_size=5, ewma_lambda=0.5)
+    scores = [0.92, 0.88, 0.90, 0.86, 0.84]
+    for score in scores:
+        engine.record('A-1', score)
+    status = engine.status('A-1')
+
+    z = 0.9
+    high = low = 0.0
+    for x in scores:
+        z = 0.5 * x + 0.5 * z
+        high = max(0.0, high + (x - 0.9) / 0.02 - 0.5)
+        low = max(0.0, low - (x - 0.9) / 0.02 - 0.5)
+    assert np.isclose(status['ewma'], z)
+    assert np.isclose(status['cusum_high'], high) and np.isclose(status['cusum_low'], low)
+    assert np.isclose(status['last_xbar'], np.mean(scores)) and np.isclose(status['last_range'], 0.08)
+    assert status['subgroups'] == 1 and status['scores'] == 5
+    lower, upper = engine.xbar_limits
+    assert np.isclose(upper - 0.9, 3 * 0.02 / np.sqrt(5))
+    assert engine.range_limits[0] == 0 and np.isclose(engine.range_limits[1], 4.918 * 0.02)
+    print(f"  ✅ EWMA {status['ewma']:.4f}, CUSUM- {status['cusum_low']:.2f}")
+
+
+def test_batches_match_single_records():
+    print("🧩 Testing batched updates against one-at-a-time...")
+    rng = np.random.default_rng(0)
+    agents = rng.integers(0, 40, 3000)
+    scores = rng.normal(0.9, 0.03, 3000)
+    single = QualityControlEngine(mean=0.9, sigma=0.03)
+    for agent, score in zip(agents.tolist(), scores.tolist()):
+        single.record(agent, score)
+    batched = QualityControlEngine(mean=0.9, sigma=0.03, capacity=4)
+    for start in range(0, 3000, 701):
+        batched.update(agents[start:start + 701], scores[start:start + 701])
+    for agent in range(40):
+        assert single.status(agent) == batched.status(agent)
+    assert single.out_of_control() == batched.out_of_control()
+
+    calibrated = QualityControlEngine()
+    calibrated.update(agents, scores)
+    assert abs(calibrated.mean - 0.9) < 0.005 and abs(calibrated.sigma - 0.03) < 0.005
+    print(f"  ✅ {batched.agents} agents identical; {len(batched.out_of_control())} out of control")
+
+
+def test_phase_one_buffering():
+    print("⏳ Testing Phase I buffering without a standard...")
+    engine = QualityControlEngine(phase_one=30)
+    assert engine.record('a', 0.9) is False and not engine.calibrated
+    engine.update(['b'] * 10, [0.9] * 10)  # Identical scores: no spread yet
+    assert not engine.calibrated and engine.summary()['phase_one_buffered'] == 11
+
+    rng = np.random.default_rng(5)
+    agents = rng.integers(0, 5, 200)
+    scores = rng.normal(0.9, 0.03, 200)
+    engine.update(agents[:40], scores[:40])
+    assert engine.calibrated and engine.summary()['phase_one_buffered'] == 0
+    engine.update(agents[40:], scores[40:])
+
+    # Same result as knowing the standard up front
+    sample = np.concatenate([[0.9] * 11, scores[:40]])
+    known = QualityControlEngine(mean=sample.mean(), sigma=sample.std(ddof=1))
+    known.update(['a'] + ['b'] * 10, [0.9] * 11)
+    known.update(agents, scores)
+    for agent in ['a', 'b'] + list(range(5)):
+        assert engine.status(agent) == known.status(agent)
+
+    theorem = TheoremProcessor().get_theorem(11, qa_scores=[('a', 0.9)])
+    assert theorem.parameters['quality_control']['calibrated'] is False
+    assert theorem.parameters['out_of_control_agents'] == []
+    print(f"  ✅ Phase I of {len(sample)} scores replayed; mean {engine.mean:.3f}, sigma {engine.sigma:.3f}")
+
+
+def test_detects_drifting_agents():
+    print("🚨 Testing detection of drifting agents...")
+    rng = np.random.default_rng(1)
+    engine = QualityControlEngine(mean=0.9, sigma=0.03)
+    agents = np.arange(1000)
+    for _ in range(10):  # Everyone in control
+        engine.update(agents, rng.normal(0.9, 0.03, 1000))
+    baseline = set(engine.out_of_control())
+    assert len(baseline) < 50  # False alarms stay rare
+
+    newly = []
+    for _ in range(20):  # Agents 0-9 slip by one sigma
+        scores = rng.normal(0.9, 0.03, 1000)
+        scores[:10] -= 0.03
+        newly += engine.update(agents, scores)
+    drifting = set(engine.out_of_control('cusum_low'))
+    assert set(range(10)) <= drifting | set(newly)
+    assert engine.flags[:10].astype(bool).sum() >= 8 and all(engine.flags[i] & CUSUM_LOW for i in drifting)
+
+    engine.acknowledge(range(10))
+    assert not set(engine.out_of_control()) & set(range(10))
+    assert engine.status(0)['cusum_low'] == 0 and engine.status(0)['ewma'] == 0.9
+    print(f"  ✅ {len(drifting)} agents on CUSUM-, {len(baseline)} false alarms in control")
+
+
+def test_fifty_thousand_agents():
+    print("⚡ Testing 50,000 agents...")
+    rng = np.random.default_rng(2)
+    engine = QualityControlEngine(mean=0.9, sigma=0.03)
+    batches = [(rng.integers(0, 50_000, 50_000), rng.normal(0.9, 0.03, 50_000)) for _ in range(20)]
+    start = time.perf_counter()
+    for agents, scores in batches:
+        engine.update(agents, scores)
+    elapsed = time.perf_counter() - start
+    assert engine.agents == 50_000 and engine.scores == 1_000_000
+    assert elapsed < 10.0, elapsed
+
+    start = time.perf_counter()
+    flagged = engine.out_of_control()
+    query = time.perf_counter() - start
+    assert len(flagged) == engine.summary()['out_of_control'] < 0.05 * 50_000
+    assert query < 0.05, query
+    print(f"  ✅ 1,000,000 scores in {elapsed:.2f}s ({elapsed:.2f}us/score); "
+          f"query {query*1000:.1f}ms for {len(flagged)} agents")
+
+
+def test_theorem_11_hook():
+    print("🧠 Testing Central Limit Theorem hook...")
+    rng = np.random.default_rng(3)
+    pairs = [(f"AGT-{i % 50:03d}", score) for i, score in enumerate(rng.normal(0.9, 0.03, 2000))]
+    theorem = TheoremProcessor().get_theorem(11, qa_scores=pairs)
+    quality = theorem.parameters['quality_control']
+    assert quality['agents'] == 50 and quality['scores'] == 2000
+    assert len(theorem.parameters['out_of_control_agents']) == quality['out_of_control']
+    assert 'quality_control' not in TheoremProcessor().get_theorem(11).parameters
+    print(f"  ✅ In-control rate {quality['in_control_rate']:.0%}")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("SPC TESTS")
+    print("="*50)
+    test_charts_match_hand_computation()
+    test_batches_match_single_records()
+    test_phase_one_buffering()
+    test_detects_drifting_agents()
+    test_fifty_thousand_agents()
+    test_theorem_11_hook()
+    print("\n✅ ALL PASSED")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test portfolio mode of the theorem processor
+All 13 theorems over many client profiles as (clients x theorems) arrays
+"""
+
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '.')
+
+from src.core.process_theorems import (
+    TheoremProcessor, get_theorem_processor, run_portfolio, top_k
+)
+
+
+def test_matches_per_theorem_results():
+    print("🧮 Testing portfolio against get_theorem...")
+    processor = TheoremProcessor()
+    costs = [250000, 1000000, 3750000.5]
+    portfolio = processor.run_portfolio(costs, agent_counts=[10, 50, 200])
+    assert portfolio.savings.shape == portfolio.efficiency.shape == (3, 13)
+    for row, cost in enumerate(costs):
+        results = processor.run_all_theorems({'monthly_cost': cost})
+        assert portfolio.savings[row].tolist() == [r.savings_php for r in results]
+        assert portfolio.efficiency[row].tolist() == [r.efficiency_gain for r in results]
+    assert portfolio.theorems_verified == 13
+    assert portfolio.top_theorems(3)[1].tolist() == [13, 1, 6]
+    print(f"  ✅ Client 2 saves PHP {portfolio.total_savings[1]:,.0f}/month across 13 theorems")
+
+
+def test_top_k_is_stable():
+    print("🔢 Testing argpartition top-k...")
+    values = np.array([[0, 5, 5, 1, 5], [3, 3, 3, 3, 3]])
+    assert top_k(values, 2).tolist() == [[1, 2], [0, 1]]
+    assert top_k(values, 5).tolist() == [[1, 2, 4, 3, 0], [0, 1, 2, 3, 4]]
+    assert top_k(values, 0).shape == (2, 0)
+    # Ties match the old sorted(..., reverse=True)[:3] ranking
+    optimization = TheoremProcessor().optimize_with_theorems({'monthly_cost': 0})
+    assert [t['id'] for t in optimization['top_theorems']] == [1, 2, 3]
+    print("  ✅ Ties resolve to the lowest index")
+
+
+def test_prospect_screening_scale():
+    print("⚡ Testing 100,000 client profiles...")
+    rng = np.random.default_rng(0)
+    costs = rng.lognormal(13.5, 0.8, 100_000)
+    agents = rng.integers(10, 500, 100_000)
+    start = time.perf_counter()
+    portfolio = run_portfolio(costs, agents)
+    best = portfolio.top_clients(100)
+    ranked = portfolio.top_theorems(3)
+    elapsed = time.perf_counter() - start
+    assert portfolio.savings.shape == (100_000, 13)
+    assert ranked.shape == (100_000, 3)
+    assert (portfolio.total_savings[best] >= np.sort(portfolio.total_savings)[-100]).all()
+    assert best[0] == np.argmax(costs)
+    assert get_theorem_processor() is get_theorem_processor()
+    assert elapsed < 1.0, elapsed
+    print(f"  ✅ Screened 100,000 clients in {elapsed*1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("THEOREM PORTFOLIO TESTS")
+    print("="*50)
+    test_matches_per_theorem_results()
+    test_top_k_is_stable()
+    test_prospect_screening_scale()
+    print("\n✅ ALL PASSED")